@@ -5,13 +5,21 @@ Reads submissions from Google Sheets.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-import io
-import requests
+import atexit
+import dataclasses
+import json
+import re
+import threading
+import time
 from datetime import datetime
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from anthropic import Anthropic
 from grading_logic import grade_submission, determine_overall_grade
-from document_generator import create_grading_document
+from sheet_reader import read_sheet_csv
 
 # Page config
 st.set_page_config(
@@ -24,20 +32,38 @@ st.set_page_config(
 api_key = st.secrets.get("ANTHROPIC_API_KEY", "")
 
 
-def translate_feedback(results: dict, target_language: str) -> dict:
-    """Translate all feedback in results to the target language."""
-    if not api_key:
-        return results
+@st.cache_resource
+def get_anthropic_client() -> Anthropic:
+    """Shared Anthropic client, so its HTTP connection pool survives across reruns."""
+    return Anthropic(api_key=api_key)
+
+
+@st.cache_resource
+def get_background_executor() -> ThreadPoolExecutor:
+    """
+    Shared worker pool for work that can overlap with rendering or other requests,
+    like building the Word document and parallel translations.
+
+    Created once per server process, so threads are not restarted on every click.
+    """
+    executor = ThreadPoolExecutor(max_workers=4)
+    atexit.register(executor.shutdown, wait=False)
+    return executor
+
+
+def _run_with_ctx(ctx, fn, *args):
+    # Attach the submitting session's script context so st.cache_data etc. work in the worker
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return fn(*args)
 
-    # Build the text to translate
-    feedback_texts = []
-    for q_id, result in results.items():
-        feedback_texts.append(f"[{q_id}]: {result.feedback}")
 
-    combined_text = "\n".join(feedback_texts)
+def submit_in_background(fn, *args):
+    """Run fn(*args) on the background executor and return its Future."""
+    return get_background_executor().submit(_run_with_ctx, get_script_run_ctx(), fn, *args)
 
-    if target_language == "French":
-        language_instruction = """You are translating dog training assessment feedback from English to French.
+
+# Translation instructions, kept as constants so the cached prompt prefix is identical on every request
+LANG_INSTRUCTION_FR = """You are translating dog training assessment feedback from English to French.
 
 FRENCH DICTIONARY - Use these specific terms:
 - Behavior consultant = consultant(e) en comportement canin
@@ -53,12 +79,12 @@ TRANSLATION RULES:
 3. Use modern, natural French - avoid antiquated expressions
 4. Maintain the warm, professional tone
 5. Keep the educational context of dog training
-6. Preserve the [q1], [q2], etc. markers exactly as-is
+6. Keep the "q1", "q2", etc. keys exactly as-is
 
-Translate each feedback line, keeping the [qX]: format:"""
+The feedback is given as a JSON object mapping question IDs to feedback text.
+Return ONLY a JSON object with the same keys and the translated feedback as values:"""
 
-    elif target_language == "Dutch":
-        language_instruction = """You are translating dog training assessment feedback from English to Dutch.
+LANG_INSTRUCTION_NL = """You are translating dog training assessment feedback from English to Dutch.
 
 DUTCH TRANSLATION RULES:
 1. Keep these English expressions as-is: "Door is a Bore", "DIAB", "Car is a Bore", "CIAB", "Key is a Bore", "KIAB", "FOMO", "push-drop"
@@ -71,52 +97,127 @@ DUTCH TRANSLATION RULES:
 8. Use modern Dutch - avoid stiff or formal phrasing
 9. "Separation anxiety" = "verlatingsangst" or "scheidingsangst"
 10. "Target duration" = "doelduur"
-11. Preserve the [q1], [q2], etc. markers exactly as-is
+11. Keep the "q1", "q2", etc. keys exactly as-is
 
-Translate each feedback line, keeping the [qX]: format:"""
-    else:
+The feedback is given as a JSON object mapping question IDs to feedback text.
+Return ONLY a JSON object with the same keys and the translated feedback as values:"""
+
+LANGUAGE_INSTRUCTIONS = {
+    "French": LANG_INSTRUCTION_FR,
+    "Dutch": LANG_INSTRUCTION_NL,
+}
+
+
+# One "qX": "..." pair of a translation reply, used when the reply is not valid JSON
+_FEEDBACK_RE = re.compile(r'"(q\d+b?)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def parse_translation(translated_text: str) -> dict:
+    """
+    Parse Claude's translation reply into a {q_id: feedback} dict.
+
+    Tolerates a code fence or stray text around the JSON object. If the JSON is
+    malformed (e.g. the reply was cut off at max_tokens), the complete pairs are
+    recovered in a single regex pass instead of losing the whole translation.
+    """
+    start = translated_text.find('{')
+    end = translated_text.rfind('}')
+    try:
+        parsed = json.loads(translated_text[start:end + 1])
+    except ValueError:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed
+    # Malformed JSON, or a list/string instead of an object - recover whatever pairs are there
+    return {m.group(1): json.loads(f'"{m.group(2)}"') for m in _FEEDBACK_RE.finditer(translated_text)}
+
+
+def translate_feedback(results: dict, target_language: str, placeholder=None) -> dict:
+    """
+    Translate all feedback in results to the target language.
+
+    If a placeholder (st.empty()) is given, the response is streamed into it
+    as it arrives so the reviewer sees progress before the full reply is done.
+    """
+    if not api_key:
+        return results
+
+    # Nothing to translate - skip the API call entirely
+    if not any(result.feedback.strip() for result in results.values()):
+        return results
+
+    # Build the text to translate as a JSON object keyed by question ID
+    combined_text = json.dumps(
+        {q_id: result.feedback for q_id, result in results.items()},
+        ensure_ascii=False,
+        indent=2
+    )
+
+    language_instruction = LANGUAGE_INSTRUCTIONS.get(target_language)
+    if language_instruction is None:
         return results
 
     try:
-        client = Anthropic(api_key=api_key)
-        message = client.messages.create(
+        client = get_anthropic_client()
+        translated_text = ""
+        with client.messages.stream(
             model="claude-sonnet-4-20250514",
             max_tokens=4000,
             messages=[
                 {
                     "role": "user",
-                    "content": f"{language_instruction}\n\n{combined_text}"
+                    "content": [
+                        # Instructions are identical across requests, so mark them for prompt caching
+                        {"type": "text", "text": language_instruction, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": combined_text}
+                    ]
                 }
             ]
-        )
-
-        translated_text = message.content[0].text
-
-        # Parse the translated text back into results
-        import re
-        from grading_logic import GradeResult
-
-        translated_results = {}
-        for q_id, result in results.items():
-            # Find the translated feedback for this question
-            pattern = rf'\[{q_id}\]:\s*(.+?)(?=\n\[q|$)'
-            match = re.search(pattern, translated_text, re.DOTALL)
-            if match:
-                translated_feedback = match.group(1).strip()
-                translated_results[q_id] = GradeResult(
-                    is_correct=result.is_correct,
-                    feedback=translated_feedback,
-                    calculation=result.calculation
-                )
-            else:
-                translated_results[q_id] = result
-
-        return translated_results
+        ) as stream:
+            last_render = 0.0
+            for text in stream.text_stream:
+                translated_text += text
+                # Re-rendering sends the whole buffer, so only refresh on a new line or every 100 ms
+                if placeholder is not None and ('\n' in text or time.monotonic() - last_render >= 0.1):
+                    placeholder.code(translated_text, language="json")
+                    last_render = time.monotonic()
+        if placeholder is not None:
+            placeholder.code(translated_text, language="json")
+
+        parsed = parse_translation(translated_text)
+
+        # Only the feedback changes; confidence and calculation carry over
+        return {
+            q_id: dataclasses.replace(result, feedback=parsed.get(q_id, result.feedback))
+            for q_id, result in results.items()
+        }
     except Exception as e:
         st.error(f"Translation error: {e}")
         return results
 
 
+def translate_feedback_all(results: dict) -> dict:
+    """
+    Translate results to every supported language in parallel.
+
+    Returns {language: translated_results} for the languages that were
+    translated; a language whose translation failed is left out so it can be
+    retried. The requests run concurrently, so both translations take about as
+    long as the slower one.
+    """
+    futures = {
+        language: submit_in_background(translate_feedback, results, language)
+        for language in LANGUAGE_INSTRUCTIONS
+    }
+    translations = {}
+    for language, future in futures.items():
+        translated_results = future.result()
+        # translate_feedback hands back results itself when the translation failed
+        if translated_results is not results:
+            translations[language] = translated_results
+    return translations
+
+
 # Default Google Sheet URL
 DEFAULT_SHEET_URL = "https://docs.google.com/spreadsheets/d/1HOY8Mzsv2pT9XQX8EwRri3L3EEKNU_cVR9PKRaYwWX0/edit?usp=sharing"
 
@@ -124,7 +225,7 @@ DEFAULT_SHEET_URL = "https://docs.google.com/spreadsheets/d/1HOY8Mzsv2pT9XQX8EwR
 # These are the column indices in the spreadsheet (0-indexed)
 
 # English form: 50 columns, has "Assessed by" in col 5, and "Correct or incorrect?" columns after Maisie questions
-COLUMN_MAPPING_ENGLISH = {
+COLUMN_MAPPING_ENGLISH = MappingProxyType({
     'submission_date': 0,
     'first_name': 1,
     'last_name': 2,
@@ -149,11 +250,11 @@ COLUMN_MAPPING_ENGLISH = {
     'q15b': 44, # QUESTION 15B: Bella warmups 3
     'q16': 46,  # QUESTION 16: Bella car
     'q17': 47,  # QUESTION 17: DIAB warmups
-}
+})
 
 # French form: 47 columns
 # Verified from actual CSV export - column positions differ from English
-COLUMN_MAPPING_FRENCH = {
+COLUMN_MAPPING_FRENCH = MappingProxyType({
     'submission_date': 0,
     'first_name': 1,
     'last_name': 2,
@@ -178,39 +279,89 @@ COLUMN_MAPPING_FRENCH = {
     'q15b': 41, # QUESTION 15B: Bella warmups 3
     'q16': 43,  # QUESTION 16: Bella car
     'q17': 44,  # QUESTION 17: DIAB warmups
-}
+})
+
+# Question labels shown in the app
+QUESTION_LABELS = MappingProxyType({
+    'q1': "Q1: Maisie Plan 1 Target Duration",
+    'q2': "Q2: Maisie Plan 2 Target Duration",
+    'q3': "Q3: Maisie Plan 3 Target Duration",
+    'q4': "Q4: Maisie After Struggle",
+    'q5': "Q5: Minna Plan 1 Target Duration",
+    'q6': "Q6: Minna Plan 2 Target Duration",
+    'q7': "Q7: Minna Plan 3 Target Duration",
+    'q8': "Q8: Minna Target Duration Increase",
+    'q9': "Q9: Oliver Plan 1 Target Duration",
+    'q10': "Q10: Oliver Plan 2 Target Duration",
+    'q11': "Q11: Oliver Plan 3 Target Duration",
+    'q12': "Q12: Oliver Keys Testing",
+    'q13': "Q13: Bella Plan 1 Target Duration",
+    'q13b': "Q13B: Bella Plan 1 Warmups",
+    'q14': "Q14: Bella Plan 2 Target Duration",
+    'q14b': "Q14B: Bella Plan 2 Warmups",
+    'q15': "Q15: Bella Plan 3 Target Duration",
+    'q15b': "Q15B: Bella Plan 3 Warmups",
+    'q16': "Q16: Bella Car Protocol",
+    'q17': "Q17: DIAB Warmups"
+})
+
+# Questions grouped by dog
+DOGS = (
+    ("🐕 Maisie", ('q1', 'q2', 'q3', 'q4')),
+    ("🐕 Minna", ('q5', 'q6', 'q7', 'q8')),
+    ("🐕 Oliver", ('q9', 'q10', 'q11', 'q12')),
+    ("🐕 Bella", ('q13', 'q13b', 'q14', 'q14b', 'q15', 'q15b', 'q16')),
+    ("📋 DIAB", ('q17',))
+)
+
+# Sheet ID follows /d/ in the URL; gid (tab ID) can be after ? or #
+_SHEET_ID_RE = re.compile(r'/d/([^/?#]+)')
+_GID_RE = re.compile(r'gid=(\d+)')
 
 # Default to English mapping (will be auto-detected)
 COLUMN_MAPPING = COLUMN_MAPPING_ENGLISH
 
+# Question IDs in form order
+QUESTION_IDS = ('q1', 'q2', 'q3', 'q4', 'q5', 'q6', 'q7', 'q8', 'q9', 'q10', 'q11', 'q12',
+                'q13', 'q13b', 'q14', 'q14b', 'q15', 'q15b', 'q16', 'q17')
+
+# Sheet column index of each question in QUESTION_IDS order, per form language
+ANSWER_COL_IDX = MappingProxyType({
+    "English": np.fromiter((COLUMN_MAPPING_ENGLISH[q_id] for q_id in QUESTION_IDS), dtype=np.int32),
+    "French": np.fromiter((COLUMN_MAPPING_FRENCH[q_id] for q_id in QUESTION_IDS), dtype=np.int32),
+})
+
 
+# Detection only looks at the header count and the first few headers, so hash just those
+@st.cache_data(show_spinner=False, hash_funcs={
+    pd.DataFrame: lambda d: (len(d.columns), tuple(str(c) for c in d.columns[:7]))
+})
 def detect_form_language(df: pd.DataFrame) -> str:
     """
     Detect if the spreadsheet is English or French based on column structure.
     French form has empty col 5 header or "Skip to end?" in col 6.
     English form has "Assessed by" in col 5.
     """
-    columns = df.columns.tolist()
+    columns = df.columns
 
     # Check number of columns
     if len(columns) <= 47:
         return "French"
 
-    # Check for "Assessed by" in column 5 (English) or empty/Skip to end (French)
-    if len(columns) > 5:
-        col5_header = str(columns[4]).strip().lower() if pd.notna(columns[4]) else ""
-        col6_header = str(columns[5]).strip().lower() if len(columns) > 6 and pd.notna(columns[5]) else ""
+    # Lowercase the first few headers once; only columns 5 and 6 are inspected
+    headers = [str(c).strip().lower() if pd.notna(c) else "" for c in columns[:7]]
 
-        if "assessed" in col5_header:
-            return "English"
-        if col5_header == "" or "skip" in col6_header:
-            return "French"
+    # Check for "Assessed by" in column 5 (English) or empty/Skip to end (French)
+    if "assessed" in headers[4]:
+        return "English"
+    if not headers[4] or "skip" in headers[5]:
+        return "French"
 
     # Default to English if can't determine
     return "English"
 
 
-def get_column_mapping(form_language: str) -> dict:
+def get_column_mapping(form_language: str) -> MappingProxyType:
     """Get the appropriate column mapping for the form language."""
     if form_language == "French":
         return COLUMN_MAPPING_FRENCH
@@ -219,63 +370,159 @@ def get_column_mapping(form_language: str) -> dict:
 
 def extract_sheet_id(url: str) -> str:
     """Extract the Google Sheet ID from various URL formats."""
-    if '/d/' in url:
-        start = url.find('/d/') + 3
-        end = url.find('/', start)
-        if end == -1:
-            end = url.find('?', start)
-        if end == -1:
-            end = url.find('#', start)
-        if end == -1:
-            end = len(url)
-        return url[start:end]
-    return url
+    match = _SHEET_ID_RE.search(url)
+    return match.group(1) if match else url
 
 
 def extract_gid(url: str) -> str:
     """Extract the gid (sheet tab ID) from URL if present."""
-    import re
     # Look for gid= in URL (can be after ? or #)
-    match = re.search(r'gid=(\d+)', url)
-    if match:
-        return match.group(1)
-    return None
+    match = _GID_RE.search(url)
+    return match.group(1) if match else None
 
 
-def load_sheet_data(sheet_url: str) -> pd.DataFrame:
-    """Load data from a Google Sheet, handling specific tabs via gid."""
-    sheet_id = extract_sheet_id(sheet_url)
-    gid = extract_gid(sheet_url)
+@st.cache_resource
+def get_http_session() -> "requests.Session":
+    """
+    Shared HTTP session for the Sheets export.
+
+    Keeps the TLS connection alive between loads, asks for a gzip-compressed
+    export, and retries the transient 429/5xx errors Google returns for CSV
+    export under load.
+    """
+    # Imported here so sessions that never load a sheet skip the import
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    ))
+    return session
+
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_sheet(sheet_id: str, gid: str) -> pd.DataFrame:
+    """
+    Download and parse the CSV export for a sheet tab. Cached so repeat loads skip the network.
+
+    The CSV is parsed straight from the response stream, so the body is never
+    held in memory as a separate bytes/str copy next to the DataFrame.
+    """
     # Build export URL - include gid if present to load specific tab
     if gid:
         csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
     else:
         csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
 
-    try:
-        response = requests.get(csv_url, timeout=30)
+    with get_http_session().get(csv_url, timeout=(5, 30), stream=True) as response:
         response.raise_for_status()
-        df = pd.read_csv(io.StringIO(response.text))
-        return df
+        # Let urllib3 undo any gzip transfer encoding while pandas reads
+        response.raw.decode_content = True
+        return read_sheet_csv(response.raw)
+
+
+def load_sheet_data(sheet_url: str) -> pd.DataFrame:
+    """Load data from a Google Sheet, handling specific tabs via gid."""
+    sheet_id = extract_sheet_id(sheet_url)
+    gid = extract_gid(sheet_url)
+
+    try:
+        return _fetch_sheet(sheet_id, gid)
     except Exception as e:
         st.error(f"Error loading sheet: {e}")
         return None
 
 
-def get_student_answers(row, df, column_mapping: dict) -> dict:
-    """Extract answers from a DataFrame row using column indices."""
-    answers = {}
-    columns = df.columns.tolist()
+def build_answers_matrix(df: pd.DataFrame, form_language: str) -> tuple:
+    """
+    Extract every student's answers in one vectorized pass.
+
+    Returns (answer_ids, matrix) where matrix[row_idx] holds the answers for
+    answer_ids as strings, with blank cells as "". Questions whose column is
+    missing from the sheet are left out.
+    """
+    col_idx = ANSWER_COL_IDX.get(form_language, ANSWER_COL_IDX["English"])
+    in_range = col_idx < len(df.columns)
+    answer_ids = [q_id for q_id, present in zip(QUESTION_IDS, in_range) if present]
+    answer_cols = df.iloc[:, col_idx[in_range]]
+    # Cast to the string dtype first so blanks stay NA and can be filled in one pass
+    matrix = answer_cols.astype("string").fillna("").to_numpy(dtype=object)
+    return answer_ids, matrix
+
+
+def build_student_list(df: pd.DataFrame, column_mapping: MappingProxyType) -> list:
+    """Build (row_idx, display_name) pairs for every row that has a first and last name."""
+    first_names = df.iloc[:, column_mapping['first_name']]
+    last_names = df.iloc[:, column_mapping['last_name']]
+    sub_dates = df.iloc[:, column_mapping['submission_date']]
+    has_name = (first_names.notna() & last_names.notna()).to_numpy()
+
+    # Build every display name as one Series expression instead of per-row f-strings
+    date_suffix = np.where(sub_dates.notna(), " (" + sub_dates.astype(str) + ")", "")
+    display_names = first_names.astype(str) + " " + last_names.astype(str) + date_suffix
+
+    return list(zip(
+        np.flatnonzero(has_name).tolist(),
+        display_names.to_numpy(dtype=object)[has_name].tolist()
+    ))
+
+
+@st.cache_data(show_spinner=False)
+def _grade(student_name: str, frozen_answers: tuple) -> tuple:
+    """
+    Grade a submission, memoized on the student and their answers.
+
+    Returns (results, overall_grade, resubmit_questions). frozen_answers is the
+    answers dict as sorted item tuples so it can be hashed.
+    """
+    # Pass API key for LLM-based duration normalization
+    results = grade_submission(dict(frozen_answers), api_key=api_key)
+    overall_grade, resubmit_questions = determine_overall_grade(results)
+    return results, overall_grade, resubmit_questions
+
+
+@st.cache_data(show_spinner=False)
+def build_document_bytes(
+    student_name: str,
+    submission_date: str,
+    reviewer_name: str,
+    answers_items: tuple,
+    results_items: tuple,
+    overall_grade: str,
+    resubmit_questions: tuple
+) -> bytes:
+    """
+    Build the feedback .docx, memoized on its inputs.
+
+    Streamlit reruns the whole script on every widget change, so without this the
+    document would be rebuilt each time. Dict inputs are passed as sorted item tuples.
+    """
+    # python-docx pulls in lxml, so only import it once a document is needed
+    from document_generator import create_grading_document
+
+    return create_grading_document(
+        student_name=student_name,
+        submission_date=submission_date,
+        reviewer_name=reviewer_name,
+        answers=dict(answers_items),
+        results=dict(results_items),
+        overall_grade=overall_grade,
+        resubmit_questions=list(resubmit_questions)
+    )
 
-    for q_id, col_idx in column_mapping.items():
-        if q_id in ['submission_date', 'first_name', 'last_name', 'email']:
-            continue
-        if col_idx < len(columns):
-            value = row.iloc[col_idx]
-            answers[q_id] = str(value) if pd.notna(value) else ""
 
-    return answers
+def get_student_answers(row_idx: int, answer_ids: list, answers_matrix) -> dict:
+    """Look up one student's answers from the precomputed answers matrix."""
+    return dict(zip(answer_ids, answers_matrix[row_idx]))
 
 
 # Title
@@ -307,8 +554,19 @@ sheet_url = st.text_input(
     help="Paste the URL of your Google Sheet. It must be shared with 'Anyone with the link can view'."
 )
 
-# Load button
-if st.button("📥 Load Submissions", type="primary"):
+# Load buttons - "Force refresh" drops the cached copy so new responses show up immediately
+col_load, col_refresh = st.columns([1, 1])
+with col_load:
+    load_clicked = st.button("📥 Load Submissions", type="primary")
+with col_refresh:
+    refresh_clicked = st.button("🔃 Force refresh")
+
+if refresh_clicked:
+    _fetch_sheet.clear()
+
+if load_clicked or refresh_clicked:
+    # Grades are only reused within one load of the sheet
+    _grade.clear()
     with st.spinner("Loading submissions from Google Sheets..."):
         df = load_sheet_data(sheet_url)
         if df is not None:
@@ -318,6 +576,9 @@ if st.button("📥 Load Submissions", type="primary"):
             st.session_state['sheet_loaded'] = True
             st.session_state['form_language'] = form_language
             st.session_state['column_mapping'] = get_column_mapping(form_language)
+            st.session_state['answers_matrix'] = build_answers_matrix(df, form_language)
+            # Built once per load; reruns reuse it from session state
+            st.session_state['student_list'] = build_student_list(df, st.session_state['column_mapping'])
             st.success(f"Loaded {len(df)} submissions! (Detected: {form_language} form)")
 
 # If data is loaded, show student selector
@@ -332,19 +593,8 @@ if st.session_state.get('sheet_loaded', False) and 'sheet_data' in st.session_st
     st.markdown("---")
     st.header("👤 Select Student")
 
-    # Create student list with name and submission date
-    columns = df.columns.tolist()
-    students = []
-    for idx, row in df.iterrows():
-        first_name = row.iloc[column_mapping['first_name']] if column_mapping['first_name'] < len(columns) else ""
-        last_name = row.iloc[column_mapping['last_name']] if column_mapping['last_name'] < len(columns) else ""
-        sub_date = row.iloc[column_mapping['submission_date']] if column_mapping['submission_date'] < len(columns) else ""
-
-        if pd.notna(first_name) and pd.notna(last_name):
-            display_name = f"{first_name} {last_name}"
-            if pd.notna(sub_date):
-                display_name += f" ({sub_date})"
-            students.append((idx, display_name))
+    # Student list (name and submission date) was built when the sheet loaded
+    students = st.session_state['student_list']
 
     if students:
         student_options = [s[1] for s in students]
@@ -363,60 +613,26 @@ if st.session_state.get('sheet_loaded', False) and 'sheet_data' in st.session_st
             submission_date = str(selected_row.iloc[column_mapping['submission_date']])
 
             # Get answers
-            answers = get_student_answers(selected_row, df, column_mapping)
+            answer_ids, answers_matrix = st.session_state['answers_matrix']
+            answers = get_student_answers(row_idx, answer_ids, answers_matrix)
 
             # Display answers for review
             st.markdown("---")
             st.header(f"📝 {student_name}'s Answers")
 
-            # Question labels
-            question_labels = {
-                'q1': "Q1: Maisie Plan 1 Target Duration",
-                'q2': "Q2: Maisie Plan 2 Target Duration",
-                'q3': "Q3: Maisie Plan 3 Target Duration",
-                'q4': "Q4: Maisie After Struggle",
-                'q5': "Q5: Minna Plan 1 Target Duration",
-                'q6': "Q6: Minna Plan 2 Target Duration",
-                'q7': "Q7: Minna Plan 3 Target Duration",
-                'q8': "Q8: Minna Target Duration Increase",
-                'q9': "Q9: Oliver Plan 1 Target Duration",
-                'q10': "Q10: Oliver Plan 2 Target Duration",
-                'q11': "Q11: Oliver Plan 3 Target Duration",
-                'q12': "Q12: Oliver Keys Testing",
-                'q13': "Q13: Bella Plan 1 Target Duration",
-                'q13b': "Q13B: Bella Plan 1 Warmups",
-                'q14': "Q14: Bella Plan 2 Target Duration",
-                'q14b': "Q14B: Bella Plan 2 Warmups",
-                'q15': "Q15: Bella Plan 3 Target Duration",
-                'q15b': "Q15B: Bella Plan 3 Warmups",
-                'q16': "Q16: Bella Car Protocol",
-                'q17': "Q17: DIAB Warmups"
-            }
-
-            # Group by dog
-            dogs = [
-                ("🐕 Maisie", ['q1', 'q2', 'q3', 'q4']),
-                ("🐕 Minna", ['q5', 'q6', 'q7', 'q8']),
-                ("🐕 Oliver", ['q9', 'q10', 'q11', 'q12']),
-                ("🐕 Bella", ['q13', 'q13b', 'q14', 'q14b', 'q15', 'q15b', 'q16']),
-                ("📋 DIAB", ['q17'])
-            ]
-
-            for dog_name, q_ids in dogs:
+            for dog_name, q_ids in DOGS:
                 with st.expander(dog_name, expanded=False):
                     for q_id in q_ids:
                         answer = answers.get(q_id, "")
-                        st.markdown(f"**{question_labels.get(q_id, q_id)}**")
+                        st.markdown(f"**{QUESTION_LABELS.get(q_id, q_id)}**")
                         st.text(answer if answer else "(no answer)")
                         st.markdown("---")
 
             # Grade button
             st.markdown("---")
             if st.button("📝 Grade Submission", type="primary", use_container_width=True):
-                # Grade (pass API key for LLM-based duration normalization)
                 with st.spinner("Grading submission..."):
-                    results = grade_submission(answers, api_key=api_key)
-                    overall_grade, resubmit_questions = determine_overall_grade(results)
+                    results, overall_grade, resubmit_questions = _grade(student_name, tuple(sorted(answers.items())))
 
                 # Store results in session state
                 st.session_state['grading_results'] = results
@@ -425,13 +641,33 @@ if st.session_state.get('sheet_loaded', False) and 'sheet_data' in st.session_st
                 st.session_state['graded_student'] = student_name
                 st.session_state['graded_date'] = submission_date
                 st.session_state['graded_answers'] = answers
+                st.session_state.pop('translations', None)
+                st.session_state.pop('translated_language', None)
 
             # Display results if available
             if st.session_state.get('graded_student') == student_name and 'grading_results' in st.session_state:
                 results = st.session_state['grading_results']
+                # After "Translate to both", the language selector switches between stored translations
+                translations = st.session_state.get('translations', {})
+                results = translations.get(st.session_state.get('pba_lang'), results)
                 overall_grade = st.session_state['overall_grade']
                 resubmit_questions = st.session_state['resubmit_questions']
 
+                # Start building the Word document now so it is ready by the time the results have rendered
+                doc_args = (
+                    student_name,
+                    submission_date,
+                    reviewer_name,
+                    tuple(sorted(answers.items())),
+                    tuple(sorted(results.items())),
+                    overall_grade,
+                    tuple(resubmit_questions)
+                )
+                doc_key, doc_future = st.session_state.get('doc_future', (None, None))
+                if doc_key != doc_args:
+                    doc_future = submit_in_background(build_document_bytes, *doc_args)
+                    st.session_state['doc_future'] = (doc_args, doc_future)
+
                 st.markdown("---")
                 st.header("📊 Results")
 
@@ -449,7 +685,7 @@ if st.session_state.get('sheet_loaded', False) and 'sheet_data' in st.session_st
                 # Show detailed results
                 st.subheader("Detailed Feedback")
 
-                for dog_name, q_ids in dogs:
+                for dog_name, q_ids in DOGS:
                     with st.expander(dog_name, expanded=True):
                         for q_id in q_ids:
                             if q_id not in results:
@@ -460,7 +696,7 @@ if st.session_state.get('sheet_loaded', False) and 'sheet_data' in st.session_st
                             status = "✅" if result.is_correct else "❌"
                             # Add review flag if confidence is low
                             review_flag = " ⚠️" if getattr(result, 'confidence', 'high') == "review" else ""
-                            st.markdown(f"**{question_labels.get(q_id, q_id)}** {status}{review_flag}")
+                            st.markdown(f"**{QUESTION_LABELS.get(q_id, q_id)}** {status}{review_flag}")
                             if review_flag:
                                 st.caption("*Borderline answer - please double-check*")
                             st.markdown(f"*Answer:* {answer if answer else '(no answer)'}")
@@ -476,19 +712,40 @@ if st.session_state.get('sheet_loaded', False) and 'sheet_data' in st.session_st
                 st.subheader("🌍 Translate Feedback")
                 st.markdown("*Translate all feedback to French or Dutch:*")
 
-                col_lang, col_btn = st.columns([1, 2])
+                col_lang, col_btn, col_both = st.columns([1, 2, 2])
                 with col_lang:
                     target_language = st.selectbox("Language", ["French", "Dutch"], key="pba_lang", label_visibility="collapsed")
                 with col_btn:
                     translate_clicked = st.button(f"🔄 Translate to {target_language}", use_container_width=True)
+                with col_both:
+                    translate_both_clicked = st.button("🔄 Translate to both", use_container_width=True)
+
+                if translate_both_clicked:
+                    if not api_key:
+                        st.error("API key not configured. Please add ANTHROPIC_API_KEY to secrets.")
+                    else:
+                        with st.spinner("Translating feedback to French and Dutch..."):
+                            st.session_state['translations'] = translate_feedback_all(st.session_state['grading_results'])
+                        st.rerun()
 
                 if translate_clicked:
                     if not api_key:
                         st.error("API key not configured. Please add ANTHROPIC_API_KEY to secrets.")
+                    elif (st.session_state.get('translated_language') == target_language
+                          or target_language in st.session_state.get('translations', {})):
+                        # Already translated to this language (alone or via "Translate to both",
+                        # which only keeps successful translations) - clicking again is a no-op
+                        st.info(f"Feedback is already in {target_language}.")
                     else:
                         with st.spinner(f"Translating feedback to {target_language}..."):
-                            translated_results = translate_feedback(results, target_language)
+                            stream_placeholder = st.empty()
+                            translated_results = translate_feedback(results, target_language, stream_placeholder)
+                            stream_placeholder.empty()
                             st.session_state['grading_results'] = translated_results
+                            st.session_state.pop('translations', None)
+                            # translate_feedback hands back the same dict when nothing was translated
+                            if translated_results is not results:
+                                st.session_state['translated_language'] = target_language
                             # Also update resubmit questions if needed
                             overall_grade, resubmit_questions = determine_overall_grade(translated_results)
                             st.session_state['resubmit_questions'] = resubmit_questions
@@ -498,20 +755,12 @@ if st.session_state.get('sheet_loaded', False) and 'sheet_data' in st.session_st
                 # Generate document
                 st.subheader("📄 Download Feedback Document")
 
-                doc_buffer = create_grading_document(
-                    student_name=student_name,
-                    submission_date=submission_date,
-                    reviewer_name=reviewer_name,
-                    answers=answers,
-                    results=results,
-                    overall_grade=overall_grade,
-                    resubmit_questions=resubmit_questions
-                )
+                doc_bytes = doc_future.result()
 
                 # Download button
                 st.download_button(
                     label="📥 Download Word Document",
-                    data=doc_buffer,
+                    data=doc_bytes,
                     file_name=f"PBA_Submission_{student_name.replace(' ', '_')}.docx",
                     mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                     use_container_width=True
@@ -25,6 +25,107 @@ FONT_NAME = 'Lato'
 TITLE_SIZE = Pt(18)
 BODY_SIZE = Pt(11)
 
+# Questions that test percentage increases / initial target durations
+INCREASE_QUESTIONS = frozenset({'q2', 'q3', 'q6', 'q7', 'q10', 'q14', 'q15'})
+INITIAL_TD_QUESTIONS = frozenset({'q1', 'q9', 'q13'})
+
+# Shared stand-ins for questions missing from results
+_MISSING_INCORRECT = GradeResult(False, '')
+_MISSING_CORRECT = GradeResult(True, '')
+
+# Question definitions, in the order they appear in the document
+QUESTION_INFO = {
+    'q1': ("Question 1 - Maisie's Plan 1 Target Duration", "Maisie"),
+    'q2': ("Question 2 - Maisie's Plan 2 Target Duration", "Maisie"),
+    'q3': ("Question 3 - Maisie's Plan 3 Target Duration", "Maisie"),
+    'q4': ("Question 4 - Maisie After Struggle", "Maisie"),
+    'q5': ("Question 5 - Minna's Plan 1 Target Duration", "Minna"),
+    'q6': ("Question 6 - Minna's Plan 2 Target Duration", "Minna"),
+    'q7': ("Question 7 - Minna's Plan 3 Target Duration", "Minna"),
+    'q8': ("Question 8 - Minna Target Duration Increase", "Minna"),
+    'q9': ("Question 9 - Oliver's Plan 1 Target Duration", "Oliver"),
+    'q10': ("Question 10 - Oliver's Plan 2 Target Duration", "Oliver"),
+    'q11': ("Question 11 - Oliver's Plan 3 Target Duration", "Oliver"),
+    'q12': ("Question 12 - Oliver Keys Testing", "Oliver"),
+    'q13': ("Question 13 - Bella's Plan 1 Target Duration", "Bella"),
+    'q13b': ("Question 13B - Bella's Plan 1 Warmups", "Bella"),
+    'q14': ("Question 14 - Bella's Plan 2 Target Duration", "Bella"),
+    'q14b': ("Question 14B - Bella's Plan 2 Warmups", "Bella"),
+    'q15': ("Question 15 - Bella's Plan 3 Target Duration", "Bella"),
+    'q15b': ("Question 15B - Bella's Plan 3 Warmups", "Bella"),
+    'q16': ("Question 16 - Bella Car Protocol", "Bella"),
+    'q17': ("Question 17 - DIAB Warmups", "DIAB"),
+}
+
+
+def add_run(para, text: str, *, bold: bool = False, italic: bool = False, color: RGBColor = None, size=None):
+    """
+    Add a run to para, only writing the formatting that differs from the paragraph style.
+
+    Font name, size and color come from the paragraph style, so each run skips
+    the extra rPr elements python-docx would otherwise emit.
+    """
+    run = para.add_run(text)
+    if bold:
+        run.bold = True
+    if italic:
+        run.italic = True
+    if color is not None:
+        run.font.color.rgb = color
+    if size is not None:
+        run.font.size = size
+    return run
+
+
+def question_sections(q_title: str, answer: str, result: GradeResult):
+    """
+    Yield the paragraphs for one question as (purple, label, text, run formatting).
+
+    purple selects the PurpleBody paragraph style over Normal; label is an
+    optional bold prefix on the same line.
+    """
+    # Question header - Purple like Amanda's
+    yield True, None, q_title, {'bold': True}
+    # Student's answer
+    yield True, "Your answer: ", str(answer) if answer else "(no answer)", {}
+    # Grade - on its own line, colored
+    if result.is_correct:
+        yield False, None, "CORRECT", {'bold': True, 'color': GREEN}
+    else:
+        yield False, None, "INCORRECT", {'bold': True, 'color': RED}
+    # Calculation if present (italicized)
+    if result.calculation:
+        yield True, None, result.calculation, {'italic': True}
+    # Feedback
+    yield True, None, result.feedback, {}
+
+
+def _build_template() -> bytes:
+    """Build the constant part of every document once: styles and the title line."""
+    doc = Document()
+
+    # Set up default style
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = FONT_NAME
+    font.size = BODY_SIZE
+
+    # Body text in Amanda's purple - set once on a style instead of on every run
+    purple_body = doc.styles.add_style('PurpleBody', WD_STYLE_TYPE.PARAGRAPH)
+    purple_body.base_style = style
+    purple_body.font.color.rgb = PURPLE
+
+    # Title - "Certified SA Pro Plan Building Assignment" on one line
+    title_para = doc.add_paragraph(style=purple_body)
+    add_run(title_para, "Certified SA Pro Plan Building Assignment ", bold=True, size=TITLE_SIZE)
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+_TEMPLATE = _build_template()
+
 
 def create_grading_document(
     student_name: str,
@@ -34,175 +135,78 @@ def create_grading_document(
     results: Dict[str, GradeResult],
     overall_grade: str,
     resubmit_questions: List[Tuple[str, str]]
-) -> BytesIO:
+) -> bytes:
     """
     Create a Word document with the grading feedback.
 
     Returns:
-        BytesIO object containing the document
+        The .docx file contents as bytes
     """
-    doc = Document()
-
-    # Set up default style
-    style = doc.styles['Normal']
-    font = style.font
-    font.name = FONT_NAME
-    font.size = BODY_SIZE
-
-    # Title - "Certified SA Pro Plan Building Assignment" on one line
-    title_para = doc.add_paragraph()
-    title_run = title_para.add_run("Certified SA Pro Plan Building Assignment ")
-    title_run.bold = True
-    title_run.font.name = FONT_NAME
-    title_run.font.size = TITLE_SIZE
-    title_run.font.color.rgb = PURPLE
+    # Start from a copy of the pre-built template (styles and title already in place)
+    doc = Document(BytesIO(_TEMPLATE))
+    purple_body = doc.styles['PurpleBody']
 
     # Header info - all on same line style like Amanda's
     header_para = doc.add_paragraph()
 
     # Student Name
-    label_run = header_para.add_run("Student Name: ")
-    label_run.bold = True
-    label_run.font.name = FONT_NAME
-    label_run.font.color.rgb = LABEL_RED
-    value_run = header_para.add_run(f"{student_name} ")
-    value_run.font.name = FONT_NAME
+    add_run(header_para, "Student Name: ", bold=True, color=LABEL_RED)
+    header_para.add_run(f"{student_name} ")
 
     # Submission Date
-    label_run = header_para.add_run("Submission Date: ")
-    label_run.bold = True
-    label_run.font.name = FONT_NAME
-    label_run.font.color.rgb = LABEL_RED
-    value_run = header_para.add_run(f"{submission_date}")
-    value_run.font.name = FONT_NAME
+    add_run(header_para, "Submission Date: ", bold=True, color=LABEL_RED)
+    header_para.add_run(f"{submission_date}")
 
     # Reviewed By and Grade on next line
     header_para2 = doc.add_paragraph()
-    label_run = header_para2.add_run("Reviewed By: ")
-    label_run.bold = True
-    label_run.font.name = FONT_NAME
-    label_run.font.color.rgb = LABEL_RED
-    value_run = header_para2.add_run(f"{reviewer_name} ")
-    value_run.font.name = FONT_NAME
-
-    label_run = header_para2.add_run("Grade: ")
-    label_run.bold = True
-    label_run.font.name = FONT_NAME
-    label_run.font.color.rgb = LABEL_RED
-    grade_run = header_para2.add_run(overall_grade)
-    grade_run.bold = True
-    grade_run.font.name = FONT_NAME
-    grade_run.font.color.rgb = RED if overall_grade == "Resubmit" else GREEN
+    add_run(header_para2, "Reviewed By: ", bold=True, color=LABEL_RED)
+    header_para2.add_run(f"{reviewer_name} ")
 
-    doc.add_paragraph()  # Space
+    add_run(header_para2, "Grade: ", bold=True, color=LABEL_RED)
+    add_run(header_para2, overall_grade, bold=True, color=RED if overall_grade == "Resubmit" else GREEN)
 
-    # Question definitions
-    question_info = {
-        'q1': ("Question 1 - Maisie's Plan 1 Target Duration", "Maisie"),
-        'q2': ("Question 2 - Maisie's Plan 2 Target Duration", "Maisie"),
-        'q3': ("Question 3 - Maisie's Plan 3 Target Duration", "Maisie"),
-        'q4': ("Question 4 - Maisie After Struggle", "Maisie"),
-        'q5': ("Question 5 - Minna's Plan 1 Target Duration", "Minna"),
-        'q6': ("Question 6 - Minna's Plan 2 Target Duration", "Minna"),
-        'q7': ("Question 7 - Minna's Plan 3 Target Duration", "Minna"),
-        'q8': ("Question 8 - Minna Target Duration Increase", "Minna"),
-        'q9': ("Question 9 - Oliver's Plan 1 Target Duration", "Oliver"),
-        'q10': ("Question 10 - Oliver's Plan 2 Target Duration", "Oliver"),
-        'q11': ("Question 11 - Oliver's Plan 3 Target Duration", "Oliver"),
-        'q12': ("Question 12 - Oliver Keys Testing", "Oliver"),
-        'q13': ("Question 13 - Bella's Plan 1 Target Duration", "Bella"),
-        'q13b': ("Question 13B - Bella's Plan 1 Warmups", "Bella"),
-        'q14': ("Question 14 - Bella's Plan 2 Target Duration", "Bella"),
-        'q14b': ("Question 14B - Bella's Plan 2 Warmups", "Bella"),
-        'q15': ("Question 15 - Bella's Plan 3 Target Duration", "Bella"),
-        'q15b': ("Question 15B - Bella's Plan 3 Warmups", "Bella"),
-        'q16': ("Question 16 - Bella Car Protocol", "Bella"),
-        'q17': ("Question 17 - DIAB Warmups", "DIAB"),
-    }
+    doc.add_paragraph()  # Space
 
     # Add each question's grading
-    for q_id in ['q1', 'q2', 'q3', 'q4', 'q5', 'q6', 'q7', 'q8', 'q9', 'q10', 'q11', 'q12',
-                 'q13', 'q13b', 'q14', 'q14b', 'q15', 'q15b', 'q16', 'q17']:
+    for q_id, (q_title, dog) in QUESTION_INFO.items():
 
         if q_id not in results:
             continue
 
-        q_title, dog = question_info.get(q_id, (q_id, ""))
         result = results[q_id]
         answer = answers.get(q_id, "")
 
-        # Add question header - Purple like Amanda's
-        q_para = doc.add_paragraph()
-        q_run = q_para.add_run(q_title)
-        q_run.bold = True
-        q_run.font.name = FONT_NAME
-        q_run.font.color.rgb = PURPLE
-
-        # Add student's answer
-        ans_para = doc.add_paragraph()
-        ans_label = ans_para.add_run("Your answer: ")
-        ans_label.bold = True
-        ans_label.font.name = FONT_NAME
-        ans_label.font.color.rgb = PURPLE
-        ans_value = ans_para.add_run(str(answer) if answer else "(no answer)")
-        ans_value.font.name = FONT_NAME
-        ans_value.font.color.rgb = PURPLE
-
-        # Add grade - on its own line, colored
-        grade_para = doc.add_paragraph()
-        grade_text = "CORRECT" if result.is_correct else "INCORRECT"
-        grade_run = grade_para.add_run(grade_text)
-        grade_run.bold = True
-        grade_run.font.name = FONT_NAME
-        grade_run.font.color.rgb = GREEN if result.is_correct else RED
-
-        # Add calculation if present (italicized)
-        if result.calculation:
-            calc_para = doc.add_paragraph()
-            calc_run = calc_para.add_run(result.calculation)
-            calc_run.italic = True
-            calc_run.font.name = FONT_NAME
-            calc_run.font.color.rgb = PURPLE
-
-        # Add feedback
-        feedback_para = doc.add_paragraph()
-        feedback_run = feedback_para.add_run(result.feedback)
-        feedback_run.font.name = FONT_NAME
-        feedback_run.font.color.rgb = PURPLE
+        for purple, label, text, formatting in question_sections(q_title, answer, result):
+            para = doc.add_paragraph(style=purple_body if purple else None)
+            if label:
+                add_run(para, label, bold=True)
+            add_run(para, text, **formatting)
 
         doc.add_paragraph()  # Space between questions
 
     # Add overall summary
     doc.add_paragraph()
-    summary_heading = doc.add_paragraph()
-    summary_run = summary_heading.add_run(f"{student_name},")
-    summary_run.bold = True
-    summary_run.font.name = FONT_NAME
-    summary_run.font.color.rgb = PURPLE
+    add_run(doc.add_paragraph(style=purple_body), f"{student_name},", bold=True)
 
     # Generate summary based on results
     summary_text = generate_summary(results, overall_grade, student_name)
-    summary_para = doc.add_paragraph()
-    summary_text_run = summary_para.add_run(summary_text)
-    summary_text_run.font.name = FONT_NAME
-    summary_text_run.font.color.rgb = PURPLE
+    doc.add_paragraph(summary_text, style=purple_body)
 
     # If resubmit, add list of questions to redo
     if resubmit_questions:
         doc.add_paragraph()
-        resubmit_para = doc.add_paragraph()
-        resubmit_run = resubmit_para.add_run(
-            "Review the following questions and send your updated responses directly to me via email:"
+        add_run(
+            doc.add_paragraph(),
+            "Review the following questions and send your updated responses directly to me via email:",
+            bold=True
         )
-        resubmit_run.bold = True
 
         for q_id, q_label in resubmit_questions:
             q_num = q_id.replace('q', 'Question ').replace('b', 'B')
             doc.add_paragraph(f"- {q_num}: {q_label}", style='List Bullet')
 
         # Add helpful resources if needed - check for percentage calculation errors
-        has_increase_errors = any(q_id in ['q2', 'q3', 'q6', 'q7', 'q10', 'q14', 'q15']
-                                  for q_id, _ in resubmit_questions)
+        has_increase_errors = not INCREASE_QUESTIONS.isdisjoint(q_id for q_id, _ in resubmit_questions)
         if has_increase_errors:
             doc.add_paragraph()
             doc.add_paragraph(
@@ -221,31 +225,28 @@ def create_grading_document(
     # Save to BytesIO
     doc_buffer = BytesIO()
     doc.save(doc_buffer)
-    doc_buffer.seek(0)
 
-    return doc_buffer
+    return doc_buffer.getvalue()
 
 
 def generate_summary(results: Dict[str, GradeResult], overall_grade: str, student_name: str) -> str:
     """Generate a personalized summary paragraph based on grading results."""
 
     # Check specific areas of strength
-    got_diab_right = (results.get('q4', GradeResult(False, '')).is_correct and
-                      results.get('q5', GradeResult(False, '')).is_correct)
+    got_diab_right = (results.get('q4', _MISSING_INCORRECT).is_correct and
+                      results.get('q5', _MISSING_INCORRECT).is_correct)
 
-    got_drops_right = results.get('q11', GradeResult(False, '')).is_correct
+    got_drops_right = results.get('q11', _MISSING_INCORRECT).is_correct
 
-    got_keys_right = results.get('q12', GradeResult(False, '')).is_correct
+    got_keys_right = results.get('q12', _MISSING_INCORRECT).is_correct
 
-    got_warmups_right = (results.get('q13b', GradeResult(False, '')).is_correct and
-                        results.get('q14b', GradeResult(False, '')).is_correct)
+    got_warmups_right = (results.get('q13b', _MISSING_INCORRECT).is_correct and
+                        results.get('q14b', _MISSING_INCORRECT).is_correct)
 
     # Check areas needing work
-    increase_errors = [q for q in ['q2', 'q3', 'q6', 'q7', 'q10', 'q14', 'q15']
-                       if not results.get(q, GradeResult(True, '')).is_correct]
+    has_increase_errors = any(not results.get(q, _MISSING_CORRECT).is_correct for q in INCREASE_QUESTIONS)
 
-    initial_td_errors = [q for q in ['q1', 'q9', 'q13']
-                         if not results.get(q, GradeResult(True, '')).is_correct]
+    has_initial_td_errors = any(not results.get(q, _MISSING_CORRECT).is_correct for q in INITIAL_TD_QUESTIONS)
 
     # Build summary in Amanda's warm, conversational style
     parts = []
@@ -277,11 +278,11 @@ def generate_summary(results: Dict[str, GradeResult], overall_grade: str, studen
             parts.append(strengths[0] + ", " + strengths[1] + ", and " + strengths[2] + "." if len(strengths) == 3 else ", ".join(strengths[:-1]) + ", and " + strengths[-1] + ".")
 
     # Areas for improvement - friendly tone
-    if increase_errors and initial_td_errors:
+    if has_increase_errors and has_initial_td_errors:
         parts.append("\n\nThere are just a few questions I want you to review and resubmit. I encourage you to review Module 2 for clarification on percentage increases as well as the body language lessons for setting initial target durations.")
-    elif increase_errors:
+    elif has_increase_errors:
         parts.append("\n\nWhere you are struggling is how to calculate the math for percentage increases. If you haven't seen it, there's a helpful app for duration calculations - I've included the link below.")
-    elif initial_td_errors:
+    elif has_initial_td_errors:
         parts.append("\n\nThere are just a few questions I want you to review and resubmit. I encourage you to review the body language lessons and take another look at setting initial target durations.")
 
     # Closing - warm and encouraging
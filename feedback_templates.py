@@ -0,0 +1,255 @@
+"""
+Feedback Templates
+Feedback text for the graders, keyed by outcome.
+
+Templates with {placeholders} are filled in with str.format by the grader.
+"""
+
+# Question 1 - Maisie's Plan 1 Target Duration
+MAISIE_Q1 = {
+    "diab_selected": "Maisie did show signs of anxiety early on, so well done! It is okay to err on the side of caution, especially when just starting out with a dog. However, for Plan 1 Maisie could have started with a target duration exercise rather than Door is a Bore.",
+    "diab_early": "Maisie did show signs of anxiety early on, so well done! It is okay to err on the side of caution, especially when just starting out with a dog. However, for anything under 5 seconds we'd start a dog on DIAB and in Maisie's case she does not need to start on DIAB. Maisie was doing well for the first 19 seconds of the video.",
+    "too_conservative": "Maisie was doing well for the first 19 seconds of the video. We start to see her struggle with those repeated yawns and lip licks starting at 20 seconds. It would have been okay to start her around 15 seconds to shave a little time off from those first signs of anxiety. However, it's always okay to err on the side of caution, especially when just starting out with a client.",
+    "correct_excellent": "Excellent choice for Maisie's Plan 1. Maisie starts showing anxiety with repeated yawning and lip licking starting at 20 seconds. More signs of anxiety follow throughout the absence. You identified those early signs and set a safe target duration well before they appeared.",
+    "correct_close": "Nice job catching that Maisie starts showing anxiety with repeated yawning and lip licking starting at 20 seconds. More signs of anxiety follow throughout the absence. Since this is your first time seeing Maisie you could even start closer to 15 seconds just to shave a little time off from where we saw those first signs of anxiety.",
+    "correct_at_threshold": "Nice job catching that when Maisie started yawning and lip licking around 20 seconds she was beginning to go over threshold. After that more signs of anxiety followed through the absence. Since her first yawn is 20 seconds into the absence we'd want to start her first exercise slightly before those first signs of anxiety. Starting closer to 15 seconds would be a better choice for Maisie.",
+    "slightly_pushy": "This target duration is slightly pushy. Maisie does start showing signs of anxiety pretty early on; repeated lip licks and yawns starting at 20 seconds, after which she gets up with a gruff, stretches, and looks at the door stiffly. Then she scratches and stretches. Some of these things could be okay on their own, but we are seeing an escalation of behaviors here. For Maisie, you'd want to set the target duration for Plan 1 to slightly before those very first signs of anxiety.",
+    "too_pushy": "Take another look at the video for Maisie. She starts to show signs of anxiety pretty early on. Watch closely. For Maisie, you'd want to set the target duration for Plan 1 to something you're pretty certain she'll be comfortable doing - a duration that's shorter than where we see those first signs of anxiety. We are looking for less than 20 seconds.",
+}
+
+# Whether each Question 1 outcome is graded correct
+MAISIE_Q1_CORRECT = {
+    "diab_early": False,
+    "too_conservative": False,
+    "correct_excellent": True,
+    "correct_close": True,
+    "correct_at_threshold": True,
+    "slightly_pushy": False,
+    "too_pushy": False,
+}
+
+# Questions 2 and 3 - shared by both of Maisie's target duration increases
+MAISIE_INCREASE = {
+    "missing": "Please provide a target duration for this plan.",
+    "decrease": "This is not correct. Maisie did not need to drop here. Since she aced Plan {previous_plan}, you should increase the target duration.",
+    "conservative": "Maisie would have been okay to push by the normal guidelines for under 2 minutes of 10-20%. This increase of {increase_pct:.1f}% is a bit conservative.",
+    "too_high": "The increases here are too high at {increase_pct:.1f}%. Please see the Plan Building Guidelines for target duration increases.",
+}
+
+# Question 2 - Maisie's Plan 2 Target Duration
+MAISIE_Q2 = {
+    "correct": "Well done on selecting a reasonable target increase for Plan 2! This is a {increase_pct:.1f}% increase, which is correctly following the guidelines for increases to target durations under 2 minutes.",
+    "slightly_over": "You were right to increase the target duration but this increase of {increase_pct:.1f}% is a little over the guidelines for durations under 2 minutes of 10-20%. When just starting out with a dog we'd be more likely to stay within those guidelines.",
+}
+
+# Question 3 - Maisie's Plan 3 Target Duration
+MAISIE_Q3 = {
+    "correct": "Well done on selecting another reasonable target increase for Plan 3! This is a {increase_pct:.1f}% increase, which is within the guidelines.",
+    "slightly_over": "You were right to increase the target duration but this increase of {increase_pct:.1f}% is a little over the guidelines for durations under 2 minutes of 10-20%.",
+}
+
+# Question 4 - Maisie After Struggle
+MAISIE_Q4 = {
+    "diab": "Good choice of DIAB to get Maisie back to acing sessions, since after the 2nd drop she struggled before the owners could even get out the door.",
+    "not_diab": "Since Maisie has already needed a couple of drops in a row and is now struggling before the owners can get out the door, we'd want to drop to something so easy she almost can't miss. Consider what would be most appropriate here.",
+}
+
+# Question 5 - Minna's Plan 1 Target Duration
+MINNA_Q5 = {
+    "diab": "Spot on selecting DIAB! Minna was showing anxiety before her owner got out the door.",
+    "not_diab": "Minna shows signs of anxiety such as pacing and whining very early on, even before the owner gets out the door. Where would you start a dog who is stressed before the owner even gets out of the door? Be sure to adjust Plans 2 and 3 accordingly.",
+}
+
+# Question 6 - Minna's Plan 2 Target Duration
+MINNA_Q6 = {
+    "kept_diab": "For this assignment, we were assuming Minna completed DIAB in Plan 1 (repeating step 10 up to 5 seconds outside the door). You didn't need to choose DIAB for Plan 2, as that would be overly conservative, but it's acceptable.",
+    "missing": "Please provide a target duration for Plan 2.",
+    "within_guidelines": "This is a {increase_pct:.1f}% increase from Plan 1, which follows the guidelines.",
+    "too_short": "There is some trainer's choice once the dog has been able to do 1 sec in DIAB. Nice job not jumping up too high. We do recommend continuing with DIAB format for anything under 5 seconds. For instance, you'd repeat step 10 building up in 1sec increments to 5sec.",
+    "correct": "Nice progression of increases following DIAB! There is some trainer's choice once the dog has been able to do 1 sec with the owner outside the door in DIAB.",
+    "seven_seconds": "There is some trainer's choice once the dog has been able to do 1 sec with the owner outside the door in DIAB. The first target duration exercise after DIAB would typically start at 5 sec. If you built up to 5sec in DIAB format, you might get away with 7 sec but we don't want to push our luck.",
+    "too_big_jump": "There is some trainer's choice once the dog has been able to do 1 sec with the owner outside the door in DIAB. You can repeat step 10 building up in 1sec increments to 5sec or try 3sec then switch to a target duration. Either way, this would be too big of a jump for Plan 2.",
+}
+
+# Whether each Question 6 outcome is graded correct
+MINNA_Q6_CORRECT = {
+    "too_short": False,
+    "correct": True,
+    "seven_seconds": False,
+    "too_big_jump": False,
+}
+
+# Question 7 - Minna's Plan 3 Target Duration
+MINNA_Q7 = {
+    "after_diab_correct": "Nice increase from DIAB to Plan 3. For this assignment, we were assuming Minna completed DIAB in Plan 1.",
+    "after_diab_too_short": "We recommend continuing with DIAB format for anything under 5 seconds.",
+    "after_diab_too_big_jump": "This is too big of a jump after DIAB.",
+    "missing": "Minna doesn't need DIAB at this point. Please provide a target duration.",
+    "no_increase": "Minna aced Plan 2, so you should increase the target duration for Plan 3.",
+    "short_duration": "Nice job selecting an appropriate increase for Plan 3. For such short durations, small absolute increases are appropriate.",
+    "conservative": "This increase of {increase_pct:.1f}% is a bit conservative.",
+    "correct": "Nice job selecting an appropriate increase for Plan 3.",
+    "too_high": "You selected quite a jump from Plan 2 at {increase_pct:.1f}%. This might be more than Minna can cope with.",
+}
+
+# Question 8 - Minna Target Duration Increase
+MINNA_Q8 = {
+    "gave_duration": "This question is asking what percentage you would increase by, not the actual target duration. Since Minna has been acing session after session, this is a good time to test out pushing a little higher than the guidelines.",
+    "correct": "Excellent choice for Minna's next push! Since she is acing session after session this is a good time to test out pushing a little higher than the guidelines.",
+    "too_low": "Since Minna has been acing session after session, this is a good time to test out pushing a little higher than the guidelines. What might we try instead when a dog is consistently acing sessions?",
+    "too_high": "Since Minna is acing session after session this is a good time to test out pushing a little higher than the guidelines. Nice job thinking to do that, however, we don't want to risk pushing too high. An increase around 15-20% would be good here.",
+    "push_keywords": "Excellent choice! Since she is acing session after session this is a good time to test out pushing a little higher than the guidelines.",
+    "other": "Since Minna has been acing session after session, this is a good time to test out pushing a little higher than the guidelines. What might we try instead when a dog is consistently acing sessions?",
+}
+
+# Question 9 - Oliver's Plan 1 Target Duration
+OLIVER_Q9 = {
+    "diab_selected": "Oliver did not need to start on Door is a Bore. He did well throughout the video. What would be a good target duration to start him on?",
+    "under_1_minute": "It's okay for dogs to move around and to walk to the door to watch. This game of going and coming is different, so we will often see this, especially in earlier stages of training even when dogs are not upset. Oliver settled and looked pretty relaxed; He walks toward the door at a normal pace (not frantic), turns his head and moves a bit when he's at the door (so he's not frozen), has alert but soft eyes and soft mouth, and he sits. All that said, Oliver did well here, so what would a good target duration be to start him on?",
+    "under_4_minutes": "It's okay for dogs to move around and to walk to the door to watch. This game of going and coming is different, so we will often see this, especially in earlier stages of training even when dogs are not upset. Oliver settled and looked pretty relaxed. His Plan 1 target duration could have been closer to the 5-minute range. Take another look at the video.",
+    "cautious": "It's okay for dogs to move around and to walk to the door to watch. Oliver settled and looked pretty relaxed. His Plan 1 target duration could have been closer to the 5-minute range, but it's best to err on the side of caution!",
+    "excellent": "Well done recognizing that Oliver did well for the duration of this exercise! It's okay for dogs to move around and go to the door, as long as there aren't signs of anxiety. You chose an excellent starting duration for Plan 1.",
+    "shaved_time": "Well done recognizing that Oliver did well for the duration of this exercise! It's okay for dogs to move around and go to the door, as long as there aren't signs of anxiety. Since this is an assessment, it was smart that you chose to shave some time off for the first exercise, just in case this happened to be a really good day for Oliver.",
+    "slightly_high": "Well done recognizing that Oliver did well for the duration of this exercise! It's okay for dogs to move around and go to the door, as long as there aren't signs of anxiety. The starting target is a little high though with a push over 10% when just starting with Oliver and if this was an assessment, it would be a good idea to shave some time off for the first exercise instead of push.",
+    "too_high": "Well done recognizing that Oliver did well for the duration of this exercise! However, the duration increase from the video is too high and since you are just starting with Oliver, it would be better to shave some time off for the first exercise, just in case this happened to be a really good day for Oliver.",
+}
+
+# Whether each Question 9 outcome is graded correct
+OLIVER_Q9_CORRECT = {
+    "under_1_minute": False,
+    "under_4_minutes": False,
+    "cautious": True,
+    "excellent": True,
+    "shaved_time": True,
+    "slightly_high": False,
+    "too_high": False,
+}
+
+# Question 10 - Oliver's Plan 2 Target Duration
+OLIVER_Q10 = {
+    "missing": "Please provide a target duration for this plan.",
+    "no_increase": "Oliver did well with Plan 1, so you should increase the target duration for Plan 2.",
+    "conservative": "It would have been okay to follow the guidelines here and push by 5-10% for Plan 2. This {increase_pct:.1f}% increase is a bit conservative.",
+    "correct": "Excellent progress of duration to Plan 2! This is a {increase_pct:.1f}% increase from Oliver's Plan 1 target duration, which is correctly following the guidelines for increases to target durations over 2 minutes.",
+    "slightly_over": "The increase from Plan 1 to Plan 2 is a tad higher than the guideline of 5-10% for durations over 2 min at {increase_pct:.1f}%. When just starting out with a dog we'd be more likely to stay within those guidelines.",
+    "too_high": "The increase to Plan 2 is too high at {increase_pct:.1f}%. Please see the Plan Building Guidelines as a refresher.",
+}
+
+# Whether each Question 10 outcome is graded correct
+OLIVER_Q10_CORRECT = {
+    "conservative": False,
+    "correct": True,
+    "slightly_over": False,
+    "too_high": False,
+}
+
+# Question 11 - Oliver's Plan 3 Target Duration
+OLIVER_Q11 = {
+    "missing": "Oliver struggled with Plan 2 but doesn't need DIAB. Please provide a target duration.",
+    "no_drop": "Oliver struggled with his Plan 2 exercise so we would not want to stick or push. What do we do when a dog struggles?",
+    "correct": "Excellent job dropping back to the target duration from the last successful exercise when Oliver struggled! This is the rule of thumb for a first drop.",
+    "below_last_success": "Great job selecting a drop here. But what should we be aiming to drop back to on the first drop? The rule of thumb is to go back to the last successful target duration, which was {last_success}.",
+    "above_last_success": "This is not correctly following the protocol for a dog's first drop. When a dog struggles, we drop back to the last successful target duration.",
+    "no_plan1": "Oliver struggled with Plan 2, so we need to drop. The rule of thumb is to drop back to the last successful exercise.",
+}
+
+# Question 12 - Oliver Keys Testing
+OLIVER_Q12 = {
+    "decrease": "Great choice to drop the target duration down when testing out reintroducing the keys. This gives Oliver the best chance of success with this previously triggering cue.",
+    "kiab_first": "Before going right to the Key is A Bore, what can we do with the TD to retest the keys since there is a chance that they will no longer be an issue now that we've built up some solid duration?",
+    "increase_or_same": "When testing out adding a previously anxiety-provoking pre-departure cue we'd want to decrease the TD.",
+    "bore_first": "Great choice to drop the target duration down when testing out reintroducing the keys.",
+    "other": "When testing out adding a previously anxiety-provoking pre-departure cue, what would you do with the target duration?",
+}
+
+# Question 13 - Bella's Plan 1 Target Duration
+BELLA_Q13 = {
+    "diab_selected": "Bella does not need to start on Door is a Bore. She does well for a good portion of the absence. What would be a good target duration to start her on?",
+    "well_under": "Bella actually does well for a good portion of the absence, she is watching the door and alert, but the rest of her body language is pretty relaxed. She does turn her head at the 1:26 min mark in the video, we will see dogs move around when training which can be normal. Take another peek at the video. Do you see where Bella goes from alert but settled to starting to become anxious? We want to set our first target duration to just before those first signs of anxiety start.",
+    "under": "Bella actually does well for a good portion of the absence. At the 3:14 timestamp, she goes off camera, whines, and comes back. This is followed by escalating signs of anxiety through the remainder of the absence. A target duration just slightly less than 3 minutes would have been a good choice for Bella, but it is always better to err on the side of caution, especially when just starting out with a dog.",
+    "excellent": "Excellent job spotting where Bella started to get anxious around the 3-minute time stamp. Good call to shave some time off for her first target duration to be safe. The amount we choose to shave off can vary based on different factors.",
+    "great": "Great starting target for Plan 1 since after Bella quickly trots off and whines more signs of anxiety follow.",
+    "close_to_whine": "Good job noticing that after Bella whines she escalates with more signs of anxiety. You might even want to start closer to 3 minutes or slightly before since after Bella quickly trots off more signs of anxiety follow.",
+    "at_whine": "Good job noticing that after Bella whines she escalates with more signs of anxiety. Since she whines 3:10 into the absence we'd want to start her first exercise before those first signs of anxiety. Starting closer to 3 minutes or a little before to shave some time off would be a better choice for Bella.",
+    "slightly_over": "Bella started to show first signs of stress before this duration. Remember, we want to go off total absence time, not the time stamp, and the owner left 14 seconds into the video. You'd want to select a target duration for Plan 1 that is slightly shorter than when Bella started to show those first signs of anxiety.",
+    "too_high": "Take another look at Bella's video. Do you see or hear any signs of stress, and if so, how long into the absence do they begin? You'd want to select a target duration for Plan 1 that is slightly shorter than that, shaving off some time to play it safe.",
+}
+
+# Whether each Question 13 outcome is graded correct
+BELLA_Q13_CORRECT = {
+    "well_under": False,
+    "under": False,
+    "excellent": True,
+    "great": True,
+    "close_to_whine": True,
+    "at_whine": True,
+    "slightly_over": False,
+    "too_high": False,
+}
+
+# Question 13B - Bella's Plan 1 Warmups
+BELLA_Q13B = {
+    "missing": "Please provide a number of warmup steps.",
+    "none": "For target durations between 1 and 5 minutes, we should include some warmup steps. What would be an appropriate number of warmups for Bella's duration?",
+    "too_few": "This number of warmups is a bit low for a target duration in this range. The guidelines suggest {min_warmups}-{max_warmups} warmup steps.",
+    "correct": "Good job following the warmup guidelines for a target duration between 1 and 5 minutes.",
+    "outside_guidelines": "This number of warmups is outside of the guidelines for a target duration between 1 and 5 minutes. The guidelines suggest {min_warmups}-{max_warmups} warmup steps.",
+}
+
+# Question 14 - Bella's Plan 2 Target Duration
+BELLA_Q14 = {
+    "missing": "Please provide a target duration for this plan.",
+    "decrease": "Even though Bella wobbled on the warmups in Plan 1 she aced the target so you could push ahead with an increase for Plan 2. We base whether to push or drop on how a dog did on the target duration unless they completely fall apart in the warm-ups.",
+    "same": "Since Bella aced the target duration in Plan 1, you should increase for Plan 2.",
+    "conservative": "This increase of {increase_pct:.1f}% is below the recommended guidelines for increases to target durations {under_over} 2 minutes.",
+    "correct": "Nice progression of duration to Plan 2! Even though Bella wobbled on the warmups in Plan 1 she aced the target so good call to increase the target for Plan 2.",
+    "slightly_over": "The increase from Plan 1 to Plan 2 at {increase_pct:.1f}% is a tad higher than the guideline of {min_pct}-{max_pct}% for durations {under_over} 2 min. When just starting out with a dog we'd be more likely to stay within those guidelines.",
+    "too_high": "This is a bit too high of an increase from Plan 1 at {increase_pct:.1f}%.",
+}
+
+# Question 14B - Bella's Plan 2 Warmups
+BELLA_Q14B = {
+    "missing": "Please provide a number of warmup steps.",
+    "removed": "Great job removing the warmups since she struggled. It would also have been fine to test out reducing the number, keeping a few warm up steps.",
+    "reduced": "Nice job testing out fewer warmups with Bella and keeping them reduced since it helped!",
+    "reduced_by_one": "Great call to reduce warmup steps. It would be best to reduce by a couple steps versus 1, especially since Bella wobbled on a couple.",
+    "not_reduced": "When a dog seems to get more agitated as the warmups go on what can we test out doing with the warmup steps?",
+}
+
+# Question 15 - Bella's Plan 3 Target Duration
+BELLA_Q15 = {
+    "missing": "Please provide a target duration for this plan.",
+    "no_increase": "Bella aced Plan 2, so you should increase the target duration for Plan 3.",
+    "conservative": "This increase of {increase_pct:.1f}% is below the recommended guidelines for increases to target durations {under_over} 2 minutes.",
+    "correct": "This is a {increase_pct:.1f}% increase from Bella's Plan 2, which is within the guidelines for durations {under_over} 2 min.",
+    "too_high": "This is a bit too high of an increase from what you set Bella's Plan 2 target duration at {increase_pct:.1f}%.",
+}
+
+# Question 15B - Bella's Plan 3 Warmups
+BELLA_Q15B = {
+    "missing": "Please provide a number of warmup steps.",
+    "kept_same": "Good job keeping the warmup steps consistent with Plan 2. This stability in the warmup routine can be beneficial for Bella's progress.",
+    "added_back": "Nice job testing out fewer warmups with Bella in Plan 2. Since this helped we would not want to add them back in on later plans.",
+}
+
+# Question 16 - Bella Car Protocol
+BELLA_Q16 = {
+    "early_step": "Nice! Since we already know that turning the car on causes anxiety, we can go right to Car is A Bore. Excellent thinking breaking down the process. It's good to start a couple of steps back from where the dog first started showing signs of anxiety. You might try starting with something like step 5 in the driveway.",
+    "late_step": "Good thinking to work on Car is a Bore. Since we already know that turning the car on caused anxiety for Bella we would not want to start on a step that has turning the engine on in it. We always want to start on a step that the dog will be completely comfortable with.",
+    "lower_intensity": "Nice thinking about parking the car further away to dial down the intensity when it's possible for the owner. If parking further away solves the issue and that is something they want to continue, excellent. It could even be a management tool while working on car is a bore. If the owner will need to have the car closer to home at some point it could work to gradually move the car closer, however, it may be easier to work on Car is a Bore with the car in the driveway/garage if that's the end goal. You might try starting with something like step 5 in the driveway.",
+    "ciab": "Good thinking to work on Car is a Bore. You might try starting with something like step 5 in the Car is a Bore plan.",
+    "ciab_steps": "Good thinking to work on Car is a Bore. Since we already know that turning the car on caused anxiety for Bella we would not want to start on a step that has turning the engine on in it. We always want to start on a step that the dog will be completely comfortable with.",
+    "assessment": "Since we already know that turning the car on caused anxiety for Bella we would not need to do an assessment. We can go right to the Car is a Bore plan.",
+    "other": "Since turning the car on caused anxiety for Bella what can we do to help desensitize her to the car?",
+}
+
+# Question 17 - DIAB Warmups
+DIAB_Q17 = {
+    "couple_words": "Excellent! We would only need to do a couple repetitions to warmup the dog.",
+    "missing": "Please specify how many repetitions.",
+    "none": "You might get away with not doing any warmups for DIAB, especially once the dog becomes a pro at the game. However, when starting it would be good to do 2-3 reps of the previous step or 2 to warm the dog up.",
+    "couple": "Excellent! We would only need to do a couple repetitions to warmup the dog.",
+    "four": "You are right that you would not need them to repeat the entire previous step or steps. We'd only need to do a couple of reps to warm up the dog, even 2-3 reps of the previous step or 2 might be enough.",
+    "too_many": "We'd only need to do a couple of reps to warm up the dog. 2-3 reps of the previous step or 2 is usually good for most dogs.",
+    "all_reps": "When doing DIAB we do not need to repeat all 10 reps of the previous steps. That would be too many reps just to complete Step 3. We only need to warm the dog up a little.",
+}
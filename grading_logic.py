@@ -3,115 +3,789 @@ PBA Grading Logic Module
 Contains all the grading rules and feedback templates for the Plan Building Assignment.
 """
 
+import asyncio
+import hashlib
+import logging
+import math
+import os
 import re
+import sqlite3
+import statistics
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Final, Optional, Tuple
+
+from feedback_templates import (
+    BELLA_Q13, BELLA_Q13_CORRECT, BELLA_Q13B, BELLA_Q14, BELLA_Q14B, BELLA_Q15, BELLA_Q15B, BELLA_Q16, DIAB_Q17,
+    MAISIE_INCREASE, MAISIE_Q1, MAISIE_Q1_CORRECT, MAISIE_Q2, MAISIE_Q3, MAISIE_Q4,
+    MINNA_Q5, MINNA_Q6, MINNA_Q6_CORRECT, MINNA_Q7, MINNA_Q8,
+    OLIVER_Q9, OLIVER_Q9_CORRECT, OLIVER_Q10, OLIVER_Q10_CORRECT, OLIVER_Q11, OLIVER_Q12,
+)
 
 # Import anthropic for LLM normalization (optional dependency)
 try:
-    from anthropic import Anthropic
+    from anthropic import Anthropic, AsyncAnthropic
     ANTHROPIC_AVAILABLE = True
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+# NumPy speeds up grading whole cohorts at once (optional dependency)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
-def normalize_duration_with_llm(raw_answer: str, api_key: str) -> str:
-    """
-    Use Claude to normalize unusual duration formats to total seconds.
-
-    Handles formats like:
-    - "0:00:10" (HH:MM:SS meaning 10 seconds)
-    - "6.22" (European style meaning 6 min 22 sec)
-    - "5m 57 seconds" (mixed abbreviation and full word)
-
-    Args:
-        raw_answer: The raw duration string from student
-        api_key: Anthropic API key
-
-    Returns:
-        Normalized string (either seconds as number, "DOOR", or "INVALID")
-    """
+# Platform cache directory for the on-disk normalization cache (optional dependency)
+try:
+    from platformdirs import user_cache_dir
+except ImportError:
+    try:
+        from appdirs import user_cache_dir
+    except ImportError:
+        user_cache_dir = None
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of normalization requests in flight at once
+LLM_CONCURRENCY = 10
+
+# Latency of recent normalization requests in milliseconds, for get_llm_stats
+_llm_latency_ms: deque = deque(maxlen=10_000)
+_llm_stats_lock = threading.Lock()
+_llm_calls = 0
+_llm_total_ms = 0.0
+
+# Duration formats recognized by parse_duration and the LLM prefilter, compiled once
+_RE_FRENCH_FULL: Final[re.Pattern] = re.compile(r'^(\d+)\s*minutes?\s*(\d+)\s*secondes?$')
+_RE_ENG_FULL: Final[re.Pattern] = re.compile(r'^(\d+)\s*minutes?\s*(\d+)\s*seconds?$')
+_RE_FRENCH_TIME: Final[re.Pattern] = re.compile(r'^(\d+),(\d{1,2})$')
+_RE_SHORTHAND: Final[re.Pattern] = re.compile(r'^(\d+)\s*(?:mn|m)\s*(\d+)$')
+_RE_MINS_ONLY: Final[re.Pattern] = re.compile(r'^(\d+(?:[.,]\d+)?)\s*(?:minutes?|mins?|mn|m)$')
+_RE_SECS_ONLY: Final[re.Pattern] = re.compile(r'^(\d+(?:[.,]\d+)?)\s*(?:secondes?|seconds?|secs?|s)$')
+_RE_DIGIT_ONLY: Final[re.Pattern] = re.compile(r'^\d+$')
+_RE_WS: Final[re.Pattern] = re.compile(r'\s+')
+_RE_COLONS: Final[re.Pattern] = re.compile(r':+')
+_RE_DOTTED_DECIMAL: Final[re.Pattern] = re.compile(r'^\d+\.\d{1,2}$')
+# A seconds field of 60 or more after a separator, e.g. "4:60"
+_RE_SECONDS_OVERFLOW: Final[re.Pattern] = re.compile(r"[:',](?:[6-9]\d|\d{3,})")
+
+# Shapes parse_duration reads exactly, besides the ones _fsm_parse_duration covers
+_STRICT_DURATION_SHAPES: Final[tuple] = (
+    _RE_FRENCH_FULL, _RE_ENG_FULL, _RE_FRENCH_TIME, _RE_SHORTHAND, _RE_MINS_ONLY, _RE_SECS_ONLY,
+)
+
+# DOOR / DIAB answers, searched in lowercased text
+_DIAB_RE: Final[re.Pattern] = re.compile(r'door|diab')
+
+
+def _needs_llm(raw_answer: str) -> bool:
+    """Return True if raw_answer is an unusual duration format worth sending to the LLM."""
     if not raw_answer or not raw_answer.strip():
-        return raw_answer
-
-    if not api_key or not ANTHROPIC_AVAILABLE:
-        return raw_answer
+        return False
 
     # Skip if it's already a simple format that parse_duration handles well
     raw_clean = raw_answer.strip().lower()
 
     # Quick check: if it's clearly DOOR/DIAB, don't bother with LLM
-    if 'door' in raw_clean or 'diab' in raw_clean:
-        return raw_answer
+    if _DIAB_RE.search(raw_clean):
+        return False
 
     # Quick check: if it's a simple number, skip LLM
-    if re.match(r'^\d+$', raw_clean):
-        return raw_answer
+    if _RE_DIGIT_ONLY.match(raw_clean):
+        return False
 
-    # Quick check: if it matches standard formats we handle well, skip LLM
-    # Standard MM:SS format
-    if re.match(r'^\d{1,2}:\d{2}$', raw_clean):
-        return raw_answer
+    # "6.22"-style answers are more likely European minutes.seconds than decimal seconds
+    if _RE_DOTTED_DECIMAL.match(raw_clean):
+        return True
 
-    # Standard "X minutes Y seconds" format
-    if re.match(r'^\d+\s*minutes?\s*\d*\s*seconds?$', raw_clean):
-        return raw_answer
+    # "4:60" is not a real M:SS, whatever parse_duration makes of it
+    if _RE_SECONDS_OVERFLOW.search(raw_clean):
+        return True
 
-    # Use LLM for unusual formats
-    try:
-        client = Anthropic(api_key=api_key)
+    # Only skip the LLM for shapes parse_duration reads exactly; its lenient
+    # fallback would read "5 to 6 seconds" as 5 and "2 et demie minutes" as 2
+    if _fsm_parse_duration(raw_clean) is not None:
+        return False
+    return not any(shape.match(raw_clean) for shape in _STRICT_DURATION_SHAPES)
 
-        prompt = f"""Convert this duration to total seconds. Return ONLY a number, nothing else.
-If it says 'Door', 'DIAB', or similar, return 'DOOR'.
-If it's not a valid duration, return 'INVALID'.
 
-Examples:
+# Worked examples shared by the single-answer and packed normalization prompts
+NORMALIZE_EXAMPLES: Final[str] = """Examples:
 - "10" → "10"
 - "0:00:10" → "10"
 - "5m 57 seconds" → "357"
 - "6.22" (European for 6:22) → "382"
 - "5:30" → "330"
 - "2min30" → "150"
-- "1:30:00" (HH:MM:SS for 1.5 hours) → "5400"
+- "1:30:00" (HH:MM:SS for 1.5 hours) → "5400\""""
 
-Input: {raw_answer}"""
+# Static system prompts, sent as a cached prefix so only the answers vary per request
+NORMALIZE_SYSTEM: Final[str] = f"""Convert this duration to total seconds. Return ONLY a number, nothing else.
+If it says 'Door', 'DIAB', or similar, return 'DOOR'.
+If it's not a valid duration, return 'INVALID'.
 
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=50,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
+{NORMALIZE_EXAMPLES}"""
+
+PACKED_NORMALIZE_SYSTEM: Final[str] = f"""Convert each duration below to total seconds.
+If it says 'Door', 'DIAB', or similar, use 'DOOR'.
+If it's not a valid duration, use 'INVALID'.
+
+{NORMALIZE_EXAMPLES}
+
+Respond with one line per item and nothing else, in the form: Item <n>: <seconds|DOOR|INVALID>"""
+
+# One "Item <n>: <value>" line of a packed normalization reply
+_ITEM_LINE_RE = re.compile(r'^Item\s+(\d+):\s*(\S+)', re.M)
+
+# Maximum number of answers packed into one normalization prompt
+MAX_PACKED_ITEMS = 50
+
+# Successful LLM normalizations, keyed by (cleaned answer, API key digest); bounded LRU.
+# Only answers that came back as seconds or DOOR are stored, never fallbacks.
+NORMALIZE_CACHE_SIZE = 4096
+_normalize_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_normalize_cache_lock = threading.Lock()
+
+
+def _build_common_durations() -> dict:
+    """Spelled-out durations students write all the time, mapped to seconds as the LLM would return them."""
+    numbers = {
+        'a': 1, 'an': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7,
+        'eight': 8, 'nine': 9, 'ten': 10, 'fifteen': 15, 'twenty': 20, 'thirty': 30, 'forty five': 45,
+        'forty-five': 45,
+    }
+    units = {'minute': 60, 'minutes': 60, 'min': 60, 'mins': 60,
+             'second': 1, 'seconds': 1, 'sec': 1, 'secs': 1}
+    common = {f"{word} {unit}": str(count * seconds)
+              for word, count in numbers.items() for unit, seconds in units.items()}
+    common.update({
+        'half a minute': '30', 'a minute and a half': '90', 'one and a half minutes': '90',
+        'two and a half minutes': '150', 'three and a half minutes': '210',
+    })
+    return common
+
+
+# Answers that never need the LLM, keyed by the cleaned answer with runs of whitespace collapsed;
+# unlike _normalize_cache, shared by every API key
+_COMMON_DURATIONS: Final[dict] = _build_common_durations()
+
+# Second-level cache on disk, so normalizations survive restarts; bounded to the newest entries.
+# PBA_GRADER_CACHE_DIR overrides the location, and setting it to an empty string disables it.
+DISK_CACHE_MAX_ENTRIES = 1_000_000
+# Serializes use of the shared sqlite connection, separately from the in-memory cache
+_disk_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: str) -> "Anthropic":
+    """Return a shared client per API key so its connection pool is reused between calls."""
+    return Anthropic(api_key=api_key)
+
+
+def _record_llm_latency(started: float) -> None:
+    """Record one normalization request that started at time.monotonic() value started."""
+    global _llm_calls, _llm_total_ms
+    elapsed_ms = (time.monotonic() - started) * 1000
+    with _llm_stats_lock:
+        _llm_latency_ms.append(elapsed_ms)
+        _llm_calls += 1
+        _llm_total_ms += elapsed_ms
+
+
+def get_llm_stats() -> dict:
+    """
+    Latency of the LLM normalization requests made by this process.
+
+    Returns n and total_ms over all requests, and p50, p95 and max in
+    milliseconds over the most recent 10,000.
+    """
+    with _llm_stats_lock:
+        latencies = list(_llm_latency_ms)
+        stats = {"n": _llm_calls, "total_ms": _llm_total_ms}
+    if len(latencies) >= 2:
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        stats.update(p50=percentiles[49], p95=percentiles[94], max=max(latencies))
+    else:
+        stats.update(p50=sum(latencies), p95=sum(latencies), max=sum(latencies))
+    return stats
+
+
+def _log_llm_batch(requests: int, started: float) -> None:
+    logger.info("LLM normalization: n=%d total=%.1fs p95=%.0fms",
+                requests, time.monotonic() - started, get_llm_stats()["p95"])
+
+
+def _cached_system(text: str) -> list:
+    """System prompt as a single text block marked for prompt caching."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+def _build_normalize_prompt(raw_answer: str) -> str:
+    """User message for normalizing one answer (instructions are in NORMALIZE_SYSTEM)."""
+    return f"Input: {raw_answer}"
 
-        result = message.content[0].text.strip()
 
-        # Validate the result
-        if result == "DOOR":
-            return "DOOR"
-        elif result == "INVALID":
-            return raw_answer  # Let parse_duration handle it
+def _build_packed_prompt(raw_answers: list) -> str:
+    """User message listing several numbered answers (instructions are in PACKED_NORMALIZE_SYSTEM)."""
+    return "\n".join(
+        f"Item {n}\nInput: {' '.join(raw_answer.split())}"
+        for n, raw_answer in enumerate(raw_answers, 1)
+    )
+
+
+def _parse_llm_reply(reply: str) -> Optional[str]:
+    """Turn Claude's reply into a normalized answer ("DOOR" or seconds), or None if it is unusable."""
+    reply = reply.strip()
+    if reply == "DOOR":
+        return "DOOR"
+    elif reply == "INVALID":
+        return None  # Let parse_duration handle the original
+    else:
+        # Try to parse as number to validate
+        if reply.isdigit():
+            return reply
+        try:
+            float(reply)
+            return reply  # Return the seconds as string
+        except ValueError:
+            return None  # Invalid response, use original
+
+
+def _parse_packed_reply(reply: str) -> dict:
+    """Map item numbers to values in a packed reply; if an item appears twice, its first line wins."""
+    replies = {}
+    for match in _ITEM_LINE_RE.finditer(reply):
+        replies.setdefault(int(match.group(1)), match.group(2))
+    return replies
+
+
+@lru_cache(maxsize=4)
+def _api_key_digest(api_key: str) -> str:
+    """Short digest of the API key, so cache keys don't hold the secret itself."""
+    return hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+
+
+def _cache_key(raw_answer: str, api_key: str) -> tuple:
+    return raw_answer.strip().lower(), _api_key_digest(api_key)
+
+
+def _disk_cache_key(key: tuple) -> str:
+    return hashlib.sha256("\0".join(key).encode()).hexdigest()[:32]
+
+
+@lru_cache(maxsize=1)
+def _disk_cache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk normalization cache, or None if it is disabled or unavailable."""
+    cache_dir = os.environ.get("PBA_GRADER_CACHE_DIR")
+    if cache_dir is None:
+        if user_cache_dir is not None:
+            cache_dir = user_cache_dir("pba-grader")
+        else:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "pba-grader")
+    if not cache_dir:
+        return None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Shared across threads; every access holds _disk_cache_lock
+        conn = sqlite3.connect(os.path.join(cache_dir, "normalize.sqlite3"), check_same_thread=False)
+        conn.execute("CREATE TABLE IF NOT EXISTS norm_cache (key TEXT PRIMARY KEY, value TEXT)")
+        conn.commit()
+        return conn
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _disk_lookup(key: tuple) -> Optional[str]:
+    """Look key up in the on-disk cache."""
+    conn = _disk_cache()
+    if conn is None:
+        return None
+    try:
+        with _disk_cache_lock:
+            row = conn.execute("SELECT value FROM norm_cache WHERE key = ?", (_disk_cache_key(key),)).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _disk_store(key: tuple, value: str) -> None:
+    """Write one normalization to the on-disk cache."""
+    conn = _disk_cache()
+    if conn is None:
+        return
+    try:
+        with _disk_cache_lock:
+            cursor = conn.execute("INSERT OR REPLACE INTO norm_cache (key, value) VALUES (?, ?)",
+                                  (_disk_cache_key(key), value))
+            # Replacing a row gives it a new rowid, so the lowest rowids are the oldest entries
+            conn.execute("DELETE FROM norm_cache WHERE rowid <= ?", (cursor.lastrowid - DISK_CACHE_MAX_ENTRIES,))
+            conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+def _pending_llm_answers(raw_answers: list, api_key: str, normalized: list) -> tuple:
+    """
+    Fill normalized in place from the caches and work out which answers still need the LLM.
+
+    Returns (pending, repeats): pending holds one index per distinct uncached
+    answer; repeats holds the indexes of later copies of those answers, to be
+    filled by _fill_repeats once the pending ones are normalized. Answers in a
+    format parse_duration already handles, or in _COMMON_DURATIONS, never need the LLM.
+    """
+    uncached = {}
+    repeats = []
+    with _normalize_cache_lock:
+        for i, raw_answer in enumerate(raw_answers):
+            if not _needs_llm(raw_answer):
+                continue
+            key = _cache_key(raw_answer, api_key)
+            common = _COMMON_DURATIONS.get(' '.join(key[0].split()))
+            if common is not None:
+                normalized[i] = common
+            elif key in _normalize_cache:
+                _normalize_cache.move_to_end(key)
+                normalized[i] = _normalize_cache[key]
+            elif key in uncached:
+                repeats.append(i)
+            else:
+                uncached[key] = i
+
+    # Disk reads happen outside the lock, so other grading threads are not held up behind them
+    found = {}
+    pending = []
+    for key, i in uncached.items():
+        value = _disk_lookup(key)
+        if value is not None:
+            found[key] = value
+            normalized[i] = value
         else:
-            # Try to parse as number to validate
-            try:
-                float(result)
-                return result  # Return the seconds as string
-            except ValueError:
-                return raw_answer  # Invalid response, use original
+            pending.append(i)
+    if not found:
+        return pending, repeats
+
+    with _normalize_cache_lock:
+        # Promote to the in-memory cache so later calls skip the disk
+        for key, value in found.items():
+            _store_in_memory(key, value)
+    unresolved = []
+    for i in repeats:
+        value = found.get(_cache_key(raw_answers[i], api_key))
+        if value is not None:
+            normalized[i] = value
+        else:
+            unresolved.append(i)
+    return pending, unresolved
+
+
+def _store_in_memory(key: tuple, value: str) -> None:
+    """Add one normalization to the in-memory LRU (caller holds _normalize_cache_lock)."""
+    _normalize_cache[key] = value
+    if len(_normalize_cache) > NORMALIZE_CACHE_SIZE:
+        _normalize_cache.popitem(last=False)
+
+
+def _fill_repeats(repeats: list, raw_answers: list, api_key: str, normalized: list) -> None:
+    """Copy the now-cached normalizations to repeated answers (left raw if their first copy failed)."""
+    with _normalize_cache_lock:
+        for i in repeats:
+            normalized[i] = _normalize_cache.get(_cache_key(raw_answers[i], api_key), raw_answers[i])
+
+
+def _remember(raw_answer: str, api_key: str, value: Optional[str]) -> str:
+    """Cache a successful normalization and return the answer to grade with."""
+    if value is None:
+        # Failures are not cached, so a transient error gets retried next time
+        return raw_answer
+    key = _cache_key(raw_answer, api_key)
+    with _normalize_cache_lock:
+        _store_in_memory(key, value)
+    _disk_store(key, value)
+    return value
+
+
+async def _normalize_one_async(client: "AsyncAnthropic", semaphore: asyncio.Semaphore, raw_answer: str) -> Optional[str]:
+    """Normalize a single answer with the LLM; None if the request fails or the reply is unusable."""
+    try:
+        async with semaphore:
+            started = time.monotonic()
+            message = await client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=50,
+                system=_cached_system(NORMALIZE_SYSTEM),
+                messages=[
+                    {"role": "user", "content": _build_normalize_prompt(raw_answer)}
+                ]
+            )
+            _record_llm_latency(started)
+        return _parse_llm_reply(message.content[0].text)
 
     except Exception:
         # On any error, fall back to original answer
-        return raw_answer
+        return None
+
+
+async def normalize_durations_with_llm_async(raw_answers: list, api_key: str) -> list:
+    """
+    Normalize several duration answers concurrently (see normalize_duration_with_llm).
+
+    Only answers in an unusual format that are not already cached are sent to
+    Claude; at most LLM_CONCURRENCY requests are in flight at once. Returns the
+    normalized answers in input order.
+    """
+    normalized = list(raw_answers)
+    if not api_key or not ANTHROPIC_AVAILABLE:
+        return normalized
+
+    pending, repeats = _pending_llm_answers(raw_answers, api_key, normalized)
+    if not pending:
+        return normalized
+
+    # One client per batch: async clients hold connections bound to the running event loop
+    started = time.monotonic()
+    semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+    async with AsyncAnthropic(api_key=api_key) as client:
+        results = await asyncio.gather(
+            *(_normalize_one_async(client, semaphore, raw_answers[i]) for i in pending)
+        )
+    _log_llm_batch(len(pending), started)
+    for i, result in zip(pending, results):
+        normalized[i] = _remember(raw_answers[i], api_key, result)
+    _fill_repeats(repeats, raw_answers, api_key, normalized)
+    return normalized
+
+
+def normalize_durations_with_llm(raw_answers: list, api_key: str) -> list:
+    """Synchronous wrapper around normalize_durations_with_llm_async."""
+    coroutine = normalize_durations_with_llm_async(raw_answers, api_key)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # Called from inside a running event loop - run the batch on its own loop in a worker thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def normalize_batch_in_one_prompt(raw_answers: list, api_key: str) -> list:
+    """
+    Normalize several duration answers with one LLM request per MAX_PACKED_ITEMS answers.
+
+    The answers are numbered in a single prompt and the "Item <n>: <value>"
+    lines of the reply are mapped back. Items missing from the reply, or a
+    request that fails, are retried as individual concurrent requests.
+    """
+    normalized = list(raw_answers)
+    if not api_key or not ANTHROPIC_AVAILABLE:
+        return normalized
+
+    pending, repeats = _pending_llm_answers(raw_answers, api_key, normalized)
+    unanswered = []
+    batch_started = time.monotonic()
+    for start in range(0, len(pending), MAX_PACKED_ITEMS):
+        chunk = pending[start:start + MAX_PACKED_ITEMS]
+        replies = {}
+        try:
+            started = time.monotonic()
+            message = _get_anthropic_client(api_key).messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=50 * len(chunk),
+                system=_cached_system(PACKED_NORMALIZE_SYSTEM),
+                messages=[
+                    {"role": "user", "content": _build_packed_prompt([raw_answers[i] for i in chunk])}
+                ]
+            )
+            _record_llm_latency(started)
+            replies = _parse_packed_reply(message.content[0].text)
+        except Exception:
+            pass
+
+        for n, i in enumerate(chunk, 1):
+            if n in replies:
+                normalized[i] = _remember(raw_answers[i], api_key, _parse_llm_reply(replies[n]))
+            else:
+                unanswered.append(i)
+
+    if pending:
+        _log_llm_batch(math.ceil(len(pending) / MAX_PACKED_ITEMS), batch_started)
+
+    if unanswered:
+        retried = normalize_durations_with_llm([raw_answers[i] for i in unanswered], api_key)
+        for i, result in zip(unanswered, retried):
+            normalized[i] = result
+    _fill_repeats(repeats, raw_answers, api_key, normalized)
+    return normalized
+
+
+def normalize_durations_batched(raw_answers: list, api_key: str, poll_interval: float = 10.0,
+                                timeout: float = 24 * 60 * 60) -> list:
+    """
+    Normalize duration answers through the Message Batches API.
+
+    Batches are billed at half price but can take minutes to hours to finish,
+    so this is meant for offline grading of a whole cohort, not the interactive
+    app. Answers that fail, or a batch that does not end within timeout seconds,
+    fall back to the raw answer just like normalize_duration_with_llm.
+    """
+    normalized = list(raw_answers)
+    if not api_key or not ANTHROPIC_AVAILABLE:
+        return normalized
+
+    pending, repeats = _pending_llm_answers(raw_answers, api_key, normalized)
+    if not pending:
+        return normalized
+
+    try:
+        client = _get_anthropic_client(api_key)
+        batch = client.messages.batches.create(requests=[
+            {
+                "custom_id": f"answer-{i}",
+                "params": {
+                    "model": "claude-sonnet-4-20250514",
+                    "max_tokens": 50,
+                    "system": _cached_system(NORMALIZE_SYSTEM),
+                    "messages": [{"role": "user", "content": _build_normalize_prompt(raw_answers[i])}]
+                }
+            }
+            for i in pending
+        ])
+
+        deadline = time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() > deadline:
+                client.messages.batches.cancel(batch.id)
+                return normalized
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                continue
+            i = int(entry.custom_id.split("-", 1)[1])
+            normalized[i] = _remember(raw_answers[i], api_key, _parse_llm_reply(entry.result.message.content[0].text))
+
+    except Exception:
+        # On any error, keep the answers normalized so far
+        pass
+
+    _fill_repeats(repeats, raw_answers, api_key, normalized)
+    return normalized
+
+
+def normalize_duration_with_llm(raw_answer: str, api_key: str) -> str:
+    """
+    Use Claude to normalize unusual duration formats to total seconds.
+
+    Handles formats like:
+    - "0:00:10" (HH:MM:SS meaning 10 seconds)
+    - "6.22" (European style meaning 6 min 22 sec)
+    - "5m 57 seconds" (mixed abbreviation and full word)
+
+    Args:
+        raw_answer: The raw duration string from student
+        api_key: Anthropic API key
+
+    Returns:
+        Normalized string (either seconds as number, "DOOR", or "INVALID")
+    """
+    return normalize_durations_with_llm([raw_answer], api_key)[0]
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GradeResult:
-    """Result of grading a single question."""
+    """Result of grading a single question (immutable, so results can be shared and cached)."""
     is_correct: bool
     feedback: str
     calculation: Optional[str] = None  # For showing percentage calculations
     confidence: str = "high"  # "high" or "review" - review means near threshold, needs human check
 
 
+# Results that never vary, built once: GradeResult is frozen, so graders can share them
+_MAISIE_Q1_DIAB_SELECTED: Final[GradeResult] = GradeResult(is_correct=False, feedback=MAISIE_Q1["diab_selected"])
+_MAISIE_INCREASE_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=MAISIE_INCREASE["missing"])
+_MAISIE_Q4_DIAB: Final[GradeResult] = GradeResult(is_correct=True, feedback=MAISIE_Q4["diab"])
+_MAISIE_Q4_NOT_DIAB: Final[GradeResult] = GradeResult(is_correct=False, feedback=MAISIE_Q4["not_diab"])
+_MINNA_Q5_DIAB: Final[GradeResult] = GradeResult(is_correct=True, feedback=MINNA_Q5["diab"])
+_MINNA_Q5_NOT_DIAB: Final[GradeResult] = GradeResult(is_correct=False, feedback=MINNA_Q5["not_diab"])
+_MINNA_Q6_KEPT_DIAB: Final[GradeResult] = GradeResult(is_correct=True, feedback=MINNA_Q6["kept_diab"])
+_MINNA_Q6_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=MINNA_Q6["missing"])
+_MINNA_Q7_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=MINNA_Q7["missing"])
+_MINNA_Q7_NO_INCREASE: Final[GradeResult] = GradeResult(is_correct=False, feedback=MINNA_Q7["no_increase"])
+_MINNA_Q8_GAVE_DURATION: Final[GradeResult] = GradeResult(is_correct=False, feedback=MINNA_Q8["gave_duration"])
+_MINNA_Q8_CORRECT: Final[GradeResult] = GradeResult(is_correct=True, feedback=MINNA_Q8["correct"])
+_MINNA_Q8_TOO_LOW: Final[GradeResult] = GradeResult(is_correct=False, feedback=MINNA_Q8["too_low"])
+_MINNA_Q8_TOO_HIGH: Final[GradeResult] = GradeResult(is_correct=False, feedback=MINNA_Q8["too_high"])
+_MINNA_Q8_PUSH_KEYWORDS: Final[GradeResult] = GradeResult(is_correct=True, feedback=MINNA_Q8["push_keywords"])
+_MINNA_Q8_OTHER: Final[GradeResult] = GradeResult(is_correct=False, feedback=MINNA_Q8["other"])
+_OLIVER_Q9_DIAB_SELECTED: Final[GradeResult] = GradeResult(is_correct=False, feedback=OLIVER_Q9["diab_selected"])
+_OLIVER_Q10_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=OLIVER_Q10["missing"])
+_OLIVER_Q11_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=OLIVER_Q11["missing"])
+_OLIVER_Q11_NO_DROP: Final[GradeResult] = GradeResult(is_correct=False, feedback=OLIVER_Q11["no_drop"])
+_OLIVER_Q11_NO_PLAN1: Final[GradeResult] = GradeResult(is_correct=False, feedback=OLIVER_Q11["no_plan1"])
+_OLIVER_Q12_DECREASE: Final[GradeResult] = GradeResult(is_correct=True, feedback=OLIVER_Q12["decrease"])
+_OLIVER_Q12_KIAB_FIRST: Final[GradeResult] = GradeResult(is_correct=False, feedback=OLIVER_Q12["kiab_first"])
+_OLIVER_Q12_INCREASE_OR_SAME: Final[GradeResult] = GradeResult(is_correct=False, feedback=OLIVER_Q12["increase_or_same"])
+_OLIVER_Q12_BORE_FIRST: Final[GradeResult] = GradeResult(is_correct=True, feedback=OLIVER_Q12["bore_first"])
+_OLIVER_Q12_OTHER: Final[GradeResult] = GradeResult(is_correct=False, feedback=OLIVER_Q12["other"])
+_BELLA_Q13_DIAB_SELECTED: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q13["diab_selected"])
+_BELLA_Q13B_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q13B["missing"])
+_BELLA_Q13B_NONE: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q13B["none"])
+_BELLA_Q13B_CORRECT: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q13B["correct"])
+_BELLA_Q14_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q14["missing"])
+_BELLA_Q14B_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q14B["missing"])
+_BELLA_Q14B_REMOVED: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q14B["removed"])
+_BELLA_Q14B_REDUCED: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q14B["reduced"])
+_BELLA_Q14B_REDUCED_BY_ONE: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q14B["reduced_by_one"])
+_BELLA_Q14B_NOT_REDUCED: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q14B["not_reduced"])
+_BELLA_Q15_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q15["missing"])
+_BELLA_Q15B_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q15B["missing"])
+_BELLA_Q15B_KEPT_SAME: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q15B["kept_same"])
+_BELLA_Q15B_ADDED_BACK: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q15B["added_back"])
+_BELLA_Q16_EARLY_STEP: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q16["early_step"])
+_BELLA_Q16_LATE_STEP: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q16["late_step"])
+_BELLA_Q16_LOWER_INTENSITY: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q16["lower_intensity"])
+_BELLA_Q16_CIAB: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q16["ciab"])
+_BELLA_Q16_CIAB_STEPS: Final[GradeResult] = GradeResult(is_correct=True, feedback=BELLA_Q16["ciab_steps"])
+_BELLA_Q16_ASSESSMENT: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q16["assessment"])
+_BELLA_Q16_OTHER: Final[GradeResult] = GradeResult(is_correct=False, feedback=BELLA_Q16["other"])
+_DIAB_Q17_COUPLE_WORDS: Final[GradeResult] = GradeResult(is_correct=True, feedback=DIAB_Q17["couple_words"])
+_DIAB_Q17_MISSING: Final[GradeResult] = GradeResult(is_correct=False, feedback=DIAB_Q17["missing"])
+_DIAB_Q17_NONE: Final[GradeResult] = GradeResult(is_correct=False, feedback=DIAB_Q17["none"])
+_DIAB_Q17_COUPLE: Final[GradeResult] = GradeResult(is_correct=True, feedback=DIAB_Q17["couple"])
+_DIAB_Q17_FOUR: Final[GradeResult] = GradeResult(is_correct=True, feedback=DIAB_Q17["four"])
+_DIAB_Q17_TOO_MANY: Final[GradeResult] = GradeResult(is_correct=False, feedback=DIAB_Q17["too_many"])
+_DIAB_Q17_ALL_REPS: Final[GradeResult] = GradeResult(is_correct=False, feedback=DIAB_Q17["all_reps"])
+
+
+# Token classes and unit words for the single-pass duration scanner
+_DIGITS: Final[frozenset] = frozenset('0123456789')
+_LETTERS: Final[frozenset] = frozenset('abcdefghijklmnopqrstuvwxyz')
+_TIME_SEPARATORS: Final[frozenset] = frozenset(":'")
+_SHORT_MINUTE_WORDS: Final[frozenset] = frozenset({'m', 'mn'})
+_LONG_MINUTE_WORDS: Final[frozenset] = frozenset({'min', 'mins', 'minute', 'minutes'})
+_MINUTE_WORDS: Final[frozenset] = _SHORT_MINUTE_WORDS | _LONG_MINUTE_WORDS
+_FULL_MINUTE_WORDS: Final[frozenset] = frozenset({'minute', 'minutes'})
+_FULL_SECOND_WORDS: Final[frozenset] = frozenset({'second', 'seconds', 'seconde', 'secondes'})
+_SECOND_WORDS: Final[frozenset] = _FULL_SECOND_WORDS | {'s', 'sec', 'secs'}
+
+
+def _to_number(text: str) -> float:
+    """
+    Convert a number from an answer: int for plain digits, float otherwise.
+
+    int() is cheaper than float() for the usual whole-second answers. Digit
+    strings too long to be exact as a float still use float(), so later
+    arithmetic on them cannot overflow.
+    """
+    if text.isdigit() and len(text) <= 15:
+        return int(text)
+    return float(text)
+
+
+def _scan_duration(duration_str: str) -> Optional[list]:
+    """
+    Split a cleaned duration string into tokens in one pass over its characters.
+
+    Tokens are numbers (digits with at most one inner '.' or ',' decimal
+    separator), words, and the punctuation ':', "'" and '"'; spaces only
+    separate tokens. Returns None as soon as anything else turns up.
+    """
+    tokens = []
+    token = ''
+    state = ''  # 'n' inside a number, 'd' right after its decimal separator, 'w' inside a word
+    for ch in duration_str:
+        if ch in _DIGITS:
+            if state == 'w':
+                tokens.append(('w', token))
+                token = ''
+            elif state == 'd':
+                state = 'f'  # fraction digits
+            token += ch
+            if state != 'f':
+                state = 'n'
+        elif ch in _LETTERS:
+            if state == 'd':
+                return None
+            if state in ('n', 'f'):
+                tokens.append(('n', token))
+                token = ''
+            token += ch
+            state = 'w'
+        elif ch in '.,' and state == 'n':
+            token += ch
+            state = 'd'
+        else:
+            if state == 'd':
+                return None
+            if state:
+                tokens.append(('w' if state == 'w' else 'n', token))
+                token = ''
+                state = ''
+            if ch in _TIME_SEPARATORS or ch == '"':
+                tokens.append((ch, ch))
+            elif ch != ' ':
+                return None
+    if state == 'd':
+        return None
+    if state:
+        tokens.append(('w' if state == 'w' else 'n', token))
+    return tokens
+
+
+def _fsm_parse_duration(duration_str: str) -> Optional[float]:
+    """
+    Parse the common duration shapes from the _scan_duration tokens.
+
+    Covers a bare number, a number with a minutes or seconds unit, "M:SS" /
+    "M'SS", "3m20" and "3 minutes 20 seconds", returning exactly what
+    _legacy_parse_duration would. Returns None for anything else (including
+    answers that do not parse), leaving those to the legacy parser.
+    """
+    tokens = _scan_duration(duration_str)
+    if not tokens:
+        return None
+    kinds = ''.join(kind for kind, _ in tokens)
+    if kinds == 'n':
+        number = tokens[0][1]
+        if ',' in number:
+            minutes, seconds = number.split(',')
+            # "2,20" is French for 2:20; longer fractions are left to the legacy parser
+            return int(minutes) * 60 + int(seconds) if len(seconds) <= 2 else None
+        return _to_number(number)
+    if kinds == 'nw':
+        number = tokens[0][1].replace(',', '.')
+        unit = tokens[1][1]
+        if unit in _MINUTE_WORDS:
+            return float(number) * 60
+        if unit in _SECOND_WORDS:
+            return float(number)
+        return None
+    if kinds in ('n:n', "n'n", 'n:n"', "n'n\""):
+        minutes, seconds = tokens[0][1], tokens[2][1]
+        if minutes.isdigit() and seconds.isdigit():
+            return _to_number(minutes) * 60 + _to_number(seconds)
+        return None
+    if kinds == 'nwn' or kinds == 'nwnw':
+        minutes, unit, seconds = tokens[0][1], tokens[1][1], tokens[2][1]
+        if not (minutes.isdigit() and seconds.isdigit()):
+            return None
+        if kinds == 'nwnw':
+            if unit in _FULL_MINUTE_WORDS and tokens[3][1] in _FULL_SECOND_WORDS:
+                return int(minutes) * 60 + int(seconds)
+        elif unit in _SHORT_MINUTE_WORDS:
+            return int(minutes) * 60 + int(seconds)
+        elif unit in _LONG_MINUTE_WORDS:
+            return float(minutes) * 60 + float(seconds)
+    return None
+
+
 def parse_duration(duration_str: str) -> Optional[float]:
     """
     Parse a duration string into seconds.
@@ -127,22 +801,60 @@ def parse_duration(duration_str: str) -> Optional[float]:
     if duration_str is None:
         return None
 
-    duration_str = str(duration_str).strip().lower()
+    return _parse_clean_duration(str(duration_str).strip().lower())
+
+
+def parse_duration_bulk(duration_strs: list) -> list:
+    """
+    parse_duration for a whole column of answers.
+
+    Each distinct cleaned answer is parsed once and the result shared by
+    every repeat, so a cohort costs one parse per unique answer.
+    """
+    parsed = {}
+    results = []
+    for duration_str in duration_strs:
+        if duration_str is None:
+            results.append(None)
+            continue
+        key = str(duration_str).strip().lower()
+        if key not in parsed:
+            parsed[key] = _parse_clean_duration(key)
+        results.append(parsed[key])
+    return results
+
+
+@lru_cache(maxsize=1024)
+def _parse_clean_duration(duration_str: str) -> Optional[float]:
+    """
+    parse_duration for a stripped, lowercased answer.
 
+    Cached, since chained questions parse the previous plan's answer again
+    and cohorts repeat the same handful of answers.
+    """
     # Check for DIAB/Door
-    if 'door' in duration_str or 'diab' in duration_str:
+    if _DIAB_RE.search(duration_str):
         return None  # Special marker for DIAB
 
+    # Common shapes are handled in one pass; anything unusual goes through the full rules
+    seconds = _fsm_parse_duration(duration_str)
+    if seconds is not None:
+        return seconds
+    return _legacy_parse_duration(duration_str)
+
+
+def _legacy_parse_duration(duration_str: str) -> Optional[float]:
+    """Rule-by-rule parser behind parse_duration for a cleaned (stripped, lowercased) answer."""
     # Handle French format: "Xminutes Y secondes" or "X minutes Y secondes" (with or without spaces)
     # Must check this BEFORE other processing
-    french_full_match = re.match(r'^(\d+)\s*minutes?\s*(\d+)\s*secondes?$', duration_str)
+    french_full_match = _RE_FRENCH_FULL.match(duration_str)
     if french_full_match:
         minutes = int(french_full_match.group(1))
         seconds = int(french_full_match.group(2))
         return minutes * 60 + seconds
 
     # Handle English format: "X minutes Y seconds" (with or without spaces)
-    eng_full_match = re.match(r'^(\d+)\s*minutes?\s*(\d+)\s*seconds?$', duration_str)
+    eng_full_match = _RE_ENG_FULL.match(duration_str)
     if eng_full_match:
         minutes = int(eng_full_match.group(1))
         seconds = int(eng_full_match.group(2))
@@ -150,14 +862,14 @@ def parse_duration(duration_str: str) -> Optional[float]:
 
     # Handle French decimal format: "0,13" or "2,20" -> treat comma as time separator (min:sec)
     # This handles cases like "0,13" meaning 13 seconds, "2,20" meaning 2:20
-    french_time_match = re.match(r'^(\d+),(\d{1,2})$', duration_str)
+    french_time_match = _RE_FRENCH_TIME.match(duration_str)
     if french_time_match:
         minutes = int(french_time_match.group(1))
         seconds = int(french_time_match.group(2))
         return minutes * 60 + seconds
 
     # Handle French shorthand: "3mn2" = 3 min 2 sec, "1m06" = 1 min 6 sec
-    shorthand_match = re.match(r'^(\d+)\s*(?:mn|m)\s*(\d+)$', duration_str)
+    shorthand_match = _RE_SHORTHAND.match(duration_str)
     if shorthand_match:
         minutes = int(shorthand_match.group(1))
         seconds = int(shorthand_match.group(2))
@@ -165,13 +877,13 @@ def parse_duration(duration_str: str) -> Optional[float]:
 
     # Check for "X minutes" or "X minute" or "Xm" or "Xmn" without seconds
     # Also handle French: "X minutes" with comma decimal
-    mins_only_match = re.match(r'^(\d+(?:[.,]\d+)?)\s*(?:minutes?|mins?|mn|m)$', duration_str)
+    mins_only_match = _RE_MINS_ONLY.match(duration_str)
     if mins_only_match:
         mins_str = mins_only_match.group(1).replace(',', '.')
         return float(mins_str) * 60
 
     # Check for "X seconds" or "Xs" or "X s" (with or without space)
-    secs_only_match = re.match(r'^(\d+(?:[.,]\d+)?)\s*(?:secondes?|seconds?|secs?|s)$', duration_str)
+    secs_only_match = _RE_SECS_ONLY.match(duration_str)
     if secs_only_match:
         secs_str = secs_only_match.group(1).replace(',', '.')
         return float(secs_str)
@@ -191,29 +903,30 @@ def parse_duration(duration_str: str) -> Optional[float]:
     duration_str = duration_str.replace("'", ':').replace('"', '')
 
     # Clean up multiple colons or spaces
-    duration_str = re.sub(r'\s+', ' ', duration_str).strip()
-    duration_str = re.sub(r':+', ':', duration_str).strip(':')
+    duration_str = _RE_WS.sub(' ', duration_str).strip()
+    duration_str = _RE_COLONS.sub(':', duration_str).strip(':')
 
     try:
         if ':' in duration_str:
             parts = duration_str.split(':')
             parts = [p.strip() for p in parts if p.strip()]
             if len(parts) == 2:
-                minutes = float(parts[0]) if parts[0] else 0
-                seconds = float(parts[1]) if parts[1] else 0
+                minutes = _to_number(parts[0]) if parts[0] else 0
+                seconds = _to_number(parts[1]) if parts[1] else 0
                 return minutes * 60 + seconds
             elif len(parts) == 1:
-                return float(parts[0])
+                return _to_number(parts[0])
         else:
             # Just a number - assume seconds if small, could be minutes if context suggests
-            value = float(duration_str.split()[0] if ' ' in duration_str else duration_str)
+            value = _to_number(duration_str.split()[0] if ' ' in duration_str else duration_str)
             return value
     except (ValueError, IndexError):
         return None
 
 
+@lru_cache(maxsize=2048)
 def format_duration(seconds: float) -> str:
-    """Format seconds as a readable duration string."""
+    """Format seconds as a readable duration string (cached: plan durations repeat a lot)."""
     if seconds < 60:
         return f"{int(seconds)} seconds"
     else:
@@ -262,86 +975,90 @@ def get_warmup_range(duration_seconds: float) -> Tuple[int, int]:
 # MAISIE GRADING (Questions 1-4)
 # =============================================================================
 
+# Maisie Plan 1 outcomes: up to 4s, up to 9s, up to 16s, up to 19s, exactly 20s,
+# otherwise up to 43s, and longer
+_Q1_OUTCOMES: Final[tuple] = tuple(
+    (MAISIE_Q1_CORRECT[key], MAISIE_Q1[key])
+    for key in ("diab_early", "too_conservative", "correct_excellent", "correct_close",
+                "correct_at_threshold", "slightly_pushy", "too_pushy")
+)
+
+
+def _after(limit: float) -> float:
+    """Smallest float above limit, turning an inclusive upper bound into the next range's start."""
+    return math.nextafter(limit, math.inf)
+
+
+# Where each _Q1_OUTCOMES bucket after the first begins; bisect_right gives the bucket
+# (NaN sorts past the end, into the last bucket, just like the original comparisons)
+_Q1_BUCKET_STARTS: Final[tuple] = (_after(4), _after(9), _after(16), _after(19), 20.0, _after(20), _after(43))
+_Q1_BUCKET_OUTCOME: Final[tuple] = (0, 1, 2, 3, 5, 4, 5, 6)  # between 19 and 20 counts as slightly pushy
+
+# Borderline zones as alternating (start, end) points: inside a zone bisect_right is odd.
+# Near 5 (DIAB threshold), near 10 (conservative threshold), near 20 (pass/fail),
+# near 43 (slightly-pushy/too-pushy); each zone includes both ends.
+_Q1_REVIEW_BOUNDS: Final[tuple] = (4.0, _after(6), 9.0, _after(11), 19.0, _after(22), 41.0, _after(45))
+
+
 def grade_maisie_q1(answer: str) -> GradeResult:
     """Grade Maisie's Plan 1 target duration. Correct: 20 seconds or less."""
-    duration = parse_duration(answer)
+    return _grade_maisie_q1(parse_duration(answer))
 
+
+def _grade_maisie_q1(duration: Optional[float]) -> GradeResult:
+    """grade_maisie_q1 for an already parsed duration."""
     if duration is None:  # DIAB selected
-        return GradeResult(
-            is_correct=False,
-            feedback="Maisie did show signs of anxiety early on, so well done! It is okay to err on the side of caution, especially when just starting out with a dog. However, for Plan 1 Maisie could have started with a target duration exercise rather than Door is a Bore."
-        )
+        return _MAISIE_Q1_DIAB_SELECTED
 
-    # Borderline zones: near 5 (DIAB threshold), near 10 (conservative threshold), near 20 (pass/fail)
-    confidence = "high"
-    if 4 <= duration <= 6:  # Near DIAB/target duration boundary
-        confidence = "review"
-    elif 9 <= duration <= 11:  # Near too-conservative boundary
-        confidence = "review"
-    elif 19 <= duration <= 22:  # Near pass/fail boundary at 20
-        confidence = "review"
-    elif 41 <= duration <= 45:  # Near slightly-pushy/too-pushy boundary
-        confidence = "review"
+    confidence = "review" if bisect_right(_Q1_REVIEW_BOUNDS, duration) & 1 else "high"
+    is_correct, feedback = _Q1_OUTCOMES[_Q1_BUCKET_OUTCOME[bisect_right(_Q1_BUCKET_STARTS, duration)]]
+    return GradeResult(is_correct=is_correct, feedback=feedback, confidence=confidence)
 
-    if duration <= 4:
-        return GradeResult(
-            is_correct=False,
-            feedback="Maisie did show signs of anxiety early on, so well done! It is okay to err on the side of caution, especially when just starting out with a dog. However, for anything under 5 seconds we'd start a dog on DIAB and in Maisie's case she does not need to start on DIAB. Maisie was doing well for the first 19 seconds of the video.",
-            confidence=confidence
-        )
-    elif duration <= 9:
-        return GradeResult(
-            is_correct=False,
-            feedback="Maisie was doing well for the first 19 seconds of the video. We start to see her struggle with those repeated yawns and lip licks starting at 20 seconds. It would have been okay to start her around 15 seconds to shave a little time off from those first signs of anxiety. However, it's always okay to err on the side of caution, especially when just starting out with a client.",
-            confidence=confidence
-        )
-    elif duration <= 16:
-        return GradeResult(
-            is_correct=True,
-            feedback="Excellent choice for Maisie's Plan 1. Maisie starts showing anxiety with repeated yawning and lip licking starting at 20 seconds. More signs of anxiety follow throughout the absence. You identified those early signs and set a safe target duration well before they appeared.",
-            confidence=confidence
-        )
-    elif duration <= 19:
-        return GradeResult(
-            is_correct=True,
-            feedback="Nice job catching that Maisie starts showing anxiety with repeated yawning and lip licking starting at 20 seconds. More signs of anxiety follow throughout the absence. Since this is your first time seeing Maisie you could even start closer to 15 seconds just to shave a little time off from where we saw those first signs of anxiety.",
-            confidence=confidence
-        )
-    elif duration == 20:
-        return GradeResult(
-            is_correct=True,
-            feedback="Nice job catching that when Maisie started yawning and lip licking around 20 seconds she was beginning to go over threshold. After that more signs of anxiety followed through the absence. Since her first yawn is 20 seconds into the absence we'd want to start her first exercise slightly before those first signs of anxiety. Starting closer to 15 seconds would be a better choice for Maisie.",
-            confidence=confidence
-        )
-    elif duration <= 43:
-        return GradeResult(
-            is_correct=False,
-            feedback="This target duration is slightly pushy. Maisie does start showing signs of anxiety pretty early on; repeated lip licks and yawns starting at 20 seconds, after which she gets up with a gruff, stretches, and looks at the door stiffly. Then she scratches and stretches. Some of these things could be okay on their own, but we are seeing an escalation of behaviors here. For Maisie, you'd want to set the target duration for Plan 1 to slightly before those very first signs of anxiety.",
-            confidence=confidence
-        )
-    else:
-        return GradeResult(
-            is_correct=False,
-            feedback="Take another look at the video for Maisie. She starts to show signs of anxiety pretty early on. Watch closely. For Maisie, you'd want to set the target duration for Plan 1 to something you're pretty certain she'll be comfortable doing - a duration that's shorter than where we see those first signs of anxiety. We are looking for less than 20 seconds.",
-            confidence=confidence
-        )
+
+def grade_maisie_q1_batch(answers: list) -> list:
+    """
+    Grade Maisie's Plan 1 for a whole cohort at once.
+
+    Returns the same GradeResults as calling grade_maisie_q1 on each answer,
+    but buckets all the durations in one NumPy pass. Without NumPy it simply
+    grades the answers one by one.
+    """
+    if not NUMPY_AVAILABLE:
+        return [grade_maisie_q1(answer) for answer in answers]
+
+    parsed = parse_duration_bulk(answers)
+    diab = np.array([duration is None for duration in parsed], dtype=bool)
+    durations = np.array([0.0 if duration is None else duration for duration in parsed], dtype=float)
+
+    # Same lookup tables as grade_maisie_q1, searched for every duration at once
+    buckets = np.take(_Q1_BUCKET_OUTCOME, np.searchsorted(_Q1_BUCKET_STARTS, durations, side='right'))
+    review = np.searchsorted(_Q1_REVIEW_BOUNDS, durations, side='right') & 1
+
+    results = []
+    for is_diab, bucket, is_review in zip(diab.tolist(), buckets.tolist(), review.tolist()):
+        if is_diab:
+            results.append(_MAISIE_Q1_DIAB_SELECTED)
+        else:
+            is_correct, feedback = _Q1_OUTCOMES[bucket]
+            results.append(GradeResult(is_correct=is_correct, feedback=feedback,
+                                       confidence="review" if is_review else "high"))
+    return results
 
 
 def grade_maisie_q2(answer: str, q1_answer: str) -> GradeResult:
     """Grade Maisie's Plan 2 target duration. Should be 10-20% increase from Plan 1."""
-    new_duration = parse_duration(answer)
-    old_duration = parse_duration(q1_answer)
+    return _grade_maisie_q2(parse_duration(answer), parse_duration(q1_answer))
 
+
+def _grade_maisie_q2(new_duration: Optional[float], old_duration: Optional[float]) -> GradeResult:
+    """grade_maisie_q2 for already parsed Plan 2 and Plan 1 durations."""
     if old_duration is None or new_duration is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Please provide a target duration for this plan."
-        )
+        return _MAISIE_INCREASE_MISSING
 
     if new_duration <= old_duration:
         return GradeResult(
             is_correct=False,
-            feedback="This is not correct. Maisie did not need to drop here. Since she aced Plan 1, you should increase the target duration.",
+            feedback=MAISIE_INCREASE["decrease"].format(previous_plan=1),
             calculation=f"Your Plan 1: {format_duration(old_duration)} -> Plan 2: {format_duration(new_duration)} (decrease)"
         )
 
@@ -362,28 +1079,28 @@ def grade_maisie_q2(answer: str, q1_answer: str) -> GradeResult:
     if increase_pct < min_pct:
         return GradeResult(
             is_correct=False,
-            feedback=f"Maisie would have been okay to push by the normal guidelines for under 2 minutes of 10-20%. This increase of {increase_pct:.1f}% is a bit conservative.",
+            feedback=MAISIE_INCREASE["conservative"].format(increase_pct=increase_pct),
             calculation=calc_str,
             confidence=confidence
         )
     elif increase_pct <= max_pct + 0.5:  # Small tolerance
         return GradeResult(
             is_correct=True,
-            feedback=f"Well done on selecting a reasonable target increase for Plan 2! This is a {increase_pct:.1f}% increase, which is correctly following the guidelines for increases to target durations under 2 minutes.",
+            feedback=MAISIE_Q2["correct"].format(increase_pct=increase_pct),
             calculation=calc_str,
             confidence=confidence
         )
     elif increase_pct <= 25:
         return GradeResult(
             is_correct=False,
-            feedback=f"You were right to increase the target duration but this increase of {increase_pct:.1f}% is a little over the guidelines for durations under 2 minutes of 10-20%. When just starting out with a dog we'd be more likely to stay within those guidelines.",
+            feedback=MAISIE_Q2["slightly_over"].format(increase_pct=increase_pct),
             calculation=calc_str,
             confidence=confidence
         )
     else:
         return GradeResult(
             is_correct=False,
-            feedback=f"The increases here are too high at {increase_pct:.1f}%. Please see the Plan Building Guidelines for target duration increases.",
+            feedback=MAISIE_INCREASE["too_high"].format(increase_pct=increase_pct),
             calculation=calc_str,
             confidence=confidence
         )
@@ -391,19 +1108,18 @@ def grade_maisie_q2(answer: str, q1_answer: str) -> GradeResult:
 
 def grade_maisie_q3(answer: str, q2_answer: str) -> GradeResult:
     """Grade Maisie's Plan 3 target duration. Should be 10-20% increase from Plan 2."""
-    new_duration = parse_duration(answer)
-    old_duration = parse_duration(q2_answer)
+    return _grade_maisie_q3(parse_duration(answer), parse_duration(q2_answer))
+
 
+def _grade_maisie_q3(new_duration: Optional[float], old_duration: Optional[float]) -> GradeResult:
+    """grade_maisie_q3 for already parsed Plan 3 and Plan 2 durations."""
     if old_duration is None or new_duration is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Please provide a target duration for this plan."
-        )
+        return _MAISIE_INCREASE_MISSING
 
     if new_duration <= old_duration:
         return GradeResult(
             is_correct=False,
-            feedback="This is not correct. Maisie did not need to drop here. Since she aced Plan 2, you should increase the target duration.",
+            feedback=MAISIE_INCREASE["decrease"].format(previous_plan=2),
             calculation=f"Your Plan 2: {format_duration(old_duration)} -> Plan 3: {format_duration(new_duration)} (decrease)"
         )
 
@@ -424,28 +1140,28 @@ def grade_maisie_q3(answer: str, q2_answer: str) -> GradeResult:
     if increase_pct < min_pct:
         return GradeResult(
             is_correct=False,
-            feedback=f"Maisie would have been okay to push by the normal guidelines for under 2 minutes of 10-20%. This increase of {increase_pct:.1f}% is a bit conservative.",
+            feedback=MAISIE_INCREASE["conservative"].format(increase_pct=increase_pct),
             calculation=calc_str,
             confidence=confidence
         )
     elif increase_pct <= max_pct + 0.5:
         return GradeResult(
             is_correct=True,
-            feedback=f"Well done on selecting another reasonable target increase for Plan 3! This is a {increase_pct:.1f}% increase, which is within the guidelines.",
+            feedback=MAISIE_Q3["correct"].format(increase_pct=increase_pct),
             calculation=calc_str,
             confidence=confidence
         )
     elif increase_pct <= 25:
         return GradeResult(
             is_correct=False,
-            feedback=f"You were right to increase the target duration but this increase of {increase_pct:.1f}% is a little over the guidelines for durations under 2 minutes of 10-20%.",
+            feedback=MAISIE_Q3["slightly_over"].format(increase_pct=increase_pct),
             calculation=calc_str,
             confidence=confidence
         )
     else:
         return GradeResult(
             is_correct=False,
-            feedback=f"The increases here are too high at {increase_pct:.1f}%. Please see the Plan Building Guidelines for target duration increases.",
+            feedback=MAISIE_INCREASE["too_high"].format(increase_pct=increase_pct),
             calculation=calc_str,
             confidence=confidence
         )
@@ -455,16 +1171,25 @@ def grade_maisie_q4(answer: str) -> GradeResult:
     """Grade Maisie short answer - after 2nd drop, owners can't get out door. Answer: DIAB."""
     answer_lower = answer.lower().strip()
 
-    if 'door' in answer_lower or 'diab' in answer_lower:
-        return GradeResult(
-            is_correct=True,
-            feedback="Good choice of DIAB to get Maisie back to acing sessions, since after the 2nd drop she struggled before the owners could even get out the door."
-        )
+    if _DIAB_RE.search(answer_lower):
+        return _MAISIE_Q4_DIAB
     else:
-        return GradeResult(
-            is_correct=False,
-            feedback="Since Maisie has already needed a couple of drops in a row and is now struggling before the owners can get out the door, we'd want to drop to something so easy she almost can't miss. Consider what would be most appropriate here."
-        )
+        return _MAISIE_Q4_NOT_DIAB
+
+
+def grade_maisie(answers: dict) -> dict:
+    """
+    Grade all of Maisie's questions (q1-q4), parsing each Plan duration only once.
+
+    Returns the same results as the individual grade_maisie_q* functions.
+    """
+    q1, q2, q3 = (parse_duration(answers.get(q_id, '')) for q_id in ('q1', 'q2', 'q3'))
+    return {
+        'q1': _grade_maisie_q1(q1),
+        'q2': _grade_maisie_q2(q2, q1),
+        'q3': _grade_maisie_q3(q3, q2),
+        'q4': grade_maisie_q4(answers.get('q4', '')),
+    }
 
 
 # =============================================================================
@@ -476,15 +1201,19 @@ def grade_minna_q5(answer: str) -> GradeResult:
     duration = parse_duration(answer)
 
     if duration is None:  # DIAB selected
-        return GradeResult(
-            is_correct=True,
-            feedback="Spot on selecting DIAB! Minna was showing anxiety before her owner got out the door."
-        )
+        return _MINNA_Q5_DIAB
     else:
-        return GradeResult(
-            is_correct=False,
-            feedback="Minna shows signs of anxiety such as pacing and whining very early on, even before the owner gets out the door. Where would you start a dog who is stressed before the owner even gets out of the door? Be sure to adjust Plans 2 and 3 accordingly."
-        )
+        return _MINNA_Q5_NOT_DIAB
+
+
+# Minna Plan 2 outcomes after DIAB: under 3 seconds, up to 6, exactly 7, and anything else
+_Q6_OUTCOMES: Final[tuple] = tuple((MINNA_Q6_CORRECT[key], MINNA_Q6[key]) for key in (
+    "too_short", "correct", "seven_seconds", "too_big_jump"
+))
+_Q6_BUCKET_STARTS: Final[tuple] = (3.0, _after(6), 7.0, _after(7))
+_Q6_BUCKET_OUTCOME: Final[tuple] = (0, 1, 3, 2, 3)  # between 6 and 7 counts as too big a jump
+# Borderline zones: near 3 sec boundary, near 6-7 boundary
+_Q6_REVIEW_BOUNDS: Final[tuple] = (2.0, _after(4), 6.0, _after(8))
 
 
 def grade_minna_q6(answer: str, q5_answer: str) -> GradeResult:
@@ -494,15 +1223,9 @@ def grade_minna_q6(answer: str, q5_answer: str) -> GradeResult:
 
     if duration is None:  # Kept DIAB
         if q5_was_diab:
-            return GradeResult(
-                is_correct=True,
-                feedback="For this assignment, we were assuming Minna completed DIAB in Plan 1 (repeating step 10 up to 5 seconds outside the door). You didn't need to choose DIAB for Plan 2, as that would be overly conservative, but it's acceptable."
-            )
+            return _MINNA_Q6_KEPT_DIAB
         else:
-            return GradeResult(
-                is_correct=False,
-                feedback="Please provide a target duration for Plan 2."
-            )
+            return _MINNA_Q6_MISSING
 
     # If they didn't do DIAB for Q5, this is more complex - use ECF
     if not q5_was_diab:
@@ -516,43 +1239,52 @@ def grade_minna_q6(answer: str, q5_answer: str) -> GradeResult:
             if 10 <= increase_pct <= 20.5:
                 return GradeResult(
                     is_correct=True,
-                    feedback=f"This is a {increase_pct:.1f}% increase from Plan 1, which follows the guidelines.",
+                    feedback=MINNA_Q6["within_guidelines"].format(increase_pct=increase_pct),
                     calculation=f"Plan 1: {format_duration(q5_duration)} -> Plan 2: {format_duration(duration)}",
                     confidence=confidence
                 )
 
-    # Borderline zones for post-DIAB durations
-    confidence = "high"
-    if 2 <= duration <= 4:  # Near 3 sec boundary
-        confidence = "review"
-    elif 6 <= duration <= 8:  # Near 6-7 boundary
-        confidence = "review"
-
     # Standard grading for post-DIAB
-    if duration < 3:
-        return GradeResult(
-            is_correct=False,
-            feedback="There is some trainer's choice once the dog has been able to do 1 sec in DIAB. Nice job not jumping up too high. We do recommend continuing with DIAB format for anything under 5 seconds. For instance, you'd repeat step 10 building up in 1sec increments to 5sec.",
-            confidence=confidence
-        )
-    elif duration <= 6:
-        return GradeResult(
-            is_correct=True,
-            feedback="Nice progression of increases following DIAB! There is some trainer's choice once the dog has been able to do 1 sec with the owner outside the door in DIAB.",
-            confidence=confidence
-        )
-    elif duration == 7:
-        return GradeResult(
-            is_correct=False,
-            feedback="There is some trainer's choice once the dog has been able to do 1 sec with the owner outside the door in DIAB. The first target duration exercise after DIAB would typically start at 5 sec. If you built up to 5sec in DIAB format, you might get away with 7 sec but we don't want to push our luck.",
-            confidence=confidence
-        )
-    else:
-        return GradeResult(
-            is_correct=False,
-            feedback="There is some trainer's choice once the dog has been able to do 1 sec with the owner outside the door in DIAB. You can repeat step 10 building up in 1sec increments to 5sec or try 3sec then switch to a target duration. Either way, this would be too big of a jump for Plan 2.",
-            confidence=confidence
-        )
+    confidence = "review" if bisect_right(_Q6_REVIEW_BOUNDS, duration) & 1 else "high"
+    is_correct, feedback = _Q6_OUTCOMES[_Q6_BUCKET_OUTCOME[bisect_right(_Q6_BUCKET_STARTS, duration)]]
+    return GradeResult(is_correct=is_correct, feedback=feedback, confidence=confidence)
+
+
+@lru_cache(maxsize=16)
+def _pct_review_bounds(min_pct: float, max_pct: float) -> tuple:
+    """Review windows within 2% of either guideline boundary, as bisect bounds (see _Q1_REVIEW_BOUNDS)."""
+    return (min_pct - 2, _after(min_pct + 2), max_pct - 2, _after(max_pct + 2))
+
+
+def _grade_pct_band(increase_pct: float, bucket_starts: tuple, outcomes: tuple,
+                    calculation: str, confidence: str, **fields) -> GradeResult:
+    """
+    Grade a percentage increase against a band table.
+
+    outcomes holds an (is_correct, feedback template) pair per band, and
+    bucket_starts where each band after the first begins, as in _Q10_OUTCOMES.
+    Templates get increase_pct plus any extra fields.
+    """
+    is_correct, template = outcomes[bisect_right(bucket_starts, increase_pct)]
+    return GradeResult(
+        is_correct=is_correct,
+        feedback=template.format(increase_pct=increase_pct, **fields),
+        calculation=calculation,
+        confidence=confidence
+    )
+
+
+# Minna Plan 3 outcomes by percentage increase: below the guideline (2% tolerance),
+# up to 5% over it (short durations), and higher
+_Q7_OUTCOMES: Final[tuple] = (
+    (False, MINNA_Q7["conservative"]), (True, MINNA_Q7["correct"]), (False, MINNA_Q7["too_high"])
+)
+
+
+@lru_cache(maxsize=16)
+def _q7_bucket_starts(min_pct: float, max_pct: float) -> tuple:
+    """Where each _Q7_OUTCOMES band after the first begins, for one guideline range."""
+    return (min_pct - 2, _after(max_pct + 5))
 
 
 def grade_minna_q7(answer: str, q6_answer: str) -> GradeResult:
@@ -570,33 +1302,27 @@ def grade_minna_q7(answer: str, q6_answer: str) -> GradeResult:
         if new_duration and 5 <= new_duration <= 6:
             return GradeResult(
                 is_correct=True,
-                feedback="Nice increase from DIAB to Plan 3. For this assignment, we were assuming Minna completed DIAB in Plan 1.",
+                feedback=MINNA_Q7["after_diab_correct"],
                 confidence=confidence
             )
         elif new_duration and new_duration < 5:
             return GradeResult(
                 is_correct=False,
-                feedback="We recommend continuing with DIAB format for anything under 5 seconds.",
+                feedback=MINNA_Q7["after_diab_too_short"],
                 confidence=confidence
             )
         else:
             return GradeResult(
                 is_correct=False,
-                feedback="This is too big of a jump after DIAB.",
+                feedback=MINNA_Q7["after_diab_too_big_jump"],
                 confidence=confidence
             )
 
     if new_duration is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Minna doesn't need DIAB at this point. Please provide a target duration."
-        )
+        return _MINNA_Q7_MISSING
 
     if new_duration <= old_duration:
-        return GradeResult(
-            is_correct=False,
-            feedback="Minna aced Plan 2, so you should increase the target duration for Plan 3."
-        )
+        return _MINNA_Q7_NO_INCREASE
 
     increase_pct = calculate_percentage_increase(old_duration, new_duration)
     min_pct, max_pct = get_guideline_range(old_duration)
@@ -604,9 +1330,7 @@ def grade_minna_q7(answer: str, q6_answer: str) -> GradeResult:
     calc_str = f"Your Plan 2: {format_duration(old_duration)} -> Plan 3: {format_duration(new_duration)} = {increase_pct:.1f}% increase"
 
     # Flag for review if near percentage boundaries
-    confidence = "high"
-    if abs(increase_pct - min_pct) <= 2 or abs(increase_pct - max_pct) <= 2:
-        confidence = "review"
+    confidence = "review" if bisect_right(_pct_review_bounds(min_pct, max_pct), increase_pct) & 1 else "high"
 
     # For very short durations, be more lenient since small absolute changes = big percentages
     if old_duration <= 6:
@@ -616,32 +1340,17 @@ def grade_minna_q7(answer: str, q6_answer: str) -> GradeResult:
         if new_duration <= 8:
             return GradeResult(
                 is_correct=True,
-                feedback="Nice job selecting an appropriate increase for Plan 3. For such short durations, small absolute increases are appropriate.",
+                feedback=MINNA_Q7["short_duration"],
                 calculation=calc_str,
                 confidence=confidence
             )
 
-    if increase_pct < min_pct - 2:  # Some tolerance for short durations
-        return GradeResult(
-            is_correct=False,
-            feedback=f"This increase of {increase_pct:.1f}% is a bit conservative.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    elif increase_pct <= max_pct + 5:  # More tolerance for short durations
-        return GradeResult(
-            is_correct=True,
-            feedback=f"Nice job selecting an appropriate increase for Plan 3.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    else:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"You selected quite a jump from Plan 2 at {increase_pct:.1f}%. This might be more than Minna can cope with.",
-            calculation=calc_str,
-            confidence=confidence
-        )
+    return _grade_pct_band(increase_pct, _q7_bucket_starts(min_pct, max_pct), _Q7_OUTCOMES, calc_str, confidence)
+
+
+# Minna Q8: the first number (optionally a percentage), and words suggesting a bigger push
+_PCT_RE: Final[re.Pattern] = re.compile(r'(\d+(?:\.\d+)?)\s*%?')
+_PUSH_RE: Final[re.Pattern] = re.compile(r'higher|more|15|20|push')
 
 
 def grade_minna_q8(answer: str) -> GradeResult:
@@ -652,111 +1361,64 @@ def grade_minna_q8(answer: str) -> GradeResult:
     if 'minute' in answer_lower or ':' in answer_lower:
         # They gave an actual duration - try to figure out the percentage
         # 8 minutes = 480 seconds, 10% would be 528 seconds (8:48)
-        return GradeResult(
-            is_correct=False,
-            feedback="This question is asking what percentage you would increase by, not the actual target duration. Since Minna has been acing session after session, this is a good time to test out pushing a little higher than the guidelines."
-        )
+        return _MINNA_Q8_GAVE_DURATION
 
     # Try to extract a percentage
-    numbers = re.findall(r'(\d+(?:\.\d+)?)\s*%?', answer_lower)
+    numbers = _PCT_RE.findall(answer_lower)
 
     if numbers:
         pct = float(numbers[0])
         if pct > 10 and pct <= 20:
-            return GradeResult(
-                is_correct=True,
-                feedback="Excellent choice for Minna's next push! Since she is acing session after session this is a good time to test out pushing a little higher than the guidelines."
-            )
+            return _MINNA_Q8_CORRECT
         elif pct <= 10:
-            return GradeResult(
-                is_correct=False,
-                feedback="Since Minna has been acing session after session, this is a good time to test out pushing a little higher than the guidelines. What might we try instead when a dog is consistently acing sessions?"
-            )
+            return _MINNA_Q8_TOO_LOW
         else:
-            return GradeResult(
-                is_correct=False,
-                feedback="Since Minna is acing session after session this is a good time to test out pushing a little higher than the guidelines. Nice job thinking to do that, however, we don't want to risk pushing too high. An increase around 15-20% would be good here."
-            )
+            return _MINNA_Q8_TOO_HIGH
 
     # Check for keywords suggesting higher push
-    if any(word in answer_lower for word in ['higher', 'more', '15', '20', 'push']):
-        return GradeResult(
-            is_correct=True,
-            feedback="Excellent choice! Since she is acing session after session this is a good time to test out pushing a little higher than the guidelines."
-        )
+    if _PUSH_RE.search(answer_lower):
+        return _MINNA_Q8_PUSH_KEYWORDS
 
-    return GradeResult(
-        is_correct=False,
-        feedback="Since Minna has been acing session after session, this is a good time to test out pushing a little higher than the guidelines. What might we try instead when a dog is consistently acing sessions?"
-    )
+    return _MINNA_Q8_OTHER
 
 
 # =============================================================================
 # OLIVER GRADING (Questions 9-12)
 # =============================================================================
 
+# Oliver Plan 1 outcomes by minutes: under 1, under 4, under 4.75, up to 5.5, up to 6.15,
+# up to 6.25, and longer; each bucket after the first starts at _Q9_BUCKET_STARTS
+_Q9_OUTCOMES: Final[tuple] = tuple((OLIVER_Q9_CORRECT[key], OLIVER_Q9[key]) for key in (
+    "under_1_minute", "under_4_minutes", "cautious", "excellent", "shaved_time", "slightly_high", "too_high"
+))
+_Q9_BUCKET_STARTS: Final[tuple] = (1.0, 4.0, 4.75, _after(5.5), _after(6.15), _after(6.25))
+# Borderline zones (in minutes): near 4 min, near 6.15 min
+_Q9_REVIEW_BOUNDS: Final[tuple] = (3.75, _after(4.25), 5.9, _after(6.3))
+
+
 def grade_oliver_q9(answer: str) -> GradeResult:
     """Grade Oliver's Plan 1. Correct: 4:00 to 6:09 (video is ~5.5 min, dog does well)."""
     duration = parse_duration(answer)
 
     if duration is None:  # DIAB selected
-        return GradeResult(
-            is_correct=False,
-            feedback="Oliver did not need to start on Door is a Bore. He did well throughout the video. What would be a good target duration to start him on?"
-        )
+        return _OLIVER_Q9_DIAB_SELECTED
 
     # Convert to minutes for easier comparison
     minutes = duration / 60
 
-    # Borderline zones (in minutes): near 4 min, near 6.15 min
-    confidence = "high"
-    if 3.75 <= minutes <= 4.25:  # Near 4 minute boundary
-        confidence = "review"
-    elif 5.9 <= minutes <= 6.3:  # Near upper boundary
-        confidence = "review"
+    confidence = "review" if bisect_right(_Q9_REVIEW_BOUNDS, minutes) & 1 else "high"
+    is_correct, feedback = _Q9_OUTCOMES[bisect_right(_Q9_BUCKET_STARTS, minutes)]
+    return GradeResult(is_correct=is_correct, feedback=feedback, confidence=confidence)
 
-    if minutes < 1:
-        return GradeResult(
-            is_correct=False,
-            feedback="It's okay for dogs to move around and to walk to the door to watch. This game of going and coming is different, so we will often see this, especially in earlier stages of training even when dogs are not upset. Oliver settled and looked pretty relaxed; He walks toward the door at a normal pace (not frantic), turns his head and moves a bit when he's at the door (so he's not frozen), has alert but soft eyes and soft mouth, and he sits. All that said, Oliver did well here, so what would a good target duration be to start him on?",
-            confidence=confidence
-        )
-    elif minutes < 4:
-        return GradeResult(
-            is_correct=False,
-            feedback="It's okay for dogs to move around and to walk to the door to watch. This game of going and coming is different, so we will often see this, especially in earlier stages of training even when dogs are not upset. Oliver settled and looked pretty relaxed. His Plan 1 target duration could have been closer to the 5-minute range. Take another look at the video.",
-            confidence=confidence
-        )
-    elif minutes < 4.75:
-        return GradeResult(
-            is_correct=True,
-            feedback="It's okay for dogs to move around and to walk to the door to watch. Oliver settled and looked pretty relaxed. His Plan 1 target duration could have been closer to the 5-minute range, but it's best to err on the side of caution!",
-            confidence=confidence
-        )
-    elif minutes <= 5.5:
-        return GradeResult(
-            is_correct=True,
-            feedback="Well done recognizing that Oliver did well for the duration of this exercise! It's okay for dogs to move around and go to the door, as long as there aren't signs of anxiety. You chose an excellent starting duration for Plan 1.",
-            confidence=confidence
-        )
-    elif minutes <= 6.15:
-        return GradeResult(
-            is_correct=True,
-            feedback="Well done recognizing that Oliver did well for the duration of this exercise! It's okay for dogs to move around and go to the door, as long as there aren't signs of anxiety. Since this is an assessment, it was smart that you chose to shave some time off for the first exercise, just in case this happened to be a really good day for Oliver.",
-            confidence=confidence
-        )
-    elif minutes <= 6.25:
-        return GradeResult(
-            is_correct=False,
-            feedback="Well done recognizing that Oliver did well for the duration of this exercise! It's okay for dogs to move around and go to the door, as long as there aren't signs of anxiety. The starting target is a little high though with a push over 10% when just starting with Oliver and if this was an assessment, it would be a good idea to shave some time off for the first exercise instead of push.",
-            confidence=confidence
-        )
-    else:
-        return GradeResult(
-            is_correct=False,
-            feedback="Well done recognizing that Oliver did well for the duration of this exercise! However, the duration increase from the video is too high and since you are just starting with Oliver, it would be better to shave some time off for the first exercise, just in case this happened to be a really good day for Oliver.",
-            confidence=confidence
-        )
+
+# Oliver Plan 2 outcomes by percentage increase (over 2 minutes, so the 5-10% guideline):
+# under 4%, up to 10.5% (small tolerance), up to 15%, and higher
+_Q10_OUTCOMES: Final[tuple] = tuple((OLIVER_Q10_CORRECT[key], OLIVER_Q10[key]) for key in (
+    "conservative", "correct", "slightly_over", "too_high"
+))
+_Q10_BUCKET_STARTS: Final[tuple] = (4.0, _after(10.5), _after(15))
+# Review within 2% of the 5% and 10% boundaries, or just over the guideline (up to 13%)
+_Q10_REVIEW_BOUNDS: Final[tuple] = (3.0, _after(7), 8.0, _after(13))
 
 
 def grade_oliver_q10(answer: str, q9_answer: str) -> GradeResult:
@@ -765,80 +1427,77 @@ def grade_oliver_q10(answer: str, q9_answer: str) -> GradeResult:
     old_duration = parse_duration(q9_answer)
 
     if old_duration is None or new_duration is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Please provide a target duration for this plan."
-        )
+        return _OLIVER_Q10_MISSING
 
     if new_duration <= old_duration:
         return GradeResult(
             is_correct=False,
-            feedback="Oliver did well with Plan 1, so you should increase the target duration for Plan 2.",
+            feedback=OLIVER_Q10["no_increase"],
             calculation=f"Your Plan 1: {format_duration(old_duration)} -> Plan 2: {format_duration(new_duration)}"
         )
 
     increase_pct = calculate_percentage_increase(old_duration, new_duration)
     calc_str = f"Your Plan 1: {format_duration(old_duration)} -> Plan 2: {format_duration(new_duration)} = {increase_pct:.1f}% increase"
 
-    # Flag for review if within 2% of boundaries (5% or 10%)
-    confidence = "high"
-    if abs(increase_pct - 5) <= 2:  # Near lower boundary
-        confidence = "review"
-    elif abs(increase_pct - 10) <= 2:  # Near upper boundary
-        confidence = "review"
-    elif 10 < increase_pct <= 13:  # Just over the guideline
-        confidence = "review"
+    confidence = "review" if bisect_right(_Q10_REVIEW_BOUNDS, increase_pct) & 1 else "high"
+    return _grade_pct_band(increase_pct, _Q10_BUCKET_STARTS, _Q10_OUTCOMES, calc_str, confidence)
 
-    # Oliver is over 2 minutes, so 5-10% guideline
-    if increase_pct < 4:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"It would have been okay to follow the guidelines here and push by 5-10% for Plan 2. This {increase_pct:.1f}% increase is a bit conservative.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    elif increase_pct <= 10.5:  # Small tolerance
-        return GradeResult(
-            is_correct=True,
-            feedback=f"Excellent progress of duration to Plan 2! This is a {increase_pct:.1f}% increase from Oliver's Plan 1 target duration, which is correctly following the guidelines for increases to target durations over 2 minutes.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    elif increase_pct <= 15:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"The increase from Plan 1 to Plan 2 is a tad higher than the guideline of 5-10% for durations over 2 min at {increase_pct:.1f}%. When just starting out with a dog we'd be more likely to stay within those guidelines.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    else:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"The increase to Plan 2 is too high at {increase_pct:.1f}%. Please see the Plan Building Guidelines as a refresher.",
-            calculation=calc_str,
-            confidence=confidence
-        )
+
+def grade_oliver_q10_batch(answers: list, q9_answers: list) -> list:
+    """
+    Grade Oliver's Plan 2 for a whole cohort at once.
+
+    Returns the same GradeResults as calling grade_oliver_q10 on each pair of
+    answers, but works out and buckets all the percentage increases in one
+    NumPy pass. Missing answers, non-increases and a zero Plan 1 go through
+    grade_oliver_q10 itself. Without NumPy every answer does.
+    """
+    if not NUMPY_AVAILABLE:
+        return [grade_oliver_q10(answer, q9_answer) for answer, q9_answer in zip(answers, q9_answers)]
+
+    results = [None] * len(answers)
+    rows, olds, news = [], [], []
+    for i, (answer, q9_answer, new_duration, old_duration) in enumerate(
+            zip(answers, q9_answers, parse_duration_bulk(answers), parse_duration_bulk(q9_answers))):
+        if old_duration is None or new_duration is None or new_duration <= old_duration or old_duration == 0:
+            results[i] = grade_oliver_q10(answer, q9_answer)
+        else:
+            rows.append(i)
+            olds.append(old_duration)
+            news.append(new_duration)
+
+    if rows:
+        old_arr = np.array(olds, dtype=float)
+        # Same arithmetic as calculate_percentage_increase (a zero Plan 1 was graded above)
+        pcts = (np.array(news, dtype=float) - old_arr) / old_arr * 100
+        buckets = np.searchsorted(_Q10_BUCKET_STARTS, pcts, side='right')
+        review = np.searchsorted(_Q10_REVIEW_BOUNDS, pcts, side='right') & 1
+
+        for i, old_duration, new_duration, increase_pct, bucket, is_review in zip(
+                rows, olds, news, pcts.tolist(), buckets.tolist(), review.tolist()):
+            is_correct, template = _Q10_OUTCOMES[bucket]
+            results[i] = GradeResult(
+                is_correct=is_correct,
+                feedback=template.format(increase_pct=increase_pct),
+                calculation=f"Your Plan 1: {format_duration(old_duration)} -> Plan 2: {format_duration(new_duration)} = {increase_pct:.1f}% increase",
+                confidence="review" if is_review else "high"
+            )
+    return results
 
 
 def grade_oliver_q11(answer: str, q9_answer: str, q10_answer: str) -> GradeResult:
     """Grade Oliver's Plan 3. Oliver struggled with Plan 2, so should drop back to Plan 1 duration."""
     new_duration = parse_duration(answer)
-    q9_duration = parse_duration(q9_answer)
-    q10_duration = parse_duration(q10_answer)
 
     if new_duration is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Oliver struggled with Plan 2 but doesn't need DIAB. Please provide a target duration."
-        )
+        return _OLIVER_Q11_MISSING
 
+    q10_duration = parse_duration(q10_answer)
     if q10_duration and new_duration >= q10_duration:
-        return GradeResult(
-            is_correct=False,
-            feedback="Oliver struggled with his Plan 2 exercise so we would not want to stick or push. What do we do when a dog struggles?"
-        )
+        return _OLIVER_Q11_NO_DROP
 
     # Should drop back to Q9 answer
+    q9_duration = parse_duration(q9_answer)
     if q9_duration:
         # Borderline: near the 5 second tolerance boundary
         confidence = "high"
@@ -850,152 +1509,105 @@ def grade_oliver_q11(answer: str, q9_answer: str, q10_answer: str) -> GradeResul
         if diff <= 5:
             return GradeResult(
                 is_correct=True,
-                feedback="Excellent job dropping back to the target duration from the last successful exercise when Oliver struggled! This is the rule of thumb for a first drop.",
+                feedback=OLIVER_Q11["correct"],
                 confidence=confidence
             )
         elif new_duration < q9_duration:
             return GradeResult(
                 is_correct=False,
-                feedback=f"Great job selecting a drop here. But what should we be aiming to drop back to on the first drop? The rule of thumb is to go back to the last successful target duration, which was {format_duration(q9_duration)}.",
+                feedback=OLIVER_Q11["below_last_success"].format(last_success=format_duration(q9_duration)),
                 confidence=confidence
             )
         else:
             return GradeResult(
                 is_correct=False,
-                feedback="This is not correctly following the protocol for a dog's first drop. When a dog struggles, we drop back to the last successful target duration.",
+                feedback=OLIVER_Q11["above_last_success"],
                 confidence=confidence
             )
 
-    return GradeResult(
-        is_correct=False,
-        feedback="Oliver struggled with Plan 2, so we need to drop. The rule of thumb is to drop back to the last successful exercise."
-    )
+    return _OLIVER_Q11_NO_PLAN1
+
+
+# Oliver Q12 answer keywords (substring matches, like the 'in' checks they replace)
+_KEYS_DECREASE_RE: Final[re.Pattern] = re.compile(r'decrease|drop|lower|reduce')
+_KEYS_KIAB_RE: Final[re.Pattern] = re.compile(r'key is a bore|kiab')
+_KEYS_INCREASE_RE: Final[re.Pattern] = re.compile(r'increase|same')
+_KEYS_FIRST_RE: Final[re.Pattern] = re.compile(r'first|try')
 
 
 def grade_oliver_q12(answer: str) -> GradeResult:
     """Grade Oliver keys question. Should decrease duration when testing keys."""
-    answer_lower = answer.lower().strip()
-
-    if 'decrease' in answer_lower or 'drop' in answer_lower or 'lower' in answer_lower or 'reduce' in answer_lower:
-        return GradeResult(
-            is_correct=True,
-            feedback="Great choice to drop the target duration down when testing out reintroducing the keys. This gives Oliver the best chance of success with this previously triggering cue."
-        )
-    elif 'key is a bore' in answer_lower or 'kiab' in answer_lower:
-        return GradeResult(
-            is_correct=False,
-            feedback="Before going right to the Key is A Bore, what can we do with the TD to retest the keys since there is a chance that they will no longer be an issue now that we've built up some solid duration?"
-        )
-    elif 'increase' in answer_lower or 'same' in answer_lower:
-        return GradeResult(
-            is_correct=False,
-            feedback="When testing out adding a previously anxiety-provoking pre-departure cue we'd want to decrease the TD."
-        )
+    answer_lower = answer.lower()  # substring checks only, so surrounding whitespace never matters
+
+    if _KEYS_DECREASE_RE.search(answer_lower):
+        return _OLIVER_Q12_DECREASE
+    elif _KEYS_KIAB_RE.search(answer_lower):
+        return _OLIVER_Q12_KIAB_FIRST
+    elif _KEYS_INCREASE_RE.search(answer_lower):
+        return _OLIVER_Q12_INCREASE_OR_SAME
     else:
         # Check if they mentioned both decrease and KIAB
-        if 'bore' in answer_lower and ('first' in answer_lower or 'try' in answer_lower):
-            return GradeResult(
-                is_correct=True,
-                feedback="Great choice to drop the target duration down when testing out reintroducing the keys."
-            )
-        return GradeResult(
-            is_correct=False,
-            feedback="When testing out adding a previously anxiety-provoking pre-departure cue, what would you do with the target duration?"
-        )
+        if 'bore' in answer_lower and _KEYS_FIRST_RE.search(answer_lower):
+            return _OLIVER_Q12_BORE_FIRST
+        return _OLIVER_Q12_OTHER
 
 
 # =============================================================================
 # BELLA GRADING (Questions 13-17)
 # =============================================================================
 
+# Warmup / repetition counts (first number in the answer) and Car is a Bore step numbers
+_NUMBER_RE: Final[re.Pattern] = re.compile(r'\d+')
+_STEP_RE: Final[re.Pattern] = re.compile(r'step\s*(\d+)')
+
+
+def _first_int(text: str) -> Optional[int]:
+    """First whole number in text (the start of a range like "5-8"), or None if there is none."""
+    match = _NUMBER_RE.search(text)
+    return int(match.group()) if match else None
+
+
+def _parse_warmups(answer: str) -> Optional[int]:
+    """Number of warmup steps in a warmup answer: 0 for "none", else its first number, or None."""
+    answer_lower = answer.lower().strip()
+    if 'none' in answer_lower or answer_lower == '0':
+        return 0
+    # Take the first number, or if there's a range like "5-8", take the first
+    return _first_int(answer)
+
+
+# Bella Plan 1 outcomes by minutes: under 1.5, under 2.5, under 2:40, up to 3:04, 3:05-3:09,
+# 3:10, up to 3:24, and longer; each bucket after the first starts at _Q13_BUCKET_STARTS
+_Q13_OUTCOMES: Final[tuple] = tuple((BELLA_Q13_CORRECT[key], BELLA_Q13[key]) for key in (
+    "well_under", "under", "excellent", "great", "close_to_whine", "at_whine", "slightly_over", "too_high"
+))
+_Q13_BUCKET_STARTS: Final[tuple] = (1.5, 2.5, 2.67, _after(3.07), _after(3.15), _after(3.17), _after(3.4))
+# Borderline zones: near 2:30-2:40 and near 3:10
+_Q13_REVIEW_BOUNDS: Final[tuple] = (2.4, _after(2.7), 3.05, _after(3.25))
+
+
 def grade_bella_q13(answer: str) -> GradeResult:
     """Grade Bella's Plan 1. Correct: 2:30 to 3:10 (first whine at 3:10 into absence)."""
     duration = parse_duration(answer)
 
     if duration is None:  # DIAB selected
-        return GradeResult(
-            is_correct=False,
-            feedback="Bella does not need to start on Door is a Bore. She does well for a good portion of the absence. What would be a good target duration to start her on?"
-        )
+        return _BELLA_Q13_DIAB_SELECTED
 
     minutes = duration / 60
-
-    # Borderline zones: near 2:30 (150 sec), near 3:10 (190 sec)
-    confidence = "high"
-    if 2.4 <= minutes <= 2.7:  # Near 2:30-2:40 boundary
-        confidence = "review"
-    elif 3.05 <= minutes <= 3.25:  # Near 3:10 boundary
-        confidence = "review"
-
-    if minutes < 1.5:
-        return GradeResult(
-            is_correct=False,
-            feedback="Bella actually does well for a good portion of the absence, she is watching the door and alert, but the rest of her body language is pretty relaxed. She does turn her head at the 1:26 min mark in the video, we will see dogs move around when training which can be normal. Take another peek at the video. Do you see where Bella goes from alert but settled to starting to become anxious? We want to set our first target duration to just before those first signs of anxiety start.",
-            confidence=confidence
-        )
-    elif minutes < 2.5:
-        return GradeResult(
-            is_correct=False,
-            feedback="Bella actually does well for a good portion of the absence. At the 3:14 timestamp, she goes off camera, whines, and comes back. This is followed by escalating signs of anxiety through the remainder of the absence. A target duration just slightly less than 3 minutes would have been a good choice for Bella, but it is always better to err on the side of caution, especially when just starting out with a dog.",
-            confidence=confidence
-        )
-    elif minutes < 2.67:  # 2:40
-        return GradeResult(
-            is_correct=True,
-            feedback="Excellent job spotting where Bella started to get anxious around the 3-minute time stamp. Good call to shave some time off for her first target duration to be safe. The amount we choose to shave off can vary based on different factors.",
-            confidence=confidence
-        )
-    elif minutes <= 3.07:  # Up to 3:04
-        return GradeResult(
-            is_correct=True,
-            feedback="Great starting target for Plan 1 since after Bella quickly trots off and whines more signs of anxiety follow.",
-            confidence=confidence
-        )
-    elif minutes <= 3.15:  # 3:05-3:09
-        return GradeResult(
-            is_correct=True,
-            feedback="Good job noticing that after Bella whines she escalates with more signs of anxiety. You might even want to start closer to 3 minutes or slightly before since after Bella quickly trots off more signs of anxiety follow.",
-            confidence=confidence
-        )
-    elif minutes <= 3.17:  # 3:10
-        return GradeResult(
-            is_correct=True,
-            feedback="Good job noticing that after Bella whines she escalates with more signs of anxiety. Since she whines 3:10 into the absence we'd want to start her first exercise before those first signs of anxiety. Starting closer to 3 minutes or a little before to shave some time off would be a better choice for Bella.",
-            confidence=confidence
-        )
-    elif minutes <= 3.4:  # Up to 3:24
-        return GradeResult(
-            is_correct=False,
-            feedback="Bella started to show first signs of stress before this duration. Remember, we want to go off total absence time, not the time stamp, and the owner left 14 seconds into the video. You'd want to select a target duration for Plan 1 that is slightly shorter than when Bella started to show those first signs of anxiety.",
-            confidence=confidence
-        )
-    else:
-        return GradeResult(
-            is_correct=False,
-            feedback="Take another look at Bella's video. Do you see or hear any signs of stress, and if so, how long into the absence do they begin? You'd want to select a target duration for Plan 1 that is slightly shorter than that, shaving off some time to play it safe.",
-            confidence=confidence
-        )
+    confidence = "review" if bisect_right(_Q13_REVIEW_BOUNDS, minutes) & 1 else "high"
+    is_correct, feedback = _Q13_OUTCOMES[bisect_right(_Q13_BUCKET_STARTS, minutes)]
+    return GradeResult(is_correct=is_correct, feedback=feedback, confidence=confidence)
 
 
 def grade_bella_q13b(answer: str, q13_answer: str) -> GradeResult:
     """Grade Bella's warmups for Plan 1. Should be 4-7 for duration between 1-5 minutes."""
-    q13_duration = parse_duration(q13_answer)
+    return _grade_bella_q13b(_parse_warmups(answer), parse_duration(q13_answer))
 
-    # Try to extract number from answer
-    answer_lower = answer.lower().strip()
 
-    if 'none' in answer_lower or answer_lower == '0':
-        warmups = 0
-    else:
-        numbers = re.findall(r'\d+', answer)
-        if numbers:
-            # Take the first number, or if there's a range like "5-8", take the first
-            warmups = int(numbers[0])
-        else:
-            return GradeResult(
-                is_correct=False,
-                feedback="Please provide a number of warmup steps."
-            )
+def _grade_bella_q13b(warmups: Optional[int], q13_duration: Optional[float]) -> GradeResult:
+    """grade_bella_q13b for an already parsed warmup count and Plan 1 duration."""
+    if warmups is None:
+        return _BELLA_Q13B_MISSING
 
     # Determine correct range based on their Q13 duration
     if q13_duration:
@@ -1005,141 +1617,103 @@ def grade_bella_q13b(answer: str, q13_answer: str) -> GradeResult:
         min_warmups, max_warmups = (4, 7)
 
     if warmups == 0:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"For target durations between 1 and 5 minutes, we should include some warmup steps. What would be an appropriate number of warmups for Bella's duration?"
-        )
+        return _BELLA_Q13B_NONE
     elif warmups < min_warmups:
         return GradeResult(
             is_correct=False,
-            feedback=f"This number of warmups is a bit low for a target duration in this range. The guidelines suggest {min_warmups}-{max_warmups} warmup steps."
+            feedback=BELLA_Q13B["too_few"].format(min_warmups=min_warmups, max_warmups=max_warmups)
         )
     elif warmups <= max_warmups:
-        return GradeResult(
-            is_correct=True,
-            feedback=f"Good job following the warmup guidelines for a target duration between 1 and 5 minutes."
-        )
+        return _BELLA_Q13B_CORRECT
     else:
         return GradeResult(
             is_correct=False,
-            feedback=f"This number of warmups is outside of the guidelines for a target duration between 1 and 5 minutes. The guidelines suggest {min_warmups}-{max_warmups} warmup steps."
+            feedback=BELLA_Q13B["outside_guidelines"].format(min_warmups=min_warmups, max_warmups=max_warmups)
         )
 
 
+# Bella Plan 2 and Plan 3 outcomes by percentage increase: below the guideline (1% tolerance),
+# within it (0.5% tolerance), up to 3% over it, and higher; Plan 3 has no "slightly over" band
+_Q14_OUTCOMES: Final[tuple] = (
+    (False, BELLA_Q14["conservative"]), (True, BELLA_Q14["correct"]),
+    (False, BELLA_Q14["slightly_over"]), (False, BELLA_Q14["too_high"])
+)
+_Q15_OUTCOMES: Final[tuple] = (
+    (False, BELLA_Q15["conservative"]), (True, BELLA_Q15["correct"]),
+    (False, BELLA_Q15["too_high"]), (False, BELLA_Q15["too_high"])
+)
+
+
+@lru_cache(maxsize=16)
+def _bella_pct_bounds(min_pct: float, max_pct: float) -> tuple:
+    """
+    Band starts for _Q14_OUTCOMES/_Q15_OUTCOMES and review bounds, for one guideline range.
+
+    Review covers within 2% of the lower boundary, and from 2% under the upper
+    boundary to 3% over it.
+    """
+    bucket_starts = (min_pct - 1, _after(max_pct + 0.5), _after(max_pct + 3))
+    review_bounds = (min_pct - 2, _after(min_pct + 2), max_pct - 2, _after(max_pct + 3))
+    return bucket_starts, review_bounds
+
+
 def grade_bella_q14(answer: str, q13_answer: str) -> GradeResult:
     """Grade Bella's Plan 2. Bella wobbled on warmups but aced target, so should push 5-10%."""
     new_duration = parse_duration(answer)
     old_duration = parse_duration(q13_answer)
 
     if old_duration is None or new_duration is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Please provide a target duration for this plan."
-        )
+        return _BELLA_Q14_MISSING
 
     if new_duration < old_duration:
         return GradeResult(
             is_correct=False,
-            feedback="Even though Bella wobbled on the warmups in Plan 1 she aced the target so you could push ahead with an increase for Plan 2. We base whether to push or drop on how a dog did on the target duration unless they completely fall apart in the warm-ups.",
+            feedback=BELLA_Q14["decrease"],
             calculation=f"Your Plan 1: {format_duration(old_duration)} -> Plan 2: {format_duration(new_duration)} (decrease)"
         )
 
     if new_duration == old_duration:
         return GradeResult(
             is_correct=False,
-            feedback="Since Bella aced the target duration in Plan 1, you should increase for Plan 2.",
+            feedback=BELLA_Q14["same"],
             calculation=f"Your Plan 1: {format_duration(old_duration)} -> Plan 2: {format_duration(new_duration)} (same)"
         )
 
     increase_pct = calculate_percentage_increase(old_duration, new_duration)
     min_pct, max_pct = get_guideline_range(old_duration)
+    under_over = 'under' if old_duration < 120 else 'over'
 
     calc_str = f"Your Plan 1: {format_duration(old_duration)} -> Plan 2: {format_duration(new_duration)} = {increase_pct:.1f}% increase"
 
-    # Flag for review if within 2% of boundaries
-    confidence = "high"
-    if abs(increase_pct - min_pct) <= 2:
-        confidence = "review"
-    elif abs(increase_pct - max_pct) <= 2:
-        confidence = "review"
-    elif max_pct < increase_pct <= max_pct + 3:  # Just over the guideline
-        confidence = "review"
-
-    if increase_pct < min_pct - 1:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"This increase of {increase_pct:.1f}% is below the recommended guidelines for increases to target durations {'under' if old_duration < 120 else 'over'} 2 minutes.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    elif increase_pct <= max_pct + 0.5:
-        return GradeResult(
-            is_correct=True,
-            feedback=f"Nice progression of duration to Plan 2! Even though Bella wobbled on the warmups in Plan 1 she aced the target so good call to increase the target for Plan 2.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    elif increase_pct <= max_pct + 3:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"The increase from Plan 1 to Plan 2 at {increase_pct:.1f}% is a tad higher than the guideline of {int(min_pct)}-{int(max_pct)}% for durations {'under' if old_duration < 120 else 'over'} 2 min. When just starting out with a dog we'd be more likely to stay within those guidelines.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    else:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"This is a bit too high of an increase from Plan 1 at {increase_pct:.1f}%.",
-            calculation=calc_str,
-            confidence=confidence
-        )
+    # Flag for review near the boundaries or just over the guideline
+    bucket_starts, review_bounds = _bella_pct_bounds(min_pct, max_pct)
+    confidence = "review" if bisect_right(review_bounds, increase_pct) & 1 else "high"
+    return _grade_pct_band(increase_pct, bucket_starts, _Q14_OUTCOMES, calc_str, confidence,
+                           under_over=under_over, min_pct=int(min_pct), max_pct=int(max_pct))
 
 
 def grade_bella_q14b(answer: str, q13b_answer: str) -> GradeResult:
     """Grade Bella's warmups for Plan 2. Should reduce from Plan 1 since she wobbled."""
-    # Extract numbers
-    answer_lower = answer.lower().strip()
+    return _grade_bella_q14b(_parse_warmups(answer), _parse_warmups(q13b_answer or ""))
 
-    if 'none' in answer_lower or answer_lower == '0':
-        new_warmups = 0
-    else:
-        numbers = re.findall(r'\d+', answer)
-        new_warmups = int(numbers[0]) if numbers else None
 
-    q13b_lower = q13b_answer.lower().strip() if q13b_answer else ""
-    if 'none' in q13b_lower or q13b_lower == '0':
-        old_warmups = 0
-    else:
-        old_numbers = re.findall(r'\d+', q13b_answer) if q13b_answer else []
-        old_warmups = int(old_numbers[0]) if old_numbers else 7  # Default assumption
+def _grade_bella_q14b(new_warmups: Optional[int], old_warmups: Optional[int]) -> GradeResult:
+    """grade_bella_q14b for already parsed Plan 2 and Plan 1 warmup counts."""
+    if old_warmups is None:
+        old_warmups = 7  # Default assumption
 
     if new_warmups is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Please provide a number of warmup steps."
-        )
+        return _BELLA_Q14B_MISSING
 
     if new_warmups == 0:
-        return GradeResult(
-            is_correct=True,
-            feedback="Great job removing the warmups since she struggled. It would also have been fine to test out reducing the number, keeping a few warm up steps."
-        )
+        return _BELLA_Q14B_REMOVED
     elif new_warmups < old_warmups:
         if old_warmups - new_warmups >= 2:
-            return GradeResult(
-                is_correct=True,
-                feedback="Nice job testing out fewer warmups with Bella and keeping them reduced since it helped!"
-            )
+            return _BELLA_Q14B_REDUCED
         else:
-            return GradeResult(
-                is_correct=True,
-                feedback="Great call to reduce warmup steps. It would be best to reduce by a couple steps versus 1, especially since Bella wobbled on a couple."
-            )
+            return _BELLA_Q14B_REDUCED_BY_ONE
     else:
-        return GradeResult(
-            is_correct=False,
-            feedback="When a dog seems to get more agitated as the warmups go on what can we test out doing with the warmup steps?"
-        )
+        return _BELLA_Q14B_NOT_REDUCED
 
 
 def grade_bella_q15(answer: str, q14_answer: str) -> GradeResult:
@@ -1148,205 +1722,196 @@ def grade_bella_q15(answer: str, q14_answer: str) -> GradeResult:
     old_duration = parse_duration(q14_answer)
 
     if old_duration is None or new_duration is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Please provide a target duration for this plan."
-        )
+        return _BELLA_Q15_MISSING
 
     if new_duration <= old_duration:
         return GradeResult(
             is_correct=False,
-            feedback="Bella aced Plan 2, so you should increase the target duration for Plan 3.",
+            feedback=BELLA_Q15["no_increase"],
             calculation=f"Your Plan 2: {format_duration(old_duration)} -> Plan 3: {format_duration(new_duration)}"
         )
 
     increase_pct = calculate_percentage_increase(old_duration, new_duration)
     min_pct, max_pct = get_guideline_range(old_duration)
+    under_over = 'under' if old_duration < 120 else 'over'
 
     calc_str = f"Your Plan 2: {format_duration(old_duration)} -> Plan 3: {format_duration(new_duration)} = {increase_pct:.1f}% increase"
 
-    # Flag for review if within 2% of boundaries
-    confidence = "high"
-    if abs(increase_pct - min_pct) <= 2:
-        confidence = "review"
-    elif abs(increase_pct - max_pct) <= 2:
-        confidence = "review"
-    elif max_pct < increase_pct <= max_pct + 3:  # Just over the guideline
-        confidence = "review"
-
-    if increase_pct < min_pct - 1:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"This increase of {increase_pct:.1f}% is below the recommended guidelines for increases to target durations {'under' if old_duration < 120 else 'over'} 2 minutes.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    elif increase_pct <= max_pct + 0.5:
-        return GradeResult(
-            is_correct=True,
-            feedback=f"This is a {increase_pct:.1f}% increase from Bella's Plan 2, which is within the guidelines for durations {'under' if old_duration < 120 else 'over'} 2 min.",
-            calculation=calc_str,
-            confidence=confidence
-        )
-    else:
-        return GradeResult(
-            is_correct=False,
-            feedback=f"This is a bit too high of an increase from what you set Bella's Plan 2 target duration at {increase_pct:.1f}%.",
-            calculation=calc_str,
-            confidence=confidence
-        )
+    # Flag for review near the boundaries or just over the guideline
+    bucket_starts, review_bounds = _bella_pct_bounds(min_pct, max_pct)
+    confidence = "review" if bisect_right(review_bounds, increase_pct) & 1 else "high"
+    return _grade_pct_band(increase_pct, bucket_starts, _Q15_OUTCOMES, calc_str, confidence, under_over=under_over)
 
 
 def grade_bella_q15b(answer: str, q14b_answer: str) -> GradeResult:
     """Grade Bella's warmups for Plan 3. Should keep reduced or same as Plan 2."""
-    answer_lower = answer.lower().strip()
+    return _grade_bella_q15b(_parse_warmups(answer), _parse_warmups(q14b_answer or ""))
 
-    if 'none' in answer_lower or answer_lower == '0':
-        new_warmups = 0
-    else:
-        numbers = re.findall(r'\d+', answer)
-        new_warmups = int(numbers[0]) if numbers else None
 
-    q14b_lower = q14b_answer.lower().strip() if q14b_answer else ""
-    if 'none' in q14b_lower or q14b_lower == '0':
+def _grade_bella_q15b(new_warmups: Optional[int], old_warmups: Optional[int]) -> GradeResult:
+    """grade_bella_q15b for already parsed Plan 3 and Plan 2 warmup counts."""
+    if old_warmups is None:
         old_warmups = 0
-    else:
-        old_numbers = re.findall(r'\d+', q14b_answer) if q14b_answer else []
-        old_warmups = int(old_numbers[0]) if old_numbers else 0
 
     if new_warmups is None:
-        return GradeResult(
-            is_correct=False,
-            feedback="Please provide a number of warmup steps."
-        )
+        return _BELLA_Q15B_MISSING
 
     if new_warmups <= old_warmups:
-        return GradeResult(
-            is_correct=True,
-            feedback="Good job keeping the warmup steps consistent with Plan 2. This stability in the warmup routine can be beneficial for Bella's progress."
-        )
+        return _BELLA_Q15B_KEPT_SAME
     else:
-        return GradeResult(
-            is_correct=False,
-            feedback="Nice job testing out fewer warmups with Bella in Plan 2. Since this helped we would not want to add them back in on later plans."
-        )
+        return _BELLA_Q15B_ADDED_BACK
 
 
-def grade_bella_q16(answer: str) -> GradeResult:
-    """Grade Bella car protocol question. Should use Car is a Bore, not starting with engine on."""
-    answer_lower = answer.lower().strip()
+def grade_bella_warmups(answers: dict) -> dict:
+    """
+    Grade all of Bella's warmup questions (q13b-q15b), parsing each warmup answer only once.
 
-    # Check for CIAB/Car is a Bore mention
-    has_ciab = 'car is a bore' in answer_lower or 'ciab' in answer_lower or 'bore' in answer_lower
+    Returns the same results as the individual grade_bella_q*b functions.
+    """
+    q13b, q14b, q15b = (_parse_warmups(answers.get(q_id, '')) for q_id in ('q13b', 'q14b', 'q15b'))
+    return {
+        'q13b': _grade_bella_q13b(q13b, parse_duration(answers.get('q13', ''))),
+        'q14b': _grade_bella_q14b(q14b, q13b),
+        'q15b': _grade_bella_q15b(q15b, q14b),
+    }
 
-    # Check for intensity reduction
-    has_intensity = 'further' in answer_lower or 'distance' in answer_lower or 'away' in answer_lower or 'intensity' in answer_lower
 
-    # Check if they mention starting the engine (bad)
-    mentions_starting_engine = ('start' in answer_lower and ('engine' in answer_lower or 'car' in answer_lower)) or 'turn' in answer_lower and 'on' in answer_lower
+# Bella Q16 answer keywords (substring matches, like the 'in' checks they replace);
+# 'bore' also covers "car is a bore"
+_CIAB_RE: Final[re.Pattern] = re.compile(r'bore|ciab')
+_INTENSITY_RE: Final[re.Pattern] = re.compile(r'further|distance|away|intensity')
+_CIAB_STEPS_RE: Final[re.Pattern] = re.compile(r'open|door|sit|get in')
 
-    # Check for step references
-    has_step = 'step' in answer_lower
 
-    if has_ciab and has_step:
+def grade_bella_q16(answer: str) -> GradeResult:
+    """Grade Bella car protocol question. Should use Car is a Bore, not starting with engine on."""
+    answer_lower = answer.lower()  # substring checks only, so surrounding whitespace never matters
+
+    # Check for CIAB/Car is a Bore mention
+    has_ciab = _CIAB_RE.search(answer_lower) is not None
+
+    if has_ciab:
         # Check if they're starting on a step before engine
-        step_numbers = re.findall(r'step\s*(\d+)', answer_lower)
-        if step_numbers:
-            step_num = int(step_numbers[0])
-            if step_num <= 7:  # Step 7 or before is acceptable (before turning engine on)
-                return GradeResult(
-                    is_correct=True,
-                    feedback="Nice! Since we already know that turning the car on causes anxiety, we can go right to Car is A Bore. Excellent thinking breaking down the process. It's good to start a couple of steps back from where the dog first started showing signs of anxiety. You might try starting with something like step 5 in the driveway."
-                )
+        step_match = _STEP_RE.search(answer_lower)
+        if step_match:
+            if int(step_match.group(1)) <= 7:  # Step 7 or before is acceptable (before turning engine on)
+                return _BELLA_Q16_EARLY_STEP
             else:
-                return GradeResult(
-                    is_correct=False,
-                    feedback="Good thinking to work on Car is a Bore. Since we already know that turning the car on caused anxiety for Bella we would not want to start on a step that has turning the engine on in it. We always want to start on a step that the dog will be completely comfortable with."
-                )
+                return _BELLA_Q16_LATE_STEP
 
-    if has_intensity and (has_ciab or 'car' in answer_lower):
-        return GradeResult(
-            is_correct=True,
-            feedback="Nice thinking about parking the car further away to dial down the intensity when it's possible for the owner. If parking further away solves the issue and that is something they want to continue, excellent. It could even be a management tool while working on car is a bore. If the owner will need to have the car closer to home at some point it could work to gradually move the car closer, however, it may be easier to work on Car is a Bore with the car in the driveway/garage if that's the end goal. You might try starting with something like step 5 in the driveway."
-        )
+    mentions_car = 'car' in answer_lower
+
+    # Check for intensity reduction
+    if (has_ciab or mentions_car) and _INTENSITY_RE.search(answer_lower):
+        return _BELLA_Q16_LOWER_INTENSITY
 
     if has_ciab:
-        return GradeResult(
-            is_correct=True,
-            feedback="Good thinking to work on Car is a Bore. You might try starting with something like step 5 in the Car is a Bore plan."
-        )
+        return _BELLA_Q16_CIAB
 
     # Check if they describe CIAB-like steps without using the term
-    if ('open' in answer_lower or 'door' in answer_lower or 'sit' in answer_lower or 'get in' in answer_lower) and 'car' in answer_lower:
+    if mentions_car and _CIAB_STEPS_RE.search(answer_lower):
+        # Starting the car's engine (bad) rules this out
+        mentions_starting_engine = 'start' in answer_lower or ('turn' in answer_lower and 'on' in answer_lower)
         if not mentions_starting_engine:
-            return GradeResult(
-                is_correct=True,
-                feedback="Good thinking to work on Car is a Bore. Since we already know that turning the car on caused anxiety for Bella we would not want to start on a step that has turning the engine on in it. We always want to start on a step that the dog will be completely comfortable with."
-            )
+            return _BELLA_Q16_CIAB_STEPS
 
     if 'assessment' in answer_lower:
-        return GradeResult(
-            is_correct=False,
-            feedback="Since we already know that turning the car on caused anxiety for Bella we would not need to do an assessment. We can go right to the Car is a Bore plan."
-        )
+        return _BELLA_Q16_ASSESSMENT
 
-    return GradeResult(
-        is_correct=False,
-        feedback="Since turning the car on caused anxiety for Bella what can we do to help desensitize her to the car?"
-    )
+    return _BELLA_Q16_OTHER
 
 
 def grade_diab_q17(answer: str) -> GradeResult:
     """Grade DIAB warmups question. Should do 1-4 reps of previous steps."""
     answer_lower = answer.lower().strip()
 
-    # Extract numbers
-    numbers = re.findall(r'\d+', answer)
+    # Extract the first number
+    reps = _first_int(answer)
 
-    if not numbers:
+    if reps is None:
         if 'one' in answer_lower or 'a rep' in answer_lower or 'couple' in answer_lower:
-            return GradeResult(
-                is_correct=True,
-                feedback="Excellent! We would only need to do a couple repetitions to warmup the dog."
-            )
-        return GradeResult(
-            is_correct=False,
-            feedback="Please specify how many repetitions."
-        )
-
-    reps = int(numbers[0])
+            return _DIAB_Q17_COUPLE_WORDS
+        return _DIAB_Q17_MISSING
 
     if reps == 0:
-        return GradeResult(
-            is_correct=False,
-            feedback="You might get away with not doing any warmups for DIAB, especially once the dog becomes a pro at the game. However, when starting it would be good to do 2-3 reps of the previous step or 2 to warm the dog up."
-        )
+        return _DIAB_Q17_NONE
     elif reps <= 3:
-        return GradeResult(
-            is_correct=True,
-            feedback="Excellent! We would only need to do a couple repetitions to warmup the dog."
-        )
+        return _DIAB_Q17_COUPLE
     elif reps <= 4:
-        return GradeResult(
-            is_correct=True,
-            feedback="You are right that you would not need them to repeat the entire previous step or steps. We'd only need to do a couple of reps to warm up the dog, even 2-3 reps of the previous step or 2 might be enough."
-        )
+        return _DIAB_Q17_FOUR
     elif reps <= 10:
-        return GradeResult(
-            is_correct=False,
-            feedback="We'd only need to do a couple of reps to warm up the dog. 2-3 reps of the previous step or 2 is usually good for most dogs."
-        )
+        return _DIAB_Q17_TOO_MANY
     else:
-        return GradeResult(
-            is_correct=False,
-            feedback="When doing DIAB we do not need to repeat all 10 reps of the previous steps. That would be too many reps just to complete Step 3. We only need to warm the dog up a little."
-        )
+        return _DIAB_Q17_ALL_REPS
 
 
 # =============================================================================
 # MAIN GRADING FUNCTION
 # =============================================================================
 
+# Duration questions that need LLM normalization: Q1-3, Q5-7, Q9-11, Q13-15
+DURATION_QUESTIONS = ('q1', 'q2', 'q3', 'q5', 'q6', 'q7', 'q9', 'q10', 'q11', 'q13', 'q14', 'q15')
+
+# Grader for each question in form order, with the answers it takes as arguments
+GRADERS = {
+    # Maisie
+    'q1': (grade_maisie_q1, ('q1',)),
+    'q2': (grade_maisie_q2, ('q2', 'q1')),
+    'q3': (grade_maisie_q3, ('q3', 'q2')),
+    'q4': (grade_maisie_q4, ('q4',)),
+    # Minna
+    'q5': (grade_minna_q5, ('q5',)),
+    'q6': (grade_minna_q6, ('q6', 'q5')),
+    'q7': (grade_minna_q7, ('q7', 'q6')),
+    'q8': (grade_minna_q8, ('q8',)),
+    # Oliver
+    'q9': (grade_oliver_q9, ('q9',)),
+    'q10': (grade_oliver_q10, ('q10', 'q9')),
+    'q11': (grade_oliver_q11, ('q11', 'q9', 'q10')),
+    'q12': (grade_oliver_q12, ('q12',)),
+    # Bella
+    'q13': (grade_bella_q13, ('q13',)),
+    'q13b': (grade_bella_q13b, ('q13b', 'q13')),
+    'q14': (grade_bella_q14, ('q14', 'q13')),
+    'q14b': (grade_bella_q14b, ('q14b', 'q13b')),
+    'q15': (grade_bella_q15, ('q15', 'q14')),
+    'q15b': (grade_bella_q15b, ('q15b', 'q14b')),
+    'q16': (grade_bella_q16, ('q16',)),
+    # DIAB
+    'q17': (grade_diab_q17, ('q17',)),
+}
+
+
+def grade_question(q_id: str, answers: dict) -> GradeResult:
+    """
+    Grade a single question.
+
+    Args:
+        q_id: Question ID, e.g. 'q1' or 'q13b'
+        answers: Dictionary of (normalized) answers; earlier answers the grader
+                 depends on are looked up here too
+
+    Returns:
+        GradeResult for the question
+    """
+    grader, inputs = GRADERS[q_id]
+    return grader(*(answers.get(input_id, '') for input_id in inputs))
+
+
+def normalize_answers(answers: dict, api_key: str) -> dict:
+    """
+    Return a copy of answers with the duration answers normalized by the LLM.
+
+    All answers that need the LLM are packed into a single request.
+    """
+    normalized_answers = answers.copy()
+    to_normalize = [q_id for q_id in DURATION_QUESTIONS if answers.get(q_id, '')]
+    if to_normalize:
+        normalized = normalize_batch_in_one_prompt([answers[q_id] for q_id in to_normalize], api_key)
+        normalized_answers.update(zip(to_normalize, normalized))
+    return normalized_answers
+
+
 def grade_submission(answers: dict, api_key: str = None) -> dict:
     """
     Grade a complete submission.
@@ -1358,50 +1923,106 @@ def grade_submission(answers: dict, api_key: str = None) -> dict:
     Returns:
         Dictionary with grading results for each question
     """
-    results = {}
+    # Normalize duration answers using LLM if API key is provided
+    normalized_answers = normalize_answers(answers, api_key) if api_key else answers
+
+    # Maisie's plans and Bella's warmups are graded together so each answer is parsed once
+    graded = grade_maisie(normalized_answers)
+    graded.update(grade_bella_warmups(normalized_answers))
+    return {
+        q_id: graded[q_id] if q_id in graded else grade_question(q_id, normalized_answers)
+        for q_id in GRADERS
+    }
 
-    # Duration questions that need LLM normalization: Q1-3, Q5-7, Q9-11, Q13-15
-    duration_questions = ['q1', 'q2', 'q3', 'q5', 'q6', 'q7', 'q9', 'q10', 'q11', 'q13', 'q14', 'q15']
 
-    # Normalize duration answers using LLM if API key is provided
-    normalized_answers = answers.copy()
-    if api_key:
-        for q_id in duration_questions:
-            raw_answer = answers.get(q_id, '')
-            if raw_answer:
-                normalized_answers[q_id] = normalize_duration_with_llm(raw_answer, api_key)
+def grade_submissions_batch(submissions: list, api_key: str = None) -> list:
+    """
+    Grade several submissions question by question.
 
-    # Maisie
-    results['q1'] = grade_maisie_q1(normalized_answers.get('q1', ''))
-    results['q2'] = grade_maisie_q2(normalized_answers.get('q2', ''), normalized_answers.get('q1', ''))
-    results['q3'] = grade_maisie_q3(normalized_answers.get('q3', ''), normalized_answers.get('q2', ''))
-    results['q4'] = grade_maisie_q4(answers.get('q4', ''))
+    Returns the same results as calling grade_submission on each submission,
+    but grades each question for every submission in one pass: Maisie's
+    Plan 1 and Oliver's Plan 2 use their NumPy batch graders, and with an
+    API key the duration answers of all submissions share one packed LLM request.
 
-    # Minna
-    results['q5'] = grade_minna_q5(normalized_answers.get('q5', ''))
-    results['q6'] = grade_minna_q6(normalized_answers.get('q6', ''), normalized_answers.get('q5', ''))
-    results['q7'] = grade_minna_q7(normalized_answers.get('q7', ''), normalized_answers.get('q6', ''))
-    results['q8'] = grade_minna_q8(answers.get('q8', ''))
+    Args:
+        submissions: List of answers dictionaries, as taken by grade_submission
+        api_key: Optional Anthropic API key for LLM-based duration normalization
 
-    # Oliver
-    results['q9'] = grade_oliver_q9(normalized_answers.get('q9', ''))
-    results['q10'] = grade_oliver_q10(normalized_answers.get('q10', ''), normalized_answers.get('q9', ''))
-    results['q11'] = grade_oliver_q11(normalized_answers.get('q11', ''), normalized_answers.get('q9', ''), normalized_answers.get('q10', ''))
-    results['q12'] = grade_oliver_q12(answers.get('q12', ''))
+    Returns:
+        List of grade_submission results, in the same order as submissions
+    """
+    if api_key:
+        submissions = [answers.copy() for answers in submissions]
+        to_normalize = [(answers, q_id) for answers in submissions
+                        for q_id in DURATION_QUESTIONS if answers.get(q_id, '')]
+        if to_normalize:
+            normalized = normalize_batch_in_one_prompt([answers[q_id] for answers, q_id in to_normalize], api_key)
+            for (answers, q_id), value in zip(to_normalize, normalized):
+                answers[q_id] = value
+
+    def column(q_id: str) -> list:
+        return [answers.get(q_id, '') for answers in submissions]
+
+    graded = {
+        'q1': grade_maisie_q1_batch(column('q1')),
+        'q10': grade_oliver_q10_batch(column('q10'), column('q9')),
+    }
+    for q_id in GRADERS:
+        if q_id not in graded:
+            graded[q_id] = [grade_question(q_id, answers) for answers in submissions]
+    return [{q_id: graded[q_id][i] for q_id in GRADERS} for i in range(len(submissions))]
 
-    # Bella
-    results['q13'] = grade_bella_q13(normalized_answers.get('q13', ''))
-    results['q13b'] = grade_bella_q13b(answers.get('q13b', ''), normalized_answers.get('q13', ''))
-    results['q14'] = grade_bella_q14(normalized_answers.get('q14', ''), normalized_answers.get('q13', ''))
-    results['q14b'] = grade_bella_q14b(answers.get('q14b', ''), answers.get('q13b', ''))
-    results['q15'] = grade_bella_q15(normalized_answers.get('q15', ''), normalized_answers.get('q14', ''))
-    results['q15b'] = grade_bella_q15b(answers.get('q15b', ''), answers.get('q14b', ''))
-    results['q16'] = grade_bella_q16(answers.get('q16', ''))
 
-    # DIAB
-    results['q17'] = grade_diab_q17(answers.get('q17', ''))
+def grade_cohort(answers_by_student: dict, api_key: str = None, concurrency: int = 8,
+                 processes: bool = False) -> dict:
+    """
+    Grade many submissions in parallel.
 
-    return results
+    Args:
+        answers_by_student: Dictionary mapping each student to their answers dictionary
+        api_key: Optional Anthropic API key for LLM-based duration normalization
+        concurrency: Number of submissions graded at once
+        processes: Grade in worker processes instead of threads. Only worth it
+                   for large cohorts without an API key, where grading is pure CPU
+
+    Returns:
+        Dictionary mapping each student to their grade_submission results
+    """
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor_class(max_workers=concurrency) as pool:
+        futures = {
+            student: pool.submit(grade_submission, answers, api_key)
+            for student, answers in answers_by_student.items()
+        }
+        return {student: future.result() for student, future in futures.items()}
+
+
+# Short names for the questions in the resubmit list
+_QUESTION_LABELS: Final[dict] = {
+    'q1': "Maisie's Plan 1 Target Duration",
+    'q2': "Maisie's Plan 2 Target Duration",
+    'q3': "Maisie's Plan 3 Target Duration",
+    'q4': "Maisie After Struggle",
+    'q5': "Minna's Plan 1 Target Duration",
+    'q6': "Minna's Plan 2 Target Duration",
+    'q7': "Minna's Plan 3 Target Duration",
+    'q8': "Minna Target Duration Increase",
+    'q9': "Oliver's Plan 1 Target Duration",
+    'q10': "Oliver's Plan 2 Target Duration",
+    'q11': "Oliver's Plan 3 Target Duration",
+    'q12': "Oliver Keys Testing",
+    'q13': "Bella's Plan 1 Target Duration",
+    'q13b': "Bella's Plan 1 Warmups",
+    'q14': "Bella's Plan 2 Target Duration",
+    'q14b': "Bella's Plan 2 Warmups",
+    'q15': "Bella's Plan 3 Target Duration",
+    'q15b': "Bella's Plan 3 Warmups",
+    'q16': "Bella Car Protocol",
+    'q17': "DIAB Warmups",
+}
+
+# Questions where even one or two errors mean a resubmit
+_CRITICAL_QUESTIONS: Final[frozenset] = frozenset({'q1', 'q4', 'q5', 'q9', 'q13'})
 
 
 def determine_overall_grade(results: dict) -> Tuple[str, list]:
@@ -1413,32 +2034,9 @@ def determine_overall_grade(results: dict) -> Tuple[str, list]:
     """
     incorrect_questions = []
 
-    question_labels = {
-        'q1': "Maisie's Plan 1 Target Duration",
-        'q2': "Maisie's Plan 2 Target Duration",
-        'q3': "Maisie's Plan 3 Target Duration",
-        'q4': "Maisie After Struggle",
-        'q5': "Minna's Plan 1 Target Duration",
-        'q6': "Minna's Plan 2 Target Duration",
-        'q7': "Minna's Plan 3 Target Duration",
-        'q8': "Minna Target Duration Increase",
-        'q9': "Oliver's Plan 1 Target Duration",
-        'q10': "Oliver's Plan 2 Target Duration",
-        'q11': "Oliver's Plan 3 Target Duration",
-        'q12': "Oliver Keys Testing",
-        'q13': "Bella's Plan 1 Target Duration",
-        'q13b': "Bella's Plan 1 Warmups",
-        'q14': "Bella's Plan 2 Target Duration",
-        'q14b': "Bella's Plan 2 Warmups",
-        'q15': "Bella's Plan 3 Target Duration",
-        'q15b': "Bella's Plan 3 Warmups",
-        'q16': "Bella Car Protocol",
-        'q17': "DIAB Warmups"
-    }
-
     for q_id, result in results.items():
         if not result.is_correct:
-            incorrect_questions.append((q_id, question_labels.get(q_id, q_id)))
+            incorrect_questions.append((q_id, _QUESTION_LABELS.get(q_id, q_id)))
 
     # Determine if resubmit needed
     # Resubmit if: multiple pushy errors, confusion about DIAB, or pattern of issues
@@ -1447,8 +2045,7 @@ def determine_overall_grade(results: dict) -> Tuple[str, list]:
     elif len(incorrect_questions) <= 2:
         # Could be cleared with feedback, or resubmit for key errors
         # Check if errors are on critical questions
-        critical_errors = [q for q, _ in incorrect_questions if q in ['q1', 'q5', 'q9', 'q13', 'q4']]
-        if critical_errors:
+        if not _CRITICAL_QUESTIONS.isdisjoint(q_id for q_id, _ in incorrect_questions):
             return "Resubmit", incorrect_questions
         else:
             return "Cleared", incorrect_questions
@@ -0,0 +1,27 @@
+"""
+Sheet Reader Module
+Parses the Google Sheets CSV export into a DataFrame of answers exactly as typed.
+"""
+
+import pandas as pd
+
+# pyarrow-backed strings take far less memory than Python objects (optional dependency)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Every column is read as text: letting the parser guess types turns an all-MM:SS
+# column like "10:30" into a time ("10:30:00") and "30" into 30.0
+_STRING_DTYPE = "string[pyarrow]" if PYARROW_AVAILABLE else "string"
+
+
+def read_sheet_csv(source) -> pd.DataFrame:
+    """
+    Parse a sheet's CSV export with every cell kept as the text students typed.
+
+    Only empty cells count as missing, so answers like "None" or "NA" are not
+    swallowed by pandas' default NA markers.
+    """
+    return pd.read_csv(source, dtype=_STRING_DTYPE, keep_default_na=False, na_values=[""])
@@ -2,10 +2,20 @@
 Test the grading logic against known submissions.
 """
 
+import io
+import math
+import os
 import sys
+import tempfile
+from types import SimpleNamespace
+
+import pandas as pd
+
 sys.path.insert(0, '.')
 
-from grading_logic import grade_submission, determine_overall_grade, parse_duration
+from grading_logic import grade_submission, grade_submissions_batch, determine_overall_grade, parse_duration
+from sheet_reader import read_sheet_csv
+import grading_logic
 
 # Test Lara Sullivan's submission
 lara_answers = {
@@ -55,42 +65,7 @@ lara_expected = {
     'q17': True,  # CORRECT
 }
 
-print("=" * 60)
-print("Testing Lara Sullivan's Submission")
-print("=" * 60)
-
-results = grade_submission(lara_answers)
-
-matches = 0
-mismatches = 0
-
-for q_id, expected in lara_expected.items():
-    actual = results[q_id].is_correct
-    status = "✓" if actual == expected else "✗"
-    if actual == expected:
-        matches += 1
-    else:
-        mismatches += 1
-
-    print(f"{q_id}: Expected {expected}, Got {actual} {status}")
-    if actual != expected:
-        print(f"   Feedback: {results[q_id].feedback[:80]}...")
-        if results[q_id].calculation:
-            print(f"   Calc: {results[q_id].calculation}")
-
-print()
-print(f"Matches: {matches}/{len(lara_expected)}")
-print(f"Mismatches: {mismatches}/{len(lara_expected)}")
-
-overall_grade, resubmit = determine_overall_grade(results)
-print(f"\nOverall Grade: {overall_grade}")
-print(f"Questions to resubmit: {[q for q, _ in resubmit]}")
-
 # Test Monica Falcon's submission
-print("\n" + "=" * 60)
-print("Testing Monica Falcon's Submission")
-print("=" * 60)
-
 monica_answers = {
     'q1': '10 seconds',
     'q2': '15 seconds',
@@ -138,30 +113,48 @@ monica_expected = {
     'q17': False, # INCORRECT - too many reps
 }
 
-results = grade_submission(monica_answers)
+# Expected results are frozen into (q_id, is_correct) tuples once at load
+SUBMISSIONS = (
+    ("Lara Sullivan", lara_answers, tuple(lara_expected.items())),
+    ("Monica Falcon", monica_answers, tuple(monica_expected.items())),
+)
+
 
-matches = 0
-mismatches = 0
+def compare(name, results, expected):
+    """Print the per-question comparison and overall grade for one graded submission."""
+    print("=" * 60)
+    print(f"Testing {name}'s Submission")
+    print("=" * 60)
 
-for q_id, expected in monica_expected.items():
-    actual = results[q_id].is_correct
-    status = "✓" if actual == expected else "✗"
-    if actual == expected:
-        matches += 1
-    else:
-        mismatches += 1
+    pairs = [(q_id, results[q_id], exp) for q_id, exp in expected]
+    matches = sum(1 for _, r, exp in pairs if r.is_correct == exp)
 
-    print(f"{q_id}: Expected {expected}, Got {actual} {status}")
-    if actual != expected:
-        print(f"   Feedback: {results[q_id].feedback[:80]}...")
+    for q_id, r, exp in pairs:
+        actual = r.is_correct
+        print(f"{q_id}: Expected {exp}, Got {actual} {'✓' if actual == exp else '✗'}")
+        if actual != exp:
+            print(f"   Feedback: {r.feedback[:80]}...")
+            if r.calculation:
+                print(f"   Calc: {r.calculation}")
 
-print()
-print(f"Matches: {matches}/{len(monica_expected)}")
-print(f"Mismatches: {mismatches}/{len(monica_expected)}")
+    print()
+    print(f"Matches: {matches}/{len(expected)}")
+    print(f"Mismatches: {len(expected) - matches}/{len(expected)}")
 
-overall_grade, resubmit = determine_overall_grade(results)
-print(f"\nOverall Grade: {overall_grade}")
-print(f"Questions to resubmit: {[q for q, _ in resubmit]}")
+    overall_grade, resubmit = determine_overall_grade(results)
+    print(f"\nOverall Grade: {overall_grade}")
+    print(f"Questions to resubmit: {[q for q, _ in resubmit]}")
+
+
+# Grade every submission in one batch, then report each against its expected results
+all_results = grade_submissions_batch([answers for _, answers, _ in SUBMISSIONS])
+for i, ((name, answers, expected), results) in enumerate(zip(SUBMISSIONS, all_results)):
+    if i:
+        print()
+    compare(name, results, expected)
+    # app.py grades one student at a time, so the batch must match grade_submission
+    same = grade_submission(answers) == results
+    print(f"grade_submission matches grade_submissions_batch: {same} {'✓' if same else '✗'}")
 
 # Test duration parsing
 print("\n" + "=" * 60)
@@ -184,3 +177,291 @@ for input_str, expected in test_cases:
     result = parse_duration(input_str)
     status = "✓" if result == expected else "✗"
     print(f"'{input_str}' -> {result} (expected {expected}) {status}")
+
+# Test reading the sheet CSV - answers must come through exactly as typed
+print("\n" + "=" * 60)
+print("Testing Sheet CSV Reader")
+print("=" * 60)
+
+sheet_csv = (
+    "First Name,Last Name,Plan 1,Plan 2,Keys\n"
+    "Lara,Sullivan,10:30,30,None\n"
+    "Monica,,03:20,2024-01-05,\n"
+).encode()
+df = read_sheet_csv(io.BytesIO(sheet_csv))
+
+sheet_cases = [
+    ("Plan 1", ["10:30", "03:20"]),  # all-MM:SS column must not become a time
+    ("Plan 2", ["30", "2024-01-05"]),
+    ("Last Name", ["Sullivan", None]),  # blank cells are still missing
+    ("Keys", ["None", None]),
+]
+
+for column, expected in sheet_cases:
+    result = [None if pd.isna(v) else v for v in df[column]]
+    status = "✓" if result == expected else "✗"
+    print(f"{column}: {result} (expected {expected}) {status}")
+
+durations = [parse_duration(v) for v in df["Plan 1"]]
+status = "✓" if durations == [630, 200] else "✗"
+print(f"Plan 1 parsed: {durations} (expected [630, 200]) {status}")
+
+
+def check(description, result, expected):
+    status = "✓" if result == expected else "✗"
+    print(f"{description} -> {result} (expected {expected}) {status}")
+
+
+# The LLM tests below use stub clients instead of the network, and keep the
+# on-disk normalization cache in a throwaway directory
+os.environ["PBA_GRADER_CACHE_DIR"] = tempfile.mkdtemp()
+grading_logic._disk_cache.cache_clear()
+
+
+def reset_normalize_cache():
+    """Empty both normalization cache layers, so each test starts cold."""
+    grading_logic._normalize_cache.clear()
+    conn = grading_logic._disk_cache()
+    conn.execute("DELETE FROM norm_cache")
+    conn.commit()
+
+
+class StubMessages:
+    """Stands in for client.messages, answering every create() with a canned reply."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return SimpleNamespace(content=[SimpleNamespace(text=self.reply)])
+
+
+# Test parsing packed normalization replies
+print("\n" + "=" * 60)
+print("Testing Packed Normalization Replies")
+print("=" * 60)
+
+check("out of order", grading_logic._parse_packed_reply("Item 2: 357\nItem 1: 10"), {1: '10', 2: '357'})
+check("duplicate item", grading_logic._parse_packed_reply("Item 1: 10\nItem 1: 20"), {1: '10'})
+check("missing item", grading_logic._parse_packed_reply("Item 1: 10\nItem 3: DOOR"), {1: '10', 3: 'DOOR'})
+check("stray text", grading_logic._parse_packed_reply("Sure!\nItem 1: 10\nthanks"), {1: '10'})
+
+# Items the reply leaves out, or every item when the request fails, are retried one by one
+packed_answers = ["0:00:10", "5m 57 seconds", "6.22"]
+per_item_replies = {"0:00:10": "10", "5m 57 seconds": "357", "6.22": "382"}
+retried = []
+
+
+def stub_normalize_one_by_one(answers, api_key):
+    retried.extend(answers)
+    return [per_item_replies[answer] for answer in answers]
+
+
+saved = grading_logic._get_anthropic_client, grading_logic.normalize_durations_with_llm
+grading_logic.normalize_durations_with_llm = stub_normalize_one_by_one
+for label, reply, expected_retried in [
+    ("short reply", "Item 3: 382\nItem 1: 10", ["5m 57 seconds"]),
+    ("failed request", RuntimeError("network down"), packed_answers),
+]:
+    reset_normalize_cache()
+    retried.clear()
+    messages = StubMessages(reply)
+    grading_logic._get_anthropic_client = lambda api_key: SimpleNamespace(messages=messages)
+    normalized = grading_logic.normalize_batch_in_one_prompt(packed_answers, "test-key")
+    check(f"{label}: normalized", normalized, ["10", "357", "382"])
+    check(f"{label}: retried one by one", retried, expected_retried)
+grading_logic._get_anthropic_client, grading_logic.normalize_durations_with_llm = saved
+reset_normalize_cache()
+
+# Test the NumPy batch graders against the one-answer graders, on and around every band edge
+print("\n" + "=" * 60)
+print("Testing Batch Graders")
+print("=" * 60)
+
+
+def around(edges):
+    """Each edge value plus the neighbouring floats on either side."""
+    return sorted({v for edge in edges for v in (math.nextafter(edge, 0), edge, math.nextafter(edge, math.inf))})
+
+
+q1_answers = [repr(v) for v in around(grading_logic._Q1_BUCKET_STARTS + grading_logic._Q1_REVIEW_BOUNDS)]
+q1_answers += ["30 seconds", "2:45", "0", "Door", "DIAB", "", None, "not sure"]
+check("grade_maisie_q1_batch matches grade_maisie_q1 on edges",
+      grading_logic.grade_maisie_q1_batch(q1_answers) == [grading_logic.grade_maisie_q1(a) for a in q1_answers], True)
+
+q10_edges = grading_logic._Q10_BUCKET_STARTS + grading_logic._Q10_REVIEW_BOUNDS
+q10_pairs = [(repr(new), old) for old, seconds in [("100", 100), ("3:20", 200), ("37", 37)]
+             for new in around([seconds * (1 + pct / 100) for pct in q10_edges])]
+q10_pairs += [("Door", "100"), ("100", "Door"), ("90", "100"), ("100", "100"), ("100", "0"), ("", ""), (None, None)]
+q10_answers, q9_answers = [new for new, _ in q10_pairs], [old for _, old in q10_pairs]
+check("grade_oliver_q10_batch matches grade_oliver_q10 on edges",
+      grading_logic.grade_oliver_q10_batch(q10_answers, q9_answers)
+      == [grading_logic.grade_oliver_q10(new, old) for new, old in q10_pairs], True)
+
+bulk_answers = [input_str for input_str, _ in test_cases] + q1_answers + q10_answers
+bulk_answers += ["  2:45 ", "30 SECONDS", "1,20", "3mn2", "5 to 6 seconds", 42]
+check("parse_duration_bulk matches parse_duration",
+      grading_logic.parse_duration_bulk(bulk_answers) == [parse_duration(a) for a in bulk_answers], True)
+
+# Test grading a cohort in parallel
+print("\n" + "=" * 60)
+print("Testing Cohort Grading")
+print("=" * 60)
+
+cohort = {name: answers for name, answers, _ in SUBMISSIONS}
+cohort["Edge Case"] = dict(zip(lara_answers, ["Door", "", "1:00", "no", "5", "Door", "3:20", "10%",
+                                              "0", "3:40", None, "", "3:10", "12", "1:35", "0", "2:00",
+                                              "8", "", "3 reps"]))
+cohort_results = grading_logic.grade_cohort(cohort, concurrency=2)
+for student, answers in cohort.items():
+    check(f"grade_cohort matches grade_submission for {student}",
+          cohort_results[student] == grade_submission(answers), True)
+
+# Test normalizing through the Message Batches API, with a stub batches client
+print("\n" + "=" * 60)
+print("Testing Batched Normalization")
+print("=" * 60)
+
+
+class StubBatches:
+    """Stands in for client.messages.batches: ends after one poll, replying from a canned table."""
+
+    def __init__(self, replies, ends=True):
+        self.replies = replies
+        self.ends = ends
+        self.sent = []
+        self.cancelled = False
+
+    def create(self, requests):
+        self.sent = requests
+        return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status="ended" if self.ends else "in_progress")
+
+    def cancel(self, batch_id):
+        self.cancelled = True
+
+    def results(self, batch_id):
+        for request in self.sent:
+            answer = request["params"]["messages"][0]["content"].removeprefix("Input: ")
+            reply = self.replies[answer]
+            if reply is None:
+                yield SimpleNamespace(custom_id=request["custom_id"], result=SimpleNamespace(type="errored"))
+            else:
+                message = SimpleNamespace(content=[SimpleNamespace(text=reply)])
+                yield SimpleNamespace(custom_id=request["custom_id"],
+                                      result=SimpleNamespace(type="succeeded", message=message))
+
+
+batched_answers = ["0:00:10", "2:45", "6.22", "0:00:10", "1:30:00"]
+saved = grading_logic._get_anthropic_client
+for label, batches, expected, expected_sent in [
+    ("ended", StubBatches({"0:00:10": "10", "6.22": "382", "1:30:00": None}),
+     ["10", "2:45", "382", "10", "1:30:00"], 3),
+    ("timed out", StubBatches({}, ends=False), batched_answers, 3),
+]:
+    reset_normalize_cache()
+    grading_logic._get_anthropic_client = lambda api_key: SimpleNamespace(messages=SimpleNamespace(batches=batches))
+    normalized = grading_logic.normalize_durations_batched(batched_answers, "test-key", poll_interval=0, timeout=0.01)
+    check(f"{label}: normalized", normalized, expected)
+    check(f"{label}: requests sent", len(batches.sent), expected_sent)
+    check(f"{label}: cancelled", batches.cancelled, label == "timed out")
+grading_logic._get_anthropic_client = saved
+reset_normalize_cache()
+
+# Test the in-memory normalization cache
+print("\n" + "=" * 60)
+print("Testing Normalization Cache")
+print("=" * 60)
+
+
+def memory_cache_answers():
+    return [answer for answer, _ in grading_logic._normalize_cache]
+
+
+reset_normalize_cache()
+grading_logic._remember("0:00:10", "test-key", "10")
+normalized = ["0:00:10", "6.22"]
+pending, _ = grading_logic._pending_llm_answers(["0:00:10", "6.22"], "test-key", normalized)
+check("memory hit is filled in", normalized, ["10", "6.22"])
+check("memory miss is pending", pending, [1])
+pending, _ = grading_logic._pending_llm_answers(["0:00:10"], "other-key", ["0:00:10"])
+check("entries are per API key", pending, [0])
+check("failures are not cached", (grading_logic._remember("1:30:00", "test-key", None), memory_cache_answers()),
+      ("1:30:00", ["0:00:10"]))
+
+# With room for two, a hit moves an entry to the back, so the other one is evicted first
+saved_size = grading_logic.NORMALIZE_CACHE_SIZE
+grading_logic.NORMALIZE_CACHE_SIZE = 2
+grading_logic._remember("6.22", "test-key", "382")
+grading_logic._pending_llm_answers(["0:00:10"], "test-key", ["0:00:10"])
+grading_logic._remember("1:30:00", "test-key", "5400")
+check("least recently used is evicted", memory_cache_answers(), ["0:00:10", "1:30:00"])
+grading_logic.NORMALIZE_CACHE_SIZE = saved_size
+reset_normalize_cache()
+
+# Test the on-disk normalization cache
+
+
+def disk_key(answer):
+    return grading_logic._cache_key(answer, "test-key")
+
+
+reset_normalize_cache()
+grading_logic._remember("0:00:10", "test-key", "10")
+grading_logic._normalize_cache.clear()
+normalized = ["0:00:10", "6.22", "0:00:10"]
+pending, repeats = grading_logic._pending_llm_answers(list(normalized), "test-key", normalized)
+check("disk hit fills every copy", (normalized, pending, repeats), (["10", "6.22", "10"], [1], []))
+check("disk hit is promoted to memory", memory_cache_answers(), ["0:00:10"])
+
+# A new connection, as after a restart, still finds the entry
+grading_logic._disk_cache().close()
+grading_logic._disk_cache.cache_clear()
+check("disk entry persists", grading_logic._disk_lookup(disk_key("0:00:10")), "10")
+check("disk miss", grading_logic._disk_lookup(disk_key("6.22")), None)
+
+# With room for two, the oldest entry on disk is dropped
+saved_entries = grading_logic.DISK_CACHE_MAX_ENTRIES
+grading_logic.DISK_CACHE_MAX_ENTRIES = 2
+grading_logic._remember("6.22", "test-key", "382")
+grading_logic._remember("1:30:00", "test-key", "5400")
+check("oldest disk entry is evicted",
+      [grading_logic._disk_lookup(disk_key(a)) for a in ("0:00:10", "6.22", "1:30:00")], [None, "382", "5400"])
+grading_logic.DISK_CACHE_MAX_ENTRIES = saved_entries
+reset_normalize_cache()
+
+# An empty PBA_GRADER_CACHE_DIR turns the disk cache off
+cache_dir = os.environ["PBA_GRADER_CACHE_DIR"]
+os.environ["PBA_GRADER_CACHE_DIR"] = ""
+grading_logic._disk_cache.cache_clear()
+check("disk cache disabled", grading_logic._disk_cache(), None)
+os.environ["PBA_GRADER_CACHE_DIR"] = cache_dir
+grading_logic._disk_cache.cache_clear()
+
+# Test the table of spelled-out durations: each entry must parse to what the same duration in digits does
+print("\n" + "=" * 60)
+print("Testing Common Durations")
+print("=" * 60)
+
+number_words = {
+    'a': '1', 'an': '1', 'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5', 'six': '6',
+    'seven': '7', 'eight': '8', 'nine': '9', 'ten': '10', 'fifteen': '15', 'twenty': '20', 'thirty': '30',
+    'forty five': '45', 'forty-five': '45',
+}
+spelled_fractions = {
+    'half a minute': '0.5 minutes', 'a minute and a half': '1.5 minutes', 'one and a half minutes': '1.5 minutes',
+    'two and a half minutes': '2.5 minutes', 'three and a half minutes': '3.5 minutes',
+}
+wrong = []
+for phrase, seconds in grading_logic._COMMON_DURATIONS.items():
+    number, unit = phrase.rsplit(' ', 1)
+    in_digits = spelled_fractions.get(phrase) or f"{number_words[number]} {unit}"
+    if parse_duration(in_digits) is None or parse_duration(seconds) != parse_duration(in_digits):
+        wrong.append((phrase, seconds, in_digits))
+check(f"all {len(grading_logic._COMMON_DURATIONS)} common durations parse like their digit form", wrong, [])